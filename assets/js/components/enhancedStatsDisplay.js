@@ -15,9 +15,10 @@ export class EnhancedStatsDisplay {
      * @param {Object} stats - Pokemon stats
      * @param {Object} uiText - UI text object for localization
      * @param {Object} benchmarks - Optional stat benchmarks
+     * @param {Object} [analytics] - Precomputed total, percentiles and ranks (getPokemonStatAnalytics)
      * @returns {HTMLElement} Enhanced stats section
      */
-    static createStatsSection(stats, uiText, benchmarks = STAT_BENCHMARKS) {
+    static createStatsSection(stats, uiText, benchmarks = STAT_BENCHMARKS, analytics = null) {
         const section = createSafeElement('div');
         section.classList.add('detail-section', 'enhanced-stats-section');
 
@@ -29,6 +30,10 @@ export class EnhancedStatsDisplay {
         const ratingBadge = this._createOverallRating(overallRating);
         section.appendChild(ratingBadge);
 
+        if (analytics) {
+            section.appendChild(this._createRankSummary(analytics, uiText));
+        }
+
         const statsGrid = createSafeElement('div');
         statsGrid.classList.add('enhanced-stats-grid');
 
@@ -44,7 +49,8 @@ export class EnhancedStatsDisplay {
         Object.entries(statLabels).forEach(([statKey, statLabel]) => {
             if (stats[statKey] !== undefined) {
                 const comparison = compareStatToBenchmark(stats[statKey], statKey, benchmarks);
-                const statItem = this._createEnhancedStatItem(statLabel, comparison);
+                const percentile = analytics?.percentiles?.[statKey];
+                const statItem = this._createEnhancedStatItem(statLabel, comparison, percentile, uiText);
                 statsGrid.appendChild(statItem);
             }
         });
@@ -79,14 +85,59 @@ export class EnhancedStatsDisplay {
         return container;
     }
 
+    /**
+     * Creates the total percentile and type/generation rank line
+     * @private
+     * @param {Object} analytics - Precomputed total, percentiles and ranks
+     * @param {Object} uiText - UI text object for localization
+     * @returns {HTMLElement} Rank summary element
+     */
+    static _createRankSummary(analytics, uiText) {
+        const summary = createSafeElement('div');
+        summary.classList.add('stat-rank-summary');
+
+        const parts = [];
+        if (analytics.percentiles?.total !== undefined) {
+            parts.push(this._formatText(uiText.statPercentile || 'Higher than {percent}% of Pokémon',
+                { percent: analytics.percentiles.total }));
+        }
+        analytics.typeRanks.forEach(({ type, rank, count }) => {
+            parts.push(this._formatText(uiText.statTypeRank || '#{rank} of {count} {type}', { type, rank, count }));
+        });
+        if (analytics.generationRank) {
+            parts.push(this._formatText(uiText.statGenerationRank || '#{rank} of {count} in Gen {generation}',
+                analytics.generationRank));
+        }
+
+        parts.forEach(text => {
+            const item = createSafeElement('span', text);
+            item.classList.add('stat-rank-item');
+            summary.appendChild(item);
+        });
+        return summary;
+    }
+
+    /**
+     * Fills {placeholders} in a UI text template
+     * @private
+     * @param {string} template - Text with {name} placeholders
+     * @param {Object} values - Placeholder values
+     * @returns {string} Formatted text
+     */
+    static _formatText(template, values) {
+        return template.replace(/\{(\w+)\}/g, (match, key) => (values[key] !== undefined ? String(values[key]) : match));
+    }
+
     /**
      * Creates an enhanced stat item with comparison visualization
      * @private
      * @param {string} label - Stat label
      * @param {Object} comparison - Comparison data
+     * @param {number} [percentile] - Percent of Pokemon with a lower value
+     * @param {Object} [uiText] - UI text object for localization
      * @returns {HTMLElement} Enhanced stat item
      */
-    static _createEnhancedStatItem(label, comparison) {
+    static _createEnhancedStatItem(label, comparison, percentile, uiText = {}) {
         const item = createSafeElement('div');
         item.classList.add('enhanced-stat-item');
 
@@ -142,6 +193,15 @@ export class EnhancedStatsDisplay {
         item.appendChild(barContainer);
         item.appendChild(percentSpan);
 
+        if (percentile !== undefined) {
+            const percentileText = this._formatText(uiText.statPercentile || 'Higher than {percent}% of Pokémon',
+                { percent: percentile });
+            const percentileSpan = createSafeElement('span', `P${percentile}`);
+            percentileSpan.classList.add('stat-percentile');
+            percentileSpan.title = percentileText;
+            item.appendChild(percentileSpan);
+        }
+
         return item;
     }
 }
@@ -8,6 +8,7 @@ import { createSafeElement } from '../utils/security.js';
 import { getTypeClassName } from '../utils/typeMapping.js';
 import { getLocalizedPokemonSnapshot } from '../utils/pokemonPresentation.js';
 import { createImageWithFallback } from '../utils/imageUtils.js';
+import { getAtlasEntry } from '../utils/spriteAtlas.js';
 
 /**
  * Handles rendering Pokemon cards with proper security and accessibility
@@ -168,6 +169,12 @@ export class PokemonCardRenderer {
         const container = createSafeElement('div');
         container.classList.add('pokemon-image-container');
 
+        const atlas = getAtlasEntry(pokemon.id);
+        if (atlas) {
+            container.appendChild(this._createAtlasSprite(atlas, name));
+            return container;
+        }
+
         const img = createImageWithFallback(pokemon.sprite, name, {
             className: CSS_CLASSES.LOADING,
             onLoad: (loadedImg) => {
@@ -202,6 +209,24 @@ export class PokemonCardRenderer {
         return container;
     }
 
+    /**
+     * Creates a sprite tile drawn from a shared atlas sheet
+     * (generated by scripts/generate_sprite_atlas.py)
+     * @private
+     * @param {Object} atlas - Atlas entry ({sheet, x, y, size})
+     * @param {string} name - Pokemon name
+     * @returns {HTMLElement} Sprite element
+     */
+    _createAtlasSprite(atlas, name) {
+        const sprite = createSafeElement('div');
+        sprite.classList.add('pokemon-atlas-sprite');
+        sprite.setAttribute('role', 'img');
+        sprite.setAttribute('aria-label', name);
+        sprite.style.backgroundImage = `url("${encodeURI(atlas.sheet)}")`;
+        sprite.style.backgroundPosition = `-${Number(atlas.x) || 0}px -${Number(atlas.y) || 0}px`;
+        return sprite;
+    }
+
     /**
      * Creates types container with type badges
      * @private
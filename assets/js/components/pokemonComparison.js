@@ -6,6 +6,7 @@
 import { createSafeElement } from '../utils/security.js';
 import { getTypeClassName } from '../utils/typeMapping.js';
 import { calculateTypeEffectiveness } from '../utils/typeEffectiveness.js';
+import { getPokemonStatAnalytics } from '../utils/statComparison.js';
 
 const STAT_KEYS = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed'];
 
@@ -251,6 +252,13 @@ export class PokemonComparison {
         table.appendChild(headerRow);
         const columnWinCounts = new Array(pokemons.length).fill(0);
         const columnCells = new Array(pokemons.length).fill(null).map(() => []);
+        const analytics = pokemons.map((pokemon) => getPokemonStatAnalytics(pokemon, this.dataManager.getAllPokemon()));
+        const percentileTitle = (index, statKey) => {
+            const percentile = analytics[index]?.percentiles?.[statKey];
+            return percentile === undefined ? null : this._formatText(
+                uiText.statPercentile || 'Higher than {percent}% of Pokémon', { percent: percentile }
+            );
+        };
 
         STAT_KEYS.forEach((statKey) => {
             const row = createSafeElement('tr');
@@ -265,6 +273,10 @@ export class PokemonComparison {
                     cell.classList.add('comparison-winner');
                     columnWinCounts[index] += 1;
                 }
+                const title = percentileTitle(index, statKey);
+                if (title) {
+                    cell.title = title;
+                }
                 columnCells[index].push(cell);
                 row.appendChild(cell);
             });
@@ -272,6 +284,27 @@ export class PokemonComparison {
             table.appendChild(row);
         });
 
+        // Base stat total (highlighted, but not counted as a stat win)
+        const totalRow = createSafeElement('tr');
+        totalRow.classList.add('comparison-total-row');
+        totalRow.appendChild(createSafeElement('td', uiText.statTotal || 'Total'));
+        const totals = pokemons.map((pokemon, index) => analytics[index]?.total
+            ?? STAT_KEYS.reduce((sum, statKey) => sum + (pokemon.stats?.[statKey] || 0), 0));
+        const maxTotal = Math.max(...totals);
+        totals.forEach((total, index) => {
+            const cell = createSafeElement('td', String(total));
+            if (total === maxTotal && maxTotal > 0) {
+                cell.classList.add('comparison-winner');
+            }
+            const title = percentileTitle(index, 'total');
+            if (title) {
+                cell.title = title;
+            }
+            columnCells[index].push(cell);
+            totalRow.appendChild(cell);
+        });
+        table.appendChild(totalRow);
+
         const topWinCount = Math.max(...columnWinCounts);
         if (topWinCount > 0) {
             columnWinCounts.forEach((wins, index) => {
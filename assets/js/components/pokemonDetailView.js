@@ -7,6 +7,7 @@ import { ELEMENT_IDS, CSS_CLASSES, DATA, ANIMATION, EVENTS, KEYS } from '../cons
 import { createSafeElement, validatePokemonId } from '../utils/security.js';
 import { getTypeClassName } from '../utils/typeMapping.js';
 import { EnhancedStatsDisplay } from './enhancedStatsDisplay.js';
+import { getPokemonStatAnalytics, getStatBenchmarks } from '../utils/statComparison.js';
 import { createImageWithFallback } from '../utils/imageUtils.js';
 import { formatPokemonHeader, getLocalizedPokemonSnapshot } from '../utils/pokemonPresentation.js';
 
@@ -905,7 +906,13 @@ export class PokemonDetailView {
         }
 
         if (pokemon.stats) {
-            modalContent.appendChild(EnhancedStatsDisplay.createStatsSection(pokemon.stats, uiText));
+            const allPokemon = this.dataManager.getAllPokemon();
+            modalContent.appendChild(EnhancedStatsDisplay.createStatsSection(
+                pokemon.stats,
+                uiText,
+                getStatBenchmarks(allPokemon),
+                getPokemonStatAnalytics(pokemon, allPokemon)
+            ));
         }
 
         if (pokemon.height || pokemon.weight || pokemon.genus_en || pokemon.genus_jp) {
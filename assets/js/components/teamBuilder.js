@@ -5,7 +5,7 @@
 
 import { createSafeElement } from '../utils/security.js';
 import { getTypeClassName } from '../utils/typeMapping.js';
-import { TYPE_EFFECTIVENESS } from '../utils/typeEffectiveness.js';
+import { TYPE_NAMES, getEffectivenessById, getTypeId } from '../utils/typeEffectiveness.js';
 
 /**
  * Manages Pokemon team building and persistence
@@ -430,7 +430,7 @@ export class TeamBuilder {
      * @returns {Object} Coverage analysis
      */
     getCoverageAnalysis() {
-        const allTypes = Object.keys(TYPE_EFFECTIVENESS);
+        const allTypes = TYPE_NAMES;
         const offensiveCovered = new Set();
         const weaknessCounts = {};
 
@@ -441,9 +441,12 @@ export class TeamBuilder {
             }
 
             (pokemon.types_en || []).forEach((attackType) => {
-                const effectiveness = TYPE_EFFECTIVENESS[attackType.toLowerCase()] || {};
-                allTypes.forEach((defendingType) => {
-                    if ((effectiveness[defendingType] || 1) > 1) {
+                const attackId = getTypeId(attackType);
+                if (attackId < 0) {
+                    return;
+                }
+                allTypes.forEach((defendingType, defendId) => {
+                    if (getEffectivenessById(attackId, defendId) > 1) {
                         offensiveCovered.add(defendingType);
                     }
                 });
@@ -13,6 +13,8 @@ export const ANIMATION = {
 // API and data settings
 export const DATA = {
     JSON_FILE: './pokedex_data.json',
+    STAT_ANALYTICS_FILE: './assets/data/stat_analytics.json',
+    SPRITE_ATLAS_FILE: './assets/sprites/atlas/sprite_atlas.json',
     CRY_AUDIO_PATH: 'assets/pokemon/cries/latest/',
     MAX_POKEMON_ID: 10000,
     SEARCH_DEBOUNCE_MS: 250
@@ -120,6 +122,10 @@ export const UI_TEXT = {
         comparisonStats: "Stats",
         comparisonTypes: "Types",
         comparisonStatLabel: "Stat",
+        statTotal: "Total",
+        statPercentile: "Higher than {percent}% of Pokémon",
+        statTypeRank: "#{rank} of {count} {type}",
+        statGenerationRank: "#{rank} of {count} in Gen {generation}",
         comparisonFull: "Comparison is already full (3 Pokémon).",
         comparisonStrongVs: "Strong vs {name}",
         comparisonWeakVs: "Weak vs {name}",
@@ -224,6 +230,10 @@ export const UI_TEXT = {
         comparisonStats: "能力",
         comparisonTypes: "タイプ",
         comparisonStatLabel: "能力値",
+        statTotal: "合計",
+        statPercentile: "全ポケモンの{percent}%より高い",
+        statTypeRank: "{type}タイプ {count}匹中 {rank}位",
+        statGenerationRank: "第{generation}世代 {count}匹中 {rank}位",
         comparisonFull: "比較はすでに3匹でいっぱいです。",
         comparisonStrongVs: "{name} に有利",
         comparisonWeakVs: "{name} に不利",
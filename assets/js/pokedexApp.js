@@ -16,6 +16,8 @@ import { SearchController } from './controllers/searchController.js';
 import { SortController } from './controllers/sortController.js?v=1.1.4';
 import { URLRouter } from './utils/urlRouter.js';
 import { StructuredDataGenerator } from './utils/structuredData.js';
+import { loadStatAnalytics } from './utils/statComparison.js';
+import { loadSpriteAtlas } from './utils/spriteAtlas.js';
 import { KeyboardShortcutsModal } from './components/keyboardShortcutsModal.js';
 import { debounce } from './utils/debounce.js';
 import { AppState } from './utils/appState.js';
@@ -57,8 +59,13 @@ export class PokedexApp {
             // Initialize structured data for SEO
             StructuredDataGenerator.initialize();
             
-            // Load Pokemon data
+            // Load Pokemon data (and the sprite atlas map alongside it; cards fall back to single sprites)
+            const atlasLoaded = loadSpriteAtlas();
             await this.dataManager.loadPokemonData();
+            await atlasLoaded;
+
+            // Precomputed stat benchmarks/percentiles/ranks; views scan the data until it arrives
+            loadStatAnalytics();
 
             this._initializeAdvancedFeatures();
             
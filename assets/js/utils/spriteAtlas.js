@@ -0,0 +1,39 @@
+/**
+ * Sprite Atlas Utility - Looks up card sprites packed into shared sheets
+ * @module SpriteAtlas
+ */
+
+import { DATA } from '../constants.js';
+
+// Pokemon ID -> {sheet, x, y, size}, see loadSpriteAtlas()
+let atlasEntries = null;
+let atlasPromise = null;
+
+/**
+ * Loads the sprite atlas map (scripts/generate_sprite_atlas.py) once.
+ * While it is loading or if it is missing, cards use their individual sprites.
+ * @param {string} url - Map URL
+ * @returns {Promise<Object|null>} Atlas entries by Pokemon ID, or null if unavailable
+ */
+export function loadSpriteAtlas(url = DATA.SPRITE_ATLAS_FILE) {
+    if (!atlasPromise) {
+        atlasPromise = fetch(url)
+            .then(response => (response.ok ? response.json() : null))
+            .then(data => {
+                atlasEntries = data && typeof data === 'object' ? data : null;
+                return atlasEntries;
+            })
+            .catch(() => null);
+    }
+    return atlasPromise;
+}
+
+/**
+ * Gets the atlas tile for a Pokemon
+ * @param {number} pokemonId - Pokemon ID
+ * @returns {Object|null} Atlas entry ({sheet, x, y, size}), or null if not packed
+ */
+export function getAtlasEntry(pokemonId) {
+    const entry = atlasEntries ? atlasEntries[String(pokemonId)] : null;
+    return entry && entry.sheet ? entry : null;
+}
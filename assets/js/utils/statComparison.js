@@ -3,6 +3,15 @@
  * @module StatComparison
  */
 
+import { DATA } from '../constants.js';
+
+const STAT_KEYS = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed'];
+
+// Indexed stat analytics (artifact or fallback scan), see loadStatAnalytics()
+let loadedAnalytics = null;
+let analyticsPromise = null;
+const fallbackAnalytics = new WeakMap();
+
 /**
  * Pre-calculated stat averages and maximums across all 1025 Pokemon
  * These values are based on the complete Pokedex data
@@ -87,6 +96,176 @@ export function calculateStatBenchmarks(allPokemon) {
     };
 }
 
+/**
+ * Percent of values each value beats, ties sharing the midpoint
+ * (same as percentile_ranks in scripts/generate_stat_analytics.py)
+ * @private
+ * @param {Array<number>} values - One stat column
+ * @returns {Array<number>} Percentiles (0-100) aligned with values
+ */
+function percentileRanks(values) {
+    const count = values.length;
+    if (count <= 1) {
+        return values.map(() => 100);
+    }
+    const ordered = [...values].sort((a, b) => a - b);
+    const firstIndex = new Map();
+    const lastIndex = new Map();
+    ordered.forEach((value, index) => {
+        if (!firstIndex.has(value)) {
+            firstIndex.set(value, index);
+        }
+        lastIndex.set(value, index);
+    });
+    return values.map(value => {
+        const below = firstIndex.get(value);
+        const ties = lastIndex.get(value) - below;
+        return Math.round(100 * (below + ties / 2) / (count - 1));
+    });
+}
+
+/**
+ * Computes the stat analytics artifact in the browser from the full dataset.
+ * Only used when assets/data/stat_analytics.json is unavailable; generation
+ * ranks are left out.
+ * @param {Array<Object>} allPokemon - Array of all Pokemon
+ * @returns {Object} Data in the stat_analytics.json layout
+ */
+export function calculateStatAnalytics(allPokemon) {
+    const rows = (allPokemon || []).filter(pokemon => pokemon.stats).sort((a, b) => a.id - b.id);
+    const columns = {};
+    STAT_KEYS.forEach(stat => {
+        columns[stat] = rows.map(pokemon => pokemon.stats[stat] || 0);
+    });
+    const totals = rows.map((_, row) => STAT_KEYS.reduce((sum, stat) => sum + columns[stat][row], 0));
+
+    const percentiles = {};
+    STAT_KEYS.forEach(stat => {
+        percentiles[stat] = percentileRanks(columns[stat]);
+    });
+    percentiles.total = percentileRanks(totals);
+
+    const typeTotals = {};
+    const typeKeys = rows.map((pokemon, row) => (pokemon.types_en || []).map(type => {
+        const key = type.toLowerCase();
+        (typeTotals[key] = typeTotals[key] || []).push(totals[row]);
+        return key;
+    }));
+    const typeCounts = {};
+    Object.entries(typeTotals).forEach(([key, values]) => {
+        typeCounts[key] = values.length;
+    });
+
+    return {
+        stats: STAT_KEYS,
+        count: rows.length,
+        benchmarks: calculateStatBenchmarks(rows),
+        ids: rows.map(pokemon => pokemon.id),
+        total: totals,
+        percentiles,
+        type_rank: typeKeys.map((keys, row) => keys.map(
+            key => typeTotals[key].filter(total => total > totals[row]).length + 1
+        )),
+        type_counts: typeCounts
+    };
+}
+
+/**
+ * Indexes stat analytics by Pokemon ID
+ * @param {Object} data - Data in the stat_analytics.json layout
+ * @returns {Object|null} Indexed analytics, or null if the data is empty
+ */
+export function indexStatAnalytics(data) {
+    if (!data || !data.count || !Array.isArray(data.ids)) {
+        return null;
+    }
+    const rowById = new Map();
+    data.ids.forEach((id, row) => rowById.set(id, row));
+    return { data, rowById, benchmarks: data.benchmarks };
+}
+
+/**
+ * Loads the precomputed stat analytics (scripts/generate_stat_analytics.py) once.
+ * While it is loading or if it is missing, lookups fall back to scanning the dataset.
+ * @param {string} url - Artifact URL
+ * @returns {Promise<Object|null>} Indexed analytics, or null if unavailable
+ */
+export function loadStatAnalytics(url = DATA.STAT_ANALYTICS_FILE) {
+    if (!analyticsPromise) {
+        analyticsPromise = fetch(url)
+            .then(response => (response.ok ? response.json() : null))
+            .then(data => {
+                loadedAnalytics = indexStatAnalytics(data);
+                return loadedAnalytics;
+            })
+            .catch(() => null);
+    }
+    return analyticsPromise;
+}
+
+/**
+ * Returns the loaded artifact, or analytics scanned once per dataset array
+ * @private
+ * @param {Array<Object>} [allPokemon] - Dataset for the fallback scan
+ * @returns {Object|null} Indexed analytics
+ */
+function getIndexedAnalytics(allPokemon) {
+    if (loadedAnalytics) {
+        return loadedAnalytics;
+    }
+    if (!allPokemon || allPokemon.length === 0) {
+        return null;
+    }
+    if (!fallbackAnalytics.has(allPokemon)) {
+        fallbackAnalytics.set(allPokemon, indexStatAnalytics(calculateStatAnalytics(allPokemon)));
+    }
+    return fallbackAnalytics.get(allPokemon);
+}
+
+/**
+ * Gets stat benchmarks without a runtime scan when the artifact is loaded
+ * @param {Array<Object>} [allPokemon] - Dataset for the fallback scan
+ * @returns {Object} Stat benchmarks
+ */
+export function getStatBenchmarks(allPokemon) {
+    const analytics = getIndexedAnalytics(allPokemon);
+    return analytics?.benchmarks || STAT_BENCHMARKS;
+}
+
+/**
+ * Gets a Pokemon's stat total, percentiles and type/generation ranks
+ * @param {Object} pokemon - Pokemon data object
+ * @param {Array<Object>} [allPokemon] - Dataset for the fallback scan
+ * @returns {Object|null} { total, percentiles, typeRanks, generationRank }, or null if unknown
+ */
+export function getPokemonStatAnalytics(pokemon, allPokemon) {
+    const analytics = getIndexedAnalytics(allPokemon);
+    const row = analytics?.rowById.get(pokemon?.id);
+    if (row === undefined) {
+        return null;
+    }
+    const { data } = analytics;
+
+    const percentiles = {};
+    Object.entries(data.percentiles).forEach(([stat, values]) => {
+        percentiles[stat] = values[row];
+    });
+    const typeRanks = (pokemon.types_en || []).map((type, index) => ({
+        type,
+        rank: data.type_rank[row][index],
+        count: data.type_counts[type.toLowerCase()]
+    })).filter(entry => entry.rank !== undefined && entry.rank !== null);
+
+    const generation = data.generation?.[row];
+    const generationRank = generation ? {
+        generation,
+        rank: data.generation_rank[row],
+        count: data.generation_counts[String(generation)]
+    } : null;
+
+    return { total: data.total[row], percentiles, typeRanks, generationRank };
+}
+
 /**
  * Compare a Pokemon's stat to benchmarks
  * @param {number} statValue - The stat value to compare
@@ -175,9 +354,7 @@ export function getOverallStatRating(stats, benchmarks = STAT_BENCHMARKS) {
 export function compareTwoPokemons(pokemon1Stats, pokemon2Stats) {
     const comparison = {};
 
-    const statKeys = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed'];
-
-    statKeys.forEach(stat => {
+    STAT_KEYS.forEach(stat => {
         const value1 = pokemon1Stats[stat] || 0;
         const value2 = pokemon2Stats[stat] || 0;
         const difference = value1 - value2;
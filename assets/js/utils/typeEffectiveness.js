@@ -7,8 +7,6 @@
  * To update type effectiveness data:
  * 1. Edit TYPE_EFFECTIVENESS in scripts/pokeapi_fetch.py
  * 2. Run: python scripts/generate_type_effectiveness.py
- *
- * Generated: 2025-11-02 14:04:25
  */
 
 /**
@@ -183,6 +181,351 @@ export const TYPE_EFFECTIVENESS = {
     }
 };
 
+/**
+ * Number of types; type IDs run from 0 to TYPE_COUNT - 1
+ *
+ * @type {number}
+ */
+export const TYPE_COUNT = 18;
+
+/**
+ * Type names by type ID (TYPE_EFFECTIVENESS order)
+ *
+ * @type {Array<string>}
+ */
+export const TYPE_NAMES = Object.freeze([
+    'normal',
+    'fire',
+    'water',
+    'electric',
+    'grass',
+    'ice',
+    'fighting',
+    'poison',
+    'ground',
+    'flying',
+    'psychic',
+    'bug',
+    'rock',
+    'ghost',
+    'dragon',
+    'dark',
+    'steel',
+    'fairy'
+]);
+
+/**
+ * Type IDs by lowercase type name
+ *
+ * @type {Object.<string, number>}
+ */
+export const TYPE_IDS = Object.freeze({
+    'normal': 0,
+    'fire': 1,
+    'water': 2,
+    'electric': 3,
+    'grass': 4,
+    'ice': 5,
+    'fighting': 6,
+    'poison': 7,
+    'ground': 8,
+    'flying': 9,
+    'psychic': 10,
+    'bug': 11,
+    'rock': 12,
+    'ghost': 13,
+    'dragon': 14,
+    'dark': 15,
+    'steel': 16,
+    'fairy': 17
+});
+
+/**
+ * Attack multipliers as a flat TYPE_COUNT x TYPE_COUNT matrix:
+ * TYPE_MATRIX[attackId * TYPE_COUNT + defendId]
+ *
+ * @type {Float32Array}
+ */
+export const TYPE_MATRIX = new Float32Array([
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0.5, 0, 1, 1, 0.5, 1, // normal
+    1, 0.5, 0.5, 1, 2, 2, 1, 1, 1, 1, 1, 2, 0.5, 1, 0.5, 1, 2, 1, // fire
+    1, 2, 0.5, 1, 0.5, 1, 1, 1, 2, 1, 1, 1, 2, 1, 0.5, 1, 1, 1, // water
+    1, 1, 2, 0.5, 0.5, 1, 1, 1, 0, 2, 1, 1, 1, 1, 0.5, 1, 1, 1, // electric
+    1, 0.5, 2, 1, 0.5, 1, 1, 0.5, 2, 0.5, 1, 0.5, 2, 1, 0.5, 1, 0.5, 1, // grass
+    1, 0.5, 0.5, 1, 2, 0.5, 1, 1, 2, 2, 1, 1, 1, 1, 2, 1, 0.5, 1, // ice
+    2, 1, 1, 1, 1, 2, 1, 0.5, 1, 0.5, 0.5, 0.5, 2, 0, 1, 2, 2, 0.5, // fighting
+    1, 1, 1, 1, 2, 1, 1, 0.5, 0.5, 1, 1, 1, 0.5, 0.5, 1, 1, 0, 2, // poison
+    1, 2, 1, 2, 0.5, 1, 1, 2, 1, 0, 1, 0.5, 2, 1, 1, 1, 2, 1, // ground
+    1, 1, 1, 0.5, 2, 1, 2, 1, 1, 1, 1, 2, 0.5, 1, 1, 1, 0.5, 1, // flying
+    1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 0.5, 1, 1, 1, 1, 0, 0.5, 1, // psychic
+    1, 0.5, 1, 1, 2, 1, 0.5, 0.5, 1, 0.5, 2, 1, 1, 0.5, 1, 2, 0.5, 0.5, // bug
+    1, 2, 1, 1, 1, 2, 0.5, 1, 0.5, 2, 1, 2, 1, 1, 1, 1, 0.5, 1, // rock
+    0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 0.5, 1, 1, // ghost
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 0.5, 0, // dragon
+    1, 1, 1, 1, 1, 1, 0.5, 1, 1, 1, 2, 1, 1, 2, 1, 0.5, 1, 0.5, // dark
+    1, 0.5, 0.5, 0.5, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 0.5, 2, // steel
+    1, 0.5, 1, 1, 1, 1, 2, 0.5, 1, 1, 1, 1, 1, 1, 2, 2, 0.5, 1 // fairy
+]);
+
+/**
+ * Defensive multipliers of every single and dual typing (171 rows, see
+ * dualTypeIndex), one digit per attacking type in type ID order:
+ * 0 = 0, 1 = 0.25, 2 = 0.5, 3 = 1, 4 = 2, 5 = 4
+ */
+const DUAL_TYPE_DEFENSE_CODES = [
+    '333333433333303333', // normal
+    '324322434332403322', // normal/fire
+    '322442433333303323', // normal/water
+    '333233434233303323', // normal/electric
+    '342224442434303333', // normal/grass
+    '343332533333403343', // normal/ice
+    '333333433442203234', // normal/fighting
+    '333323324342303332', // normal/poison
+    '334044423333203333', // normal/ground
+    '333424330332403333', // normal/flying
+    '333333333324303433', // normal/psychic
+    '343323332433403333', // normal/bug
+    '224343524233303343', // normal/rock
+    '033333023332303433', // normal/ghost
+    '322224433333304334', // normal/dragon
+    '333333533304303234', // normal/dark
+    '243322504222202322', // normal/steel
+    '333333343332300243', // normal/fairy
+    '324322334332433322', // fire
+    '313431334332433312', // fire/water
+    '324222335232433312', // fire/electric
+    '333213343433433322', // fire/grass
+    '334321434332533332', // fire/ice
+    '324322334441333223', // fire/fighting
+    '324312225341433321', // fire/poison
+    '325033324332333322', // fire/ground
+    '324413230331533322', // fire/flying
+    '324322234323443422', // fire/psychic
+    '334312233432533322', // fire/bug
+    '215332425232433332', // fire/rock
+    '024322024331443422', // fire/ghost
+    '313213334332434323', // fire/dragon
+    '324322434303423223', // fire/dark
+    '234311405221332311', // fire/steel
+    '324322244331430232', // fire/fairy
+    '322442333333333323', // water
+    '322342334233333313', // water/electric
+    '331333342434333323', // water/grass
+    '332441433333433333', // water/ice
+    '322442333442233224', // water/fighting
+    '322432224342333322', // water/poison
+    '323053323333233323', // water/ground
+    '322533230332433323', // water/flying
+    '322442233324343423', // water/psychic
+    '332432232433433323', // water/bug
+    '213452424233333333', // water/rock
+    '022442023332343423', // water/ghost
+    '311333333333334324', // water/dragon
+    '322442433304323224', // water/dark
+    '232431404222232312', // water/steel
+    '322442243332330233', // water/fairy
+    '333233334233333323', // electric
+    '342124343334333323', // electric/grass
+    '343232434233433333', // electric/ice
+    '333233334342233224', // electric/fighting
+    '333223225242333322', // electric/poison
+    '334044324233233323', // electric/ground
+    '333324230232433323', // electric/flying
+    '333233234224343423', // electric/psychic
+    '343223233333433323', // electric/bug
+    '224243425133333333', // electric/rock
+    '033233024232343423', // electric/ghost
+    '322124334233334324', // electric/dragon
+    '333233434204323224', // electric/dark
+    '243222405122232312', // electric/steel
+    '333233244232330233', // electric/fairy
+    '342224342434333333', // grass
+    '352223442434433343', // grass/ice
+    '342224342543233234', // grass/fighting
+    '342214233443333332', // grass/poison
+    '343035332434233333', // grass/ground
+    '342315240433433333', // grass/flying
+    '342224242425343433', // grass/psychic
+    '352214241534433333', // grass/bug
+    '233234433334333343', // grass/rock
+    '042224032433343433', // grass/ghost
+    '331115342434334334', // grass/dragon
+    '342224442405323234', // grass/dark
+    '252213403323232322', // grass/steel
+    '342224252433330243', // grass/fairy
+    '343332433333433343', // ice
+    '343332433442333244', // ice/fighting
+    '343322324342433342', // ice/poison
+    '344043423333333343', // ice/ground
+    '343423330332533343', // ice/flying
+    '343332333324443443', // ice/psychic
+    '353322332433533343', // ice/bug
+    '234342524233433353', // ice/rock
+    '043332023332443443', // ice/ghost
+    '332223433333434344', // ice/dragon
+    '343332533304423244', // ice/dark
+    '253321504222332332', // ice/steel
+    '343332343332430253', // ice/fairy
+    '333333333442233234', // fighting
+    '333323224451233233', // fighting/poison
+    '334044323442133234', // fighting/ground
+    '333424230441333234', // fighting/flying
+    '333333233433243334', // fighting/psychic
+    '343323232542333234', // fighting/bug
+    '224343424342233244', // fighting/rock
+    '033333023441243334', // fighting/ghost
+    '322224333442234235', // fighting/dragon
+    '333333433403223135', // fighting/dark
+    '243322404331132223', // fighting/steel
+    '333333243441230144', // fighting/fairy
+    '333323224342333332', // poison
+    '334034214342233332', // poison/ground
+    '333414120341433332', // poison/flying
+    '333323124333343432', // poison/psychic
+    '343313123442433332', // poison/bug
+    '224333315242333342', // poison/rock
+    '033323014341343432', // poison/ghost
+    '322214224342334333', // poison/dragon
+    '333323324303323233', // poison/dark
+    '243312305231232321', // poison/steel
+    '333323134341330242', // poison/fairy
+    '334044323333233333', // ground
+    '334035220332333333', // ground/flying
+    '334044223324243433', // ground/psychic
+    '344034222433333333', // ground/bug
+    '225054414233233343', // ground/rock
+    '034044013332243433', // ground/ghost
+    '323035323333234334', // ground/dragon
+    '334044423304223234', // ground/dark
+    '244033404222132322', // ground/steel
+    '334044233332230243', // ground/fairy
+    '333424230332433333', // flying
+    '333424130323443433', // flying/psychic
+    '343414130432533333', // flying/bug
+    '224434320232433343', // flying/rock
+    '033424020331443433', // flying/ghost
+    '322315230332434334', // flying/dragon
+    '333424330303423234', // flying/dark
+    '243413300221332322', // flying/steel
+    '333424140331430243', // flying/fairy
+    '333333233324343433', // psychic
+    '343323132424443433', // psychic/bug
+    '224343324224343443', // psychic/rock
+    '033333023323353533', // psychic/ghost
+    '322224233324344434', // psychic/dragon
+    '333333333305333334', // psychic/dark
+    '243322304213242422', // psychic/steel
+    '333333143323340343', // psychic/fairy
+    '343323232433433333', // bug
+    '234333323333433343', // bug/rock
+    '043323022432443433', // bug/ghost
+    '332214232433434334', // bug/dragon
+    '343323332404423234', // bug/dark
+    '253312303322332322', // bug/steel
+    '343323142432430243', // bug/fairy
+    '224343424233333343', // rock
+    '024343014232343443', // rock/ghost
+    '213234424233334344', // rock/dragon
+    '224343524204323244', // rock/dark
+    '134332505122232332', // rock/steel
+    '224343334232330253', // rock/fairy
+    '033333023332343433', // ghost
+    '022224023332344434', // ghost/dragon
+    '033333023303333334', // ghost/dark
+    '043322004221242422', // ghost/steel
+    '033333033331340343', // ghost/fairy
+    '322224333333334334', // dragon
+    '322224433304324235', // dragon/dark
+    '232213404222233323', // dragon/steel
+    '322224243332330244', // dragon/fairy
+    '333333433304323234', // dark
+    '243322504203222223', // dark/steel
+    '333333343303320144', // dark/fairy
+    '243322404222232322', // steel
+    '243322304221230232', // steel/fairy
+    '333333243332330243' // fairy
+];
+
+const MULTIPLIER_BY_CODE = [0, 0.25, 0.5, 1, 2, 4];
+
+/**
+ * Decoded dual-type table:
+ * DUAL_TYPE_DEFENSE[dualTypeIndex(firstId, secondId) * TYPE_COUNT + attackId]
+ *
+ * @type {Float32Array}
+ */
+export const DUAL_TYPE_DEFENSE = Float32Array.from(
+    DUAL_TYPE_DEFENSE_CODES.join(''),
+    (code) => MULTIPLIER_BY_CODE[code]
+);
+
+/**
+ * Get the type ID of a type name (any case)
+ *
+ * @param {string} typeName - Type name, e.g. 'Fire'
+ * @returns {number} Type ID, or -1 for unknown types
+ */
+export function getTypeId(typeName) {
+    const id = TYPE_IDS[String(typeName).toLowerCase()];
+    return typeof id === 'number' ? id : -1;
+}
+
+/**
+ * Row of a single or dual typing in DUAL_TYPE_DEFENSE (order of the IDs does not matter)
+ *
+ * @param {number} firstId - First type ID
+ * @param {number} [secondId=firstId] - Second type ID; omit for single-type Pokemon
+ * @returns {number} Row index (0-170)
+ */
+export function dualTypeIndex(firstId, secondId = firstId) {
+    const low = Math.min(firstId, secondId);
+    const high = Math.max(firstId, secondId);
+    return low * TYPE_COUNT - (low * (low - 1)) / 2 + (high - low);
+}
+
+/**
+ * Multiplier of one attacking type against one defending type, by ID
+ *
+ * @param {number} attackId - Attacking type ID
+ * @param {number} defendId - Defending type ID
+ * @returns {number} Damage multiplier
+ */
+export function getEffectivenessById(attackId, defendId) {
+    return TYPE_MATRIX[attackId * TYPE_COUNT + defendId];
+}
+
+/**
+ * Multipliers of all attacking types against a single or dual typing, by ID
+ *
+ * @param {number} firstId - First type ID
+ * @param {number} [secondId=firstId] - Second type ID; omit for single-type Pokemon
+ * @returns {Float32Array} TYPE_COUNT multipliers indexed by attacking type ID
+ *     (a view, do not modify)
+ */
+export function getDefensiveMultipliersById(firstId, secondId = firstId) {
+    const start = dualTypeIndex(firstId, secondId) * TYPE_COUNT;
+    return DUAL_TYPE_DEFENSE.subarray(start, start + TYPE_COUNT);
+}
+
+/**
+ * Calculate damage multiplier for an attacking type against defending types, by ID
+ *
+ * @param {number} attackId - Attacking type ID
+ * @param {Array<number>} defendingIds - Defending type IDs
+ * @returns {number} Combined damage multiplier
+ */
+export function calculateTypeEffectivenessById(attackId, defendingIds) {
+    if (defendingIds.length === 2 && defendingIds[0] !== defendingIds[1]) {
+        const row = dualTypeIndex(defendingIds[0], defendingIds[1]);
+        return DUAL_TYPE_DEFENSE[row * TYPE_COUNT + attackId];
+    }
+    let multiplier = 1;
+    for (const defendId of defendingIds) {
+        multiplier *= TYPE_MATRIX[attackId * TYPE_COUNT + defendId];
+    }
+    return multiplier;
+}
+
 /**
  * Calculate damage multiplier for an attacking type against defending types
  *
@@ -191,14 +534,16 @@ export const TYPE_EFFECTIVENESS = {
  * @returns {number} Combined damage multiplier
  */
 export function calculateTypeEffectiveness(attackingType, defendingTypes) {
-    let multiplier = 1;
-
-    const effectiveness = TYPE_EFFECTIVENESS[attackingType.toLowerCase()] || {};
+    const attackId = getTypeId(attackingType);
+    if (attackId < 0) {
+        return 1;
+    }
 
+    let multiplier = 1;
     for (const defendingType of defendingTypes) {
-        const typeMultiplier = effectiveness[defendingType.toLowerCase()];
-        if (typeMultiplier !== undefined) {
-            multiplier *= typeMultiplier;
+        const defendId = getTypeId(defendingType);
+        if (defendId >= 0) {
+            multiplier *= TYPE_MATRIX[attackId * TYPE_COUNT + defendId];
         }
     }
 
@@ -265,11 +610,16 @@ export function getTypeMatchups(pokemonTypes) {
         immunities: []
     };
 
-    // Check all possible attacking types
-    const allTypes = Object.keys(TYPE_EFFECTIVENESS);
+    // Single and dual typings come straight from the precomputed table
+    const ids = pokemonTypes.map(getTypeId).filter((id) => id >= 0);
+    const multipliers = ids.length === 1 || (ids.length === 2 && ids[0] !== ids[1])
+        ? getDefensiveMultipliersById(ids[0], ids[ids.length - 1])
+        : TYPE_NAMES.map((attackingType) =>
+            calculateTypeEffectiveness(attackingType, pokemonTypes));
 
-    for (const attackingType of allTypes) {
-        const multiplier = calculateTypeEffectiveness(attackingType, pokemonTypes);
+    for (let attackId = 0; attackId < TYPE_COUNT; attackId++) {
+        const attackingType = TYPE_NAMES[attackId];
+        const multiplier = multipliers[attackId];
 
         if (multiplier === 0) {
             matchups.immunities.push(attackingType);
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Adaptive request concurrency and a circuit breaker for the PokeAPI fetchers.
+
+Instead of a fixed worker count and per-request sleep, requests go through
+AdaptiveController.send(), which:
+
+- caps in-flight requests at a limit adjusted AIMD-style: +1 per limit's
+  worth of healthy responses, halved (at most once per round trip) on a
+  429, a 5xx, a connection error or latency well above the best seen
+- retries those failures with exponential backoff, honouring Retry-After
+- opens a circuit breaker after consecutive failures, pausing every worker
+  for a cool-down and then letting one probe request through before
+  resuming
+
+Limit changes are reported through a callback (FetchMetrics.record_concurrency
+in pokeapi_fetch) so the chosen concurrency over time ends up in the
+fetch metrics report.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+CONGESTION_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open probe after cool-down."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 30.0):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_seconds: Time the circuit stays open before a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = self.CLOSED
+        self.trips = 0
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_thread: Optional[int] = None
+        self._condition = threading.Condition()
+
+    def wait_until_closed(self) -> float:
+        """Block while the circuit is open; in half-open state let one caller probe.
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        with self._condition:
+            while True:
+                if self.state == self.CLOSED:
+                    break
+                if self.state == self.OPEN:
+                    remaining = self._opened_at + self.cooldown_seconds - time.monotonic()
+                    if remaining > 0:
+                        self._condition.wait(remaining)
+                        continue
+                    self.state = self.HALF_OPEN
+                    self._probe_in_flight = False
+                if not self._probe_in_flight:
+                    self._probe_in_flight = True
+                    self._probe_thread = threading.get_ident()
+                    break
+                self._condition.wait()
+        return time.monotonic() - started
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of a request.
+
+        Must be called from the thread that called wait_until_closed(), so
+        the half-open probe is released only by its own result and not by
+        a request that was already in flight when the circuit opened.
+        """
+        with self._condition:
+            if ok:
+                self._consecutive_failures = 0
+                if self.state != self.CLOSED:
+                    logger.info("Circuit closed: upstream recovered")
+                    self.state = self.CLOSED
+            else:
+                self._consecutive_failures += 1
+                threshold_reached = self._consecutive_failures >= self.failure_threshold
+                if self.state == self.HALF_OPEN or (
+                        self.state == self.CLOSED and threshold_reached):
+                    self.state = self.OPEN
+                    self._opened_at = time.monotonic()
+                    self.trips += 1
+                    logger.warning(f"Circuit open after {self._consecutive_failures} "
+                                   f"consecutive failures; pausing requests "
+                                   f"for {self.cooldown_seconds:g}s")
+            if self._probe_in_flight and self._probe_thread == threading.get_ident():
+                self._probe_in_flight = False
+                self._probe_thread = None
+            self._condition.notify_all()
+
+
+class AdaptiveController:
+    """AIMD concurrency limit, retries and circuit breaker around one request function."""
+
+    def __init__(self, max_limit: int = 16, min_limit: int = 1, initial_limit: int = 2,
+                 latency_tolerance: float = 3.0, max_attempts: int = 4,
+                 backoff_seconds: float = 1.0,
+                 breaker: Optional[CircuitBreaker] = None,
+                 on_change: Optional[Callable[[int, str], None]] = None,
+                 on_sleep: Optional[Callable[[float], None]] = None):
+        """Initialize the controller.
+
+        Args:
+            max_limit: Upper bound for in-flight requests (size the worker pool to this)
+            min_limit: Lower bound for in-flight requests
+            initial_limit: Starting limit
+            latency_tolerance: Smoothed latency above this multiple of the best seen
+                counts as congestion
+            max_attempts: Tries per request, including the first
+            backoff_seconds: First retry delay; doubles per attempt
+            breaker: Circuit breaker (default: 5 failures, 30s cool-down)
+            on_change: Called with (new limit, reason) when the integer limit changes
+            on_sleep: Called with seconds spent in backoff or an open circuit
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.breaker = breaker or CircuitBreaker()
+        self.on_change = on_change
+        self.on_sleep = on_sleep
+        self.in_flight = 0
+        self.best_latency: Optional[float] = None
+        self.smoothed_latency: Optional[float] = None
+        self.history: List[Tuple[float, int, str]] = []
+        self._started = time.monotonic()
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self._record_change(int(self.limit), "initial")
+
+    def _record_change(self, limit: int, reason: str) -> None:
+        self.history.append((round(time.monotonic() - self._started, 3), limit, reason))
+        if self.on_change:
+            self.on_change(limit, reason)
+
+    def acquire(self) -> None:
+        """Wait for an in-flight slot under the current limit."""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency: float, congested: bool) -> None:
+        """Free a slot and adjust the limit from the request's outcome.
+
+        Args:
+            latency: Seconds the request took
+            congested: True for 429/5xx/connection errors
+        """
+        with self._condition:
+            self.in_flight -= 1
+            previous = int(self.limit)
+            self.best_latency = (latency if self.best_latency is None
+                                 else min(self.best_latency, latency))
+            self.smoothed_latency = latency if self.smoothed_latency is None else (
+                0.8 * self.smoothed_latency + 0.2 * latency)
+            slow = self.smoothed_latency > self.best_latency * self.latency_tolerance
+            if congested or slow:
+                now = time.monotonic()
+                # One decrease per round trip, so a burst of failures halves the limit once
+                if now - self._last_decrease >= self.smoothed_latency:
+                    self.limit = max(float(self.min_limit), self.limit / 2)
+                    self._last_decrease = now
+                    if slow and not congested:
+                        # Let the latency estimate settle at the new limit
+                        self.smoothed_latency = self.best_latency * self.latency_tolerance
+                reason = "errors" if congested else "latency"
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+                reason = "healthy"
+            if int(self.limit) != previous:
+                self._record_change(int(self.limit), reason)
+            self._condition.notify_all()
+
+    def _sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+            if self.on_sleep:
+                self.on_sleep(seconds)
+
+    def retry_delay(self, attempt: int, response: Any) -> float:
+        """Backoff before retry `attempt` (1-based); a numeric Retry-After wins."""
+        retry_after = (getattr(response, "headers", {}).get("Retry-After")
+                       if response is not None else None)
+        if retry_after and str(retry_after).isdigit():
+            return float(retry_after)
+        return self.backoff_seconds * (2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+    def send(self, request: Callable[[], Any],
+             transient_errors: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError),
+             before_attempt: Optional[Callable[[], None]] = None,
+             on_retry: Optional[Callable[[], None]] = None) -> Any:
+        """Run `request` under the limit and breaker, retrying congestion failures.
+
+        Args:
+            request: Performs one request and returns a response with `status_code`
+            transient_errors: Exceptions treated as congestion (retried)
+            before_attempt: Called before each attempt, outside the limit (e.g. a rate limiter)
+            on_retry: Called before each retry
+
+        Returns:
+            The first non-congested response, or the last response after max_attempts
+
+        Raises:
+            The last transient error if every attempt raised one
+        """
+        last_error: Optional[BaseException] = None
+        response = None
+        for attempt in range(1, self.max_attempts + 1):
+            if attempt > 1:
+                if on_retry:
+                    on_retry()
+                self._sleep(self.retry_delay(attempt - 1, response))
+            waited = self.breaker.wait_until_closed()
+            if waited and self.on_sleep:
+                self.on_sleep(waited)
+            if before_attempt:
+                before_attempt()
+
+            self.acquire()
+            started = time.perf_counter()
+            response, last_error, congested = None, None, False
+            try:
+                response = request()
+                congested = response.status_code in CONGESTION_STATUS_CODES
+            except transient_errors as error:
+                last_error, congested = error, True
+            finally:
+                # Also runs on unexpected errors, so neither the slot nor a probe leaks
+                self.release(time.perf_counter() - started, congested)
+                self.breaker.record(not congested)
+            if not congested:
+                return response
+
+        if last_error is not None:
+            raise last_error
+        return response
+
+    def summary(self) -> str:
+        """One-line description of the limits chosen during the run."""
+        limits = [limit for _, limit, _ in self.history]
+        return (f"concurrency {int(self.limit)} (range {min(limits)}-{max(limits)}, "
+                f"{len(self.history) - 1} changes), circuit breaker trips: {self.breaker.trips}")
@@ -4,9 +4,12 @@ Script to add romaji (romanized) versions of Japanese text to pokedex_data.json
 This adds romaji for Pokemon names, types, and move names to help with pronunciation
 """
 
+import argparse
 import json
 import sys
 
+from profiling import RunProfiler, add_profiling_arguments, stage
+
 # Hiragana to Romaji mapping
 HIRAGANA_TO_ROMAJI = {
     'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
@@ -143,30 +146,31 @@ def kana_to_romaji(text):
 def add_romaji_to_data(input_file, output_file):
     """Add romaji fields to the pokedex data"""
     print(f"Loading data from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
+    with stage("load"), open(input_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
     print(f"Processing {len(data)} Pokemon...")
     
-    for pokemon in data:
-        # Add romaji for Pokemon name
-        if 'name_jp' in pokemon:
-            pokemon['name_romaji'] = kana_to_romaji(pokemon['name_jp'])
-        
-        # Add romaji for types
-        if 'types_jp' in pokemon:
-            pokemon['types_romaji'] = [kana_to_romaji(t) for t in pokemon['types_jp']]
-        
-        # Add romaji for moves
-        if 'moves' in pokemon:
-            for move in pokemon['moves']:
-                if 'name_jp' in move:
-                    move['name_romaji'] = kana_to_romaji(move['name_jp'])
-                if 'type_jp' in move:
-                    move['type_romaji'] = kana_to_romaji(move['type_jp'])
+    with stage("romaji"):
+        for pokemon in data:
+            # Add romaji for Pokemon name
+            if 'name_jp' in pokemon:
+                pokemon['name_romaji'] = kana_to_romaji(pokemon['name_jp'])
+
+            # Add romaji for types
+            if 'types_jp' in pokemon:
+                pokemon['types_romaji'] = [kana_to_romaji(t) for t in pokemon['types_jp']]
+
+            # Add romaji for moves
+            if 'moves' in pokemon:
+                for move in pokemon['moves']:
+                    if 'name_jp' in move:
+                        move['name_romaji'] = kana_to_romaji(move['name_jp'])
+                    if 'type_jp' in move:
+                        move['type_romaji'] = kana_to_romaji(move['type_jp'])
     
     print(f"Writing updated data to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with stage("save"), open(output_file, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
     
     print("✅ Romaji data added successfully!")
@@ -180,11 +184,15 @@ def add_romaji_to_data(input_file, output_file):
         print(f"  First move: {sample['moves'][0]['name_jp']} ({sample['moves'][0]['name_romaji']})")
 
 if __name__ == '__main__':
-    input_file = 'pokedex_data.json'
-    output_file = 'pokedex_data.json'
+    parser = argparse.ArgumentParser(description='Add romaji fields to pokedex_data.json')
+    parser.add_argument('--input', default='pokedex_data.json', help='Input JSON file')
+    parser.add_argument('--output', default='pokedex_data.json', help='Output JSON file')
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
     
     try:
-        add_romaji_to_data(input_file, output_file)
+        with RunProfiler.from_args(args, 'add_romaji'):
+            add_romaji_to_data(args.input, args.output)
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Bundle the ES modules under assets/js into fingerprinted files in dist/.
+
+Walks the static import graph from every `<script type="module">` entry in
+index.html, emits the modules in dependency order into one bundle per entry,
+strips comments and indentation, and writes a deployable dist/ tree with
+index.html pointing at the bundles. Cold loads then fetch one script per
+entry instead of a ~30-request import waterfall.
+
+Each module keeps its own scope: the body is wrapped in a function that
+returns its exports, and its imports become destructured reads from the
+modules evaluated before it. The app only uses named imports/exports of
+functions, classes and constants, which is all this bundler supports.
+"""
+
+import argparse
+import hashlib
+import logging
+import re
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Files and directories copied into dist/ as-is (if present)
+SITE_FILES: List[str] = [
+    "manifest.json", "service-worker.js", "robots.txt", "sitemap.xml",
+    "CNAME", ".nojekyll", "pokedex_data.json", "precache-manifest.js",
+]
+SITE_DIRS: List[str] = ["assets", "pokemon"]
+# Module sources replaced by the bundles (not copied into dist/)
+JS_SOURCE_DIR: str = "assets/js"
+
+ENTRY_PATTERN = re.compile(r'<script type="module" src="([^"]+)"></script>')
+IMPORT_PATTERN = re.compile(
+    r"^[ \t]*import\s*(?:\{([^}]*)\}\s*from\s*)?['\"]([^'\"]+)['\"];?[ \t]*$",
+    re.MULTILINE
+)
+EXPORT_DECLARATION_PATTERN = re.compile(
+    r"^([ \t]*)export\s+((?:async\s+)?function\*?|class|const|let|var)\s+([A-Za-z_$][\w$]*)",
+    re.MULTILINE
+)
+EXPORT_LIST_PATTERN = re.compile(r"^[ \t]*export\s*\{([^}]*)\};?[ \t]*$", re.MULTILINE)
+
+REGEX_PRECEDING_CHARS = set("(,=:[!&|?{};+-*%<>~^")
+REGEX_PRECEDING_WORDS = {"return", "typeof", "case", "in", "of", "new", "delete", "void", "throw"}
+
+
+class Module:
+    """A parsed ES module in the bundle graph."""
+
+    def __init__(self, path: Path, index: int):
+        self.path = path
+        self.var_name = f"__module{index}"
+        self.imports: List[Tuple[Path, List[Tuple[str, str]]]] = []
+        self.exports: List[Tuple[str, str]] = []
+        self.body = ""
+
+
+def parse_specifiers(spec_list: str) -> List[Tuple[str, str]]:
+    """Parse `a, b as c` into [(exported, local)] pairs."""
+    pairs = []
+    for spec in spec_list.split(","):
+        spec = spec.strip()
+        if not spec:
+            continue
+        if " as " in spec:
+            exported, local = (part.strip() for part in spec.split(" as ", 1))
+        else:
+            exported = local = spec
+        pairs.append((exported, local))
+    return pairs
+
+
+def resolve_specifier(importer: Path, specifier: str) -> Path:
+    """Resolve a relative import specifier (dropping any ?v= cache buster)."""
+    if not specifier.startswith("."):
+        raise ValueError(f"{importer}: bare import '{specifier}' is not supported")
+    return (importer.parent / specifier.split("?", 1)[0]).resolve()
+
+
+def parse_module(module: Module) -> None:
+    """Extract imports/exports from a module and rewrite its body."""
+    source = module.path.read_text(encoding="utf-8")
+
+    for match in IMPORT_PATTERN.finditer(source):
+        specifiers = parse_specifiers(match.group(1) or "")
+        module.imports.append((resolve_specifier(module.path, match.group(2)), specifiers))
+    body = IMPORT_PATTERN.sub("", source)
+
+    for match in EXPORT_DECLARATION_PATTERN.finditer(body):
+        module.exports.append((match.group(3), match.group(3)))
+    body = EXPORT_DECLARATION_PATTERN.sub(r"\1\2 \3", body)
+
+    for match in EXPORT_LIST_PATTERN.finditer(body):
+        for local, exported in parse_specifiers(match.group(1)):
+            module.exports.append((exported, local))
+    body = EXPORT_LIST_PATTERN.sub("", body)
+
+    # Default/namespace/multi-line imports are not rewritten and would break the bundle
+    if (re.search(r"^\s*export\s", body, re.MULTILINE)
+            or re.search(r"^\s*import\b", body, re.MULTILINE)
+            or re.search(r"\bimport\s*\(", body)):
+        raise ValueError(f"{module.path}: unsupported import/export form")
+    module.body = body
+
+
+def collect_graph(entry: Path) -> List[Module]:
+    """Return the entry's module graph in dependency (post-)order."""
+    modules: Dict[Path, Module] = {}
+    ordered: List[Module] = []
+    visiting: List[Path] = []
+
+    def visit(path: Path) -> None:
+        if path in modules:
+            if path in visiting:
+                cycle = " -> ".join(p.name for p in visiting[visiting.index(path):] + [path])
+                raise ValueError(f"Circular import: {cycle}")
+            return
+        module = Module(path, len(modules))
+        modules[path] = module
+        visiting.append(path)
+        parse_module(module)
+        for dependency, _ in module.imports:
+            visit(dependency)
+        visiting.pop()
+        ordered.append(module)
+
+    visit(entry.resolve())
+    return ordered
+
+
+def bundle_modules(modules: List[Module]) -> str:
+    """Concatenate modules into a single script, each in its own scope."""
+    by_path = {module.path: module for module in modules}
+    chunks = []
+    for module in modules:
+        lines = []
+        for dependency, specifiers in module.imports:
+            if specifiers:
+                bindings = ", ".join(
+                    exported if exported == local else f"{exported}: {local}"
+                    for exported, local in specifiers
+                )
+                lines.append(f"const {{ {bindings} }} = {by_path[dependency].var_name};")
+        exports = ", ".join(
+            local if exported == local else f"{exported}: {local}"
+            for exported, local in module.exports
+        )
+        chunks.append(
+            f"const {module.var_name} = (() => {{\n"
+            + "\n".join(lines) + "\n"
+            + module.body
+            + f"\nreturn {{ {exports} }};\n}})();"
+        )
+    return "\n".join(chunks) + "\n"
+
+
+def strip_js(source: str) -> str:
+    """Remove comments and redundant whitespace outside strings, templates and regexes.
+
+    Newlines are kept (collapsed) so automatic semicolon insertion behaves
+    exactly as in the original source.
+    """
+    out: List[str] = []
+    i = 0
+    n = len(source)
+    template_depth: List[int] = []  # brace depth at each open `${`
+    brace_depth = 0
+    last_token = ""
+
+    def previous_word() -> str:
+        match = re.search(r"([A-Za-z_$][\w$]*)\s*$", "".join(out[-20:]))
+        return match.group(1) if match else ""
+
+    def read_template(start: int) -> int:
+        j = start
+        while j < n:
+            if source[j] == "\\":
+                j += 2
+                continue
+            if source[j] == "`":
+                return j + 1
+            if source.startswith("${", j):
+                template_depth.append(brace_depth)
+                return j + 2
+            j += 1
+        return n
+
+    while i < n:
+        char = source[i]
+
+        if char in " \t\r\n":
+            j = i
+            while j < n and source[j] in " \t\r\n":
+                j += 1
+            separator = "\n" if "\n" in source[i:j] else " "
+            if out and out[-1] in (" ", "\n"):
+                if separator == "\n":
+                    out[-1] = separator
+            elif out and j < n:
+                out.append(separator)
+            i = j
+            continue
+
+        if source.startswith("//", i):
+            while i < n and source[i] != "\n":
+                i += 1
+            continue
+
+        if source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            if out and out[-1] not in (" ", "\n"):
+                out.append(" ")
+            continue
+
+        if char in "'\"":
+            j = i + 1
+            while j < n and source[j] != char:
+                j += 2 if source[j] == "\\" else 1
+            out.append(source[i:j + 1])
+            last_token = char
+            i = j + 1
+            continue
+
+        if char == "`" or (char == "}" and template_depth and template_depth[-1] == brace_depth):
+            if char == "}":
+                template_depth.pop()
+            j = read_template(i + 1)
+            out.append(source[i:j])
+            last_token = "`"
+            i = j
+            continue
+
+        if char == "/" and (
+            not last_token
+            or last_token in REGEX_PRECEDING_CHARS
+            or (last_token.isalnum() and previous_word() in REGEX_PRECEDING_WORDS)
+        ):
+            j = i + 1
+            in_class = False
+            while j < n and (in_class or source[j] != "/") and source[j] != "\n":
+                if source[j] == "\\":
+                    j += 1
+                elif source[j] == "[":
+                    in_class = True
+                elif source[j] == "]":
+                    in_class = False
+                j += 1
+            j += 1
+            while j < n and (source[j].isalnum()):
+                j += 1
+            out.append(source[i:j])
+            last_token = "/"
+            i = j
+            continue
+
+        if char == "{":
+            brace_depth += 1
+        elif char == "}":
+            brace_depth -= 1
+        out.append(char)
+        last_token = char
+        i += 1
+
+    return "".join(out).strip() + "\n"
+
+
+def fingerprint(content: str) -> str:
+    """Short content hash for cache-busting filenames."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:8]
+
+
+def build(root: Path, dist: Path, minify: bool = True) -> Dict[str, str]:
+    """Write the dist/ tree and return a mapping of entry src to bundle path.
+
+    Args:
+        root: Site root containing index.html
+        dist: Output directory (recreated)
+        minify: Strip comments and whitespace
+
+    Returns:
+        Mapping of original script src to bundled script src
+    """
+    index_html = (root / "index.html").read_text(encoding="utf-8")
+    entries = ENTRY_PATTERN.findall(index_html)
+    if not entries:
+        raise ValueError("No <script type=\"module\"> entries found in index.html")
+
+    if dist.exists():
+        shutil.rmtree(dist)
+    dist.mkdir(parents=True)
+    for name in SITE_FILES:
+        if (root / name).exists():
+            shutil.copy2(root / name, dist / name)
+    js_source_dir = (root / JS_SOURCE_DIR).resolve()
+
+    def skip_js_sources(directory: str, names: List[str]) -> List[str]:
+        if Path(directory).resolve().is_relative_to(js_source_dir):
+            return [name for name in names if name.endswith(".js")]
+        return []
+
+    for name in SITE_DIRS:
+        if (root / name).exists():
+            shutil.copytree(root / name, dist / name, ignore=skip_js_sources)
+
+    bundles: Dict[str, str] = {}
+    for src in entries:
+        entry_path = root / src.split("?", 1)[0]
+        modules = collect_graph(entry_path)
+        code = bundle_modules(modules)
+        if minify:
+            code = strip_js(code)
+
+        bundle_src = f"{JS_SOURCE_DIR}/{entry_path.stem}.{fingerprint(code)}.js"
+        (dist / bundle_src).parent.mkdir(parents=True, exist_ok=True)
+        (dist / bundle_src).write_text(code, encoding="utf-8")
+        bundles[src] = bundle_src
+
+        source_bytes = sum(module.path.stat().st_size for module in modules)
+        logger.info(f"{src}: {len(modules)} modules, {source_bytes / 1024:.0f} KB -> "
+                    f"{bundle_src} ({len(code.encode('utf-8')) / 1024:.0f} KB)")
+
+    for src, bundle_src in bundles.items():
+        index_html = index_html.replace(f'src="{src}"', f'src="{bundle_src}"')
+    (dist / "index.html").write_text(index_html, encoding="utf-8")
+    return bundles
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Bundle assets/js into fingerprinted files under dist/")
+    parser.add_argument("--root", default=".", help="Site root containing index.html")
+    parser.add_argument("--dist", default="dist", help="Output directory")
+    parser.add_argument("--no-minify", action="store_true", help="Keep comments and whitespace")
+    args = parser.parse_args(argv)
+
+    try:
+        bundles = build(Path(args.root), Path(args.dist), minify=not args.no_minify)
+    except (OSError, ValueError) as e:
+        logger.error(f"❌ Bundling failed: {e}")
+        return 1
+
+    logger.info(f"✅ Wrote {args.dist}/ with {len(bundles)} bundle(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Incremental build of the data pipeline.
+
+Runs the pipeline scripts as a dependency graph instead of a manual chain:
+
+    fetch -> enrich -> romaji -> sitemap -> validate_seo
+                       romaji -> pages   -> validate_seo
+                       romaji -> atlas
+                       romaji -> binary
+    type_effectiveness -> type_tables_check (independent)
+
+Each stage declares the files it reads (including its own script and the
+helpers it imports) and writes. After a stage succeeds, the SHA-256 of
+every input and output is recorded in .build/state.json; the next build
+skips stages whose command, inputs and outputs still match. A stage whose
+dependencies all finished starts immediately on a worker thread, so
+independent stages run in parallel. Hashes are cached by (mtime, size) so
+a no-op rebuild reads no file contents.
+
+The fetch stage reads only its scripts, so it runs when its output is
+missing, its code changes, or with `--force fetch`. Intermediate datasets
+live in .build/ so every stage has distinct inputs and outputs;
+pokedex_data.json is written by the last data stage.
+
+    python scripts/build_pipeline.py              # run what changed
+    python scripts/build_pipeline.py --dry-run    # show what would run and why
+    python scripts/build_pipeline.py --force enrich
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from build_utils import file_sha256
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+BUILD_DIR: str = ".build"
+STATE_FILE: str = f"{BUILD_DIR}/state.json"
+PYTHON: str = sys.executable or "python3"
+
+
+class Stage:
+    """One pipeline step: a command with declared input and output files."""
+
+    def __init__(self, name: str, command: List[str], inputs: List[str], outputs: List[str]):
+        self.name = name
+        self.command = command
+        self.inputs = inputs
+        self.outputs = outputs
+        self.dependencies: Set[str] = set()
+
+
+STAGES: List[Stage] = [
+    Stage("fetch",
+          [PYTHON, "scripts/pokeapi_fetch.py", "--output", f"{BUILD_DIR}/pokedex_fetched.json",
+           "--cache-dir", ".pokeapi_cache"],
+          ["scripts/pokeapi_fetch.py", "scripts/adaptive_concurrency.py", "scripts/build_utils.py",
+           "scripts/fetch_metrics.py", "scripts/profiling.py"],
+          [f"{BUILD_DIR}/pokedex_fetched.json"]),
+    Stage("enrich",
+          [PYTHON, "scripts/enrich_pokedex_data.py", "--input", f"{BUILD_DIR}/pokedex_fetched.json",
+           "--output", f"{BUILD_DIR}/pokedex_enriched.json", "--cache-dir", ".pokeapi_cache"],
+          ["scripts/enrich_pokedex_data.py", "scripts/pokeapi_fetch.py",
+           "scripts/adaptive_concurrency.py", "scripts/build_utils.py", "scripts/fetch_metrics.py",
+           "scripts/profiling.py", f"{BUILD_DIR}/pokedex_fetched.json"],
+          [f"{BUILD_DIR}/pokedex_enriched.json"]),
+    Stage("romaji",
+          [PYTHON, "scripts/add_romaji.py", "--input", f"{BUILD_DIR}/pokedex_enriched.json",
+           "--output", "pokedex_data.json"],
+          ["scripts/add_romaji.py", "scripts/profiling.py", f"{BUILD_DIR}/pokedex_enriched.json"],
+          ["pokedex_data.json"]),
+    Stage("type_effectiveness",
+          [PYTHON, "scripts/generate_type_effectiveness.py"],
+          ["scripts/generate_type_effectiveness.py"],
+          ["assets/js/utils/typeEffectiveness.js"]),
+    Stage("type_tables_check",
+          [PYTHON, "scripts/generate_type_effectiveness.py", "--check"],
+          ["scripts/generate_type_effectiveness.py", "scripts/pokeapi_fetch.py",
+           "assets/js/utils/typeEffectiveness.js"],
+          []),
+    Stage("sitemap",
+          [PYTHON, "scripts/generate_sitemap.py", "--input", "pokedex_data.json",
+           "--output", "sitemap.xml"],
+          ["scripts/generate_sitemap.py", "scripts/build_utils.py", "scripts/profiling.py",
+           "pokedex_data.json"],
+          ["sitemap.xml"]),
+    # Writes pokemon/{id}/{slug}/index.html; the manifest is written last and stands for the tree
+    Stage("pages",
+          [PYTHON, "scripts/generate_pokemon_pages.py", "--input", "pokedex_data.json"],
+          ["scripts/generate_pokemon_pages.py", "scripts/build_utils.py", "pokedex_data.json"],
+          ["pokemon/manifest.json"]),
+    # Converts the final dataset, so the binary has the enrich and romaji fields too
+    Stage("binary",
+          [PYTHON, "scripts/pokedex_binary.py", "--input", "pokedex_data.json"],
+          ["scripts/pokedex_binary.py", "scripts/build_utils.py", "pokedex_data.json"],
+          ["assets/data/pokedex.bin"]),
+    # Writes hashed sheets plus a map keyed by ID; the map stands for the sheets
+    Stage("atlas",
+          [PYTHON, "scripts/generate_sprite_atlas.py", "--input", "pokedex_data.json"],
+          ["scripts/generate_sprite_atlas.py", "scripts/build_utils.py", "pokedex_data.json"],
+          ["assets/sprites/atlas/sprite_atlas.json"]),
+    # The sitemap lists the page URLs, so validation waits for the pages too
+    Stage("validate_seo",
+          [PYTHON, "scripts/validate_seo_files.py"],
+          ["scripts/validate_seo_files.py", "scripts/profiling.py", "robots.txt", "sitemap.xml",
+           "pokemon/manifest.json"],
+          []),
+]
+
+
+def link_stages(stages: List[Stage]) -> Dict[str, Stage]:
+    """Derive dependencies from which stage produces each input file.
+
+    Returns:
+        Stages by name
+
+    Raises:
+        ValueError: If two stages write the same file or the graph has a cycle
+    """
+    producers: Dict[str, str] = {}
+    for stage in stages:
+        for output in stage.outputs:
+            if output in producers:
+                raise ValueError(f"{output} is written by both {producers[output]} "
+                                 f"and {stage.name}")
+            producers[output] = stage.name
+    for stage in stages:
+        produced_inputs = {producers[path] for path in stage.inputs if path in producers}
+        stage.dependencies = produced_inputs - {stage.name}
+
+    by_name = {stage.name: stage for stage in stages}
+    visiting: Set[str] = set()
+    done: Set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle through stage {name}")
+        visiting.add(name)
+        for dependency in by_name[name].dependencies:
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in by_name:
+        visit(name)
+    return by_name
+
+
+class BuildState:
+    """Recorded stage fingerprints plus a (mtime, size) -> hash cache."""
+
+    def __init__(self, path: str = STATE_FILE):
+        self.path = Path(path)
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as fh:
+                    saved = json.load(fh)
+                self.stages = saved.get("stages", {})
+                self.files = saved.get("files", {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable build state {self.path}: {e}")
+
+    def file_hash(self, path: str) -> Optional[str]:
+        """SHA-256 of a file, or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            cached = self.files.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = file_sha256(path)
+        with self._lock:
+            self.files[path] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def fingerprint(self, stage: Stage) -> Dict[str, Any]:
+        return {
+            "command": stage.command[1:],
+            "inputs": {path: self.file_hash(path) for path in stage.inputs},
+            "outputs": {path: self.file_hash(path) for path in stage.outputs}
+        }
+
+    def stale_reason(self, stage: Stage) -> Optional[str]:
+        """Why a stage has to run, or None if its last run is still valid."""
+        recorded = self.stages.get(stage.name)
+        if recorded is None:
+            return "never built"
+        current = self.fingerprint(stage)
+        if current["command"] != recorded["command"]:
+            return "command changed"
+        for path, digest in current["inputs"].items():
+            if digest is None:
+                return f"input {path} is missing"
+            if recorded["inputs"].get(path) != digest:
+                return f"input {path} changed"
+        for path, digest in current["outputs"].items():
+            if digest is None:
+                return f"output {path} is missing"
+            if recorded["outputs"].get(path) != digest:
+                return f"output {path} was modified"
+        return None
+
+    def record(self, stage: Stage) -> None:
+        fingerprint = self.fingerprint(stage)
+        with self._lock:
+            self.stages[stage.name] = fingerprint
+            self.save_locked()
+
+    def save(self) -> None:
+        with self._lock:
+            self.save_locked()
+
+    def save_locked(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        with open(temporary, "w", encoding="utf-8") as fh:
+            json.dump({"stages": self.stages, "files": self.files}, fh, indent=2)
+        os.replace(temporary, self.path)
+
+
+def run_stage(stage: Stage) -> bool:
+    """Run one stage's command, logging its output on failure."""
+    for output in stage.outputs:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    result = subprocess.run(stage.command, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        logger.error(f"❌ {stage.name} failed after {elapsed:.1f}s (exit {result.returncode})")
+        for line in (result.stdout + result.stderr).strip().splitlines()[-20:]:
+            logger.error(f"   {line}")
+        return False
+    logger.info(f"✅ {stage.name} ({elapsed:.1f}s)")
+    return True
+
+
+def build(stages: Dict[str, Stage], state: BuildState, jobs: int, force: Set[str],
+          dry_run: bool = False) -> int:
+    """Run stale stages in dependency order, independent ones in parallel.
+
+    A stage is decided once all its dependencies have finished, so a
+    dependency that reran but wrote identical output does not make it
+    stale. In a dry run nothing is written, so stages downstream of one
+    that would run are assumed to run too.
+
+    Returns:
+        Number of failed stages (0 on success)
+    """
+    finished: Set[str] = set()
+    ran: Set[str] = set()
+    failed: Set[str] = set()
+    pending = dict(stages)
+    running: Dict[Future, Stage] = {}
+
+    def decide(stage: Stage) -> Optional[str]:
+        if stage.name in force:
+            return "forced"
+        rebuilt = sorted(stage.dependencies & ran)
+        if dry_run and rebuilt:
+            return f"{', '.join(rebuilt)} would run"
+        return state.stale_reason(stage)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if not stage.dependencies <= finished | failed:
+                    continue
+                del pending[name]
+                if stage.dependencies & failed:
+                    failed_dependencies = ", ".join(sorted(stage.dependencies & failed))
+                    logger.warning(f"Skipping {name}: {failed_dependencies} failed")
+                    failed.add(name)
+                    continue
+                reason = decide(stage)
+                if reason is None:
+                    logger.info(f"   {name}: up to date")
+                    finished.add(name)
+                elif dry_run:
+                    logger.info(f"   {name}: would run ({reason})")
+                    ran.add(name)
+                    finished.add(name)
+                else:
+                    logger.info(f"▶  {name}: running ({reason})")
+                    running[pool.submit(run_stage, stage)] = stage
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                if future.result():
+                    state.record(stage)
+                    ran.add(stage.name)
+                    finished.add(stage.name)
+                else:
+                    failed.add(stage.name)
+    return len(failed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Incrementally rebuild the data pipeline")
+    parser.add_argument("--force", nargs="+", default=[], metavar="STAGE",
+                        help="Run these stages even if up to date")
+    parser.add_argument("--force-all", action="store_true", help="Run every stage")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 2,
+                        help="Stages run in parallel (default: CPU count)")
+    parser.add_argument("--state", default=STATE_FILE,
+                        help=f"Build state file (default: {STATE_FILE})")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show which stages would run and why")
+    args = parser.parse_args()
+
+    stages = link_stages(STAGES)
+    unknown = set(args.force) - set(stages)
+    if unknown:
+        logger.error(f"❌ Unknown stage(s): {', '.join(sorted(unknown))}. "
+                     f"Stages: {', '.join(stages)}")
+        return 1
+    force = set(stages) if args.force_all else set(args.force)
+
+    started = time.perf_counter()
+    state = BuildState(args.state)
+    failures = build(stages, state, args.jobs, force, args.dry_run)
+    if not args.dry_run:
+        state.save()
+
+    elapsed = time.perf_counter() - started
+    if failures:
+        logger.error(f"❌ Build failed: {failures} stage(s) failed or skipped ({elapsed:.2f}s)")
+        return 1
+    logger.info(f"✅ Build finished in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the build scripts that derive artifacts from pokedex_data.json.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Public site root used for canonical URLs (sitemap, prerendered pages)
+SITE_URL: str = "https://www.pokedex.tech"
+
+# National Dex ID ranges per generation
+GENERATION_RANGES: Dict[int, range] = {
+    1: range(1, 152),
+    2: range(152, 252),
+    3: range(252, 387),
+    4: range(387, 494),
+    5: range(494, 650),
+    6: range(650, 722),
+    7: range(722, 810),
+    8: range(810, 906),
+    9: range(906, 1026),
+}
+
+
+def get_generation(pokemon_id: int) -> Optional[int]:
+    """Return the generation a National Dex ID belongs to.
+
+    Args:
+        pokemon_id: National Dex ID
+
+    Returns:
+        Generation number, or None for IDs outside the National Dex (e.g. forms 10001+)
+    """
+    for generation, id_range in GENERATION_RANGES.items():
+        if pokemon_id in id_range:
+            return generation
+    return None
+
+
+def pokemon_slug(name: str) -> str:
+    """URL slug of a name, the same as StructuredDataGenerator._createSlug in the frontend.
+
+    Args:
+        name: Display name, e.g. "Mr. Mime"
+
+    Returns:
+        Lowercase ASCII slug ("mr-mime"), or "pokemon" if nothing is left
+    """
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "pokemon"
+
+
+def pokemon_page_path(pokemon: Dict[str, Any]) -> str:
+    """Site-relative path of a Pokémon's prerendered page.
+
+    Args:
+        pokemon: Record with `id` and `name_en`
+
+    Returns:
+        Directory path with trailing slash, e.g. "pokemon/25/pikachu/"
+    """
+    return f"pokemon/{pokemon['id']}/{pokemon_slug(pokemon['name_en'])}/"
+
+
+def load_pokedex_data(path: str = "pokedex_data.json") -> List[Dict[str, Any]]:
+    """Load the Pokémon list from a pokedex_data.json file.
+
+    Args:
+        path: Path to the dataset
+
+    Returns:
+        List of Pokémon dictionaries
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    logger.info(f"Loaded {len(data)} Pokémon from {path}")
+    return data
+
+
+def iter_json_array(path: str, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield the items of a file holding one top-level JSON array.
+
+    The file is read in chunks and each item is decoded as soon as it is
+    complete, so memory stays at one item plus one chunk.
+
+    Args:
+        path: JSON file whose top level is an array
+        chunk_size: Read size in characters
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as fh:
+        buffer = ""
+        position = 0
+        exhausted = False
+        expected = "["
+
+        def read_more() -> bool:
+            nonlocal buffer, position, exhausted
+            chunk = "" if exhausted else fh.read(chunk_size)
+            if not chunk:
+                exhausted = True
+                return False
+            buffer = buffer[position:] + chunk
+            position = 0
+            return True
+
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+            if position == len(buffer):
+                if not read_more():
+                    raise ValueError(f"{path}: unexpected end of JSON array")
+                continue
+            char = buffer[position]
+            if expected == "[":
+                if char != "[":
+                    raise ValueError(f"{path}: top level is not a JSON array")
+                position += 1
+                expected = "item or ]"
+            elif char == "]" and expected != "item":
+                return
+            elif expected == ",":
+                if char != ",":
+                    raise ValueError(f"{path}: expected ',' between array items")
+                position += 1
+                expected = "item"
+            else:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if read_more():
+                        continue
+                    raise
+                # An item is only complete once the next delimiter is buffered: a
+                # chunk boundary can cut a number such as 2.5e3 after "2."
+                following = end
+                while following < len(buffer) and buffer[following] in " \t\r\n":
+                    following += 1
+                if (following == len(buffer) or buffer[following] not in ",]") and read_more():
+                    continue
+                position = end
+                expected = ","
+                yield item
+
+
+def write_json_records(path: str, records: Iterable[Dict[str, Any]]) -> int:
+    """Write records as a JSON array one at a time, formatted like write_json().
+
+    The output is byte-identical to write_json(path, list(records)) but the
+    records are never held together in memory.
+
+    Args:
+        path: Output file path
+        records: Records in output order
+
+    Returns:
+        Number of records written
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("[")
+        for record in records:
+            fh.write(",\n  " if count else "\n  ")
+            # Strings are escaped in JSON, so every newline here is indentation
+            fh.write(json.dumps(record, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+            count += 1
+        fh.write("\n]" if count else "]")
+    return count
+
+
+def write_json(path: str, payload: Any, compact: bool = False) -> None:
+    """Write a JSON artifact, creating parent directories as needed.
+
+    Args:
+        path: Output file path
+        payload: JSON-serializable data
+        compact: Write without whitespace (for shipped artifacts)
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        if compact:
+            json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(payload, fh, ensure_ascii=False, indent=2)
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 16) -> str:
+    """Return the hex SHA-256 digest of a file's contents.
+
+    Args:
+        path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Batch damage calculator: every attacker's moves against every defender.
+
+For each (attacker, damaging move) pair and each defender, computes the
+damage range of the standard formula at a common level:
+
+    base   = floor(floor((2 * level / 5 + 2) * power * A / D) / 50) + 2
+    damage = base * roll (0.85-1.00) * STAB (1.5) * type multiplier
+
+where A/D are the attacker's Attack/Sp. Atk and the defender's
+Defense/Sp. Def for the move's damage class, computed from base stats at
+that level (IV 31, no EVs, neutral nature). Each modifier is applied in
+turn with integer truncation, as in the games; a hit that is not immune
+does at least 1 damage. Critical hits, abilities, items and weather are
+ignored.
+
+The matrix is computed one row (attacker, move) at a time against all
+defenders at once. A row only depends on a defender's defense stat and
+type multiplier, so it is computed once per distinct (defense, multiplier)
+pair and expanded to every defender through a precomputed index.
+Attackers are processed in chunks spread over a process pool with a
+bounded number of chunks in flight, so memory stays flat no matter how
+large the matrix is. Each chunk is folded into the top-N
+counters of every defender (highest expected damage as a share of the
+defender's HP; expected = mean roll x accuracy), written to
+assets/data/top_counters.json. The full matrix can be streamed to NDJSON
+with --matrix-output.
+
+    python scripts/damage_matrix.py --counters-to 149 --top 10
+    python scripts/damage_matrix.py --matrix-output damage_matrix.ndjson
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from build_utils import load_pokedex_data, write_json
+from generate_type_effectiveness import TYPE_NAMES, dual_type_defense, dual_type_index
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEVEL: int = 50
+DEFAULT_TOP: int = 5
+CHUNK_SIZE: int = 32
+IV: int = 31
+
+# Bits reserved for the move index when packing (expected damage, move) into one int
+MOVE_BITS: int = 12
+
+# Attack and defense stat used by each damage class
+DAMAGE_CLASSES: Dict[str, Tuple[str, str]] = {
+    "physical": ("attack", "defense"),
+    "special": ("special-attack", "special-defense")
+}
+TYPE_IDS: Dict[str, int] = {name: index for index, name in enumerate(TYPE_NAMES)}
+
+# A damaging move as used by the engine: (name, type id, damage class, power, accuracy, STAB)
+AttackMove = Tuple[str, int, str, int, int, bool]
+
+
+def level_stat(base: int, level: int, hp: bool = False) -> int:
+    """Stat at `level` from a base stat (IV 31, no EVs, neutral nature)."""
+    scaled = (2 * base + IV) * level // 100
+    return scaled + level + 10 if hp else scaled + 5
+
+
+class DamageEngine:
+    """Defender columns and attacker move lists for row-at-a-time damage."""
+
+    def __init__(self, pokemon_data: List[Dict[str, Any]], level: int = DEFAULT_LEVEL):
+        """Precompute stats at `level`, typings and damaging moves.
+
+        Args:
+            pokemon_data: List of Pokémon records
+            level: Level of both sides
+        """
+        self.level = level
+        self.factor = 2 * level // 5 + 2
+        rows = []
+        for pokemon in sorted(pokemon_data, key=lambda p: p["id"]):
+            type_ids = [TYPE_IDS.get(t.lower(), -1) for t in (pokemon.get("types_en") or [])[:2]]
+            if pokemon.get("stats") and type_ids and min(type_ids) >= 0:
+                rows.append((pokemon, type_ids))
+
+        self.ids = [pokemon["id"] for pokemon, _ in rows]
+        self.names = [pokemon.get("name_en", "") for pokemon, _ in rows]
+        self.positions = {pokemon_id: position for position, pokemon_id in enumerate(self.ids)}
+        self.hp = [level_stat(pokemon["stats"].get("hp", 0), level, hp=True) for pokemon, _ in rows]
+        self.stats = {
+            stat: [level_stat(pokemon["stats"].get(stat, 0), level) for pokemon, _ in rows]
+            for pair in DAMAGE_CLASSES.values() for stat in pair
+        }
+
+        # quarters[attack_type][defender]: type multiplier x 4 (0.25x..4x as integers)
+        defense_table = dual_type_defense()
+        typings = [dual_type_index(type_ids[0], type_ids[-1]) for _, type_ids in rows]
+        self.quarters = [[int(defense_table[typing][attack_type] * 4) for typing in typings]
+                         for attack_type in range(len(TYPE_NAMES))]
+
+        # A row only depends on a defender's (defense stat, multiplier), so rows are
+        # computed once per distinct pair and expanded through a per-defender index
+        self.pairs: Dict[Tuple[str, int], List[Tuple[int, int]]] = {}
+        self.pair_index: Dict[Tuple[str, int], List[int]] = {}
+        for damage_class, (_, defense_stat) in DAMAGE_CLASSES.items():
+            for attack_type, quarters in enumerate(self.quarters):
+                positions: Dict[Tuple[int, int], int] = {}
+                index = [positions.setdefault(pair, len(positions))
+                         for pair in zip(self.stats[defense_stat], quarters)]
+                self.pairs[(damage_class, attack_type)] = list(positions)
+                self.pair_index[(damage_class, attack_type)] = index
+
+        self.moves: List[List[AttackMove]] = [self._attack_moves(pokemon, type_ids)
+                                              for pokemon, type_ids in rows]
+
+    @staticmethod
+    def _attack_moves(pokemon: Dict[str, Any], type_ids: List[int]) -> List[AttackMove]:
+        """Damaging moves of a Pokémon, one per distinct (type, class, power, accuracy)."""
+        moves = []
+        seen = set()
+        for move in pokemon.get("moves") or []:
+            type_id = TYPE_IDS.get((move.get("type_en") or "").lower(), -1)
+            damage_class = move.get("damage_class")
+            power = move.get("power") or 0
+            if type_id < 0 or damage_class not in DAMAGE_CLASSES or power <= 0:
+                continue
+            accuracy = move.get("accuracy") or 100
+            key = (type_id, damage_class, power, accuracy)
+            if key not in seen:
+                seen.add(key)
+                moves.append((move.get("name_en") or "", type_id, damage_class, power, accuracy,
+                              type_id in type_ids))
+        return moves
+
+    def _pair_row(self, attacker: int, move: AttackMove) -> Tuple[List[int], List[int], List[int]]:
+        """Damage range of a move against each distinct (defense, multiplier) pair.
+
+        Returns:
+            (minimum per pair, maximum per pair, pair index per defender)
+        """
+        _, type_id, damage_class, power, _, stab = move
+        attack_stat, _ = DAMAGE_CLASSES[damage_class]
+        numerator = self.factor * power * self.stats[attack_stat][attacker]
+        lows, highs = [], []
+        for defense, quarters in self.pairs[(damage_class, type_id)]:
+            base = numerator // defense // 50 + 2
+            low = base * 85 // 100
+            if stab:
+                base, low = base * 3 // 2, low * 3 // 2
+            # Truncate after the multiplier; a non-immune hit does at least 1
+            lows.append((low * quarters >> 2) or (quarters and 1))
+            highs.append((base * quarters >> 2) or (quarters and 1))
+        return lows, highs, self.pair_index[(damage_class, type_id)]
+
+    def move_row(self, attacker: int, move: AttackMove) -> Tuple[List[int], List[int]]:
+        """Minimum and maximum damage of one attacker's move against every defender.
+
+        Args:
+            attacker: Attacker position
+            move: One of self.moves[attacker]
+
+        Returns:
+            (minimum damage, maximum damage) lists aligned with self.ids
+        """
+        lows, highs, index = self._pair_row(attacker, move)
+        return list(map(lows.__getitem__, index)), list(map(highs.__getitem__, index))
+
+    def compute_chunk(self, start: int, stop: int, top: int, rows: bool = False) -> Dict[str, Any]:
+        """Damage rows of attackers [start, stop) and their best counters per defender.
+
+        Args:
+            start: First attacker position
+            stop: One past the last attacker position
+            top: Counters to keep per defender
+            rows: Include the raw damage rows (for streaming the full matrix)
+
+        Returns:
+            {"counters": per-defender [(share, -attacker, move, low, high)],
+             "rows": [...], "cells": n}
+        """
+        defenders = len(self.ids)
+        counters: List[List[Tuple[float, int, str, int, int]]] = [[] for _ in range(defenders)]
+        matrix_rows = []
+        cells = 0
+        for attacker in range(start, stop):
+            moves = self.moves[attacker]
+            # Per defender: (low + high) * accuracy of the best move, move index in the low bits
+            best = [-1] * defenders
+            for move_index, move in enumerate(moves):
+                lows, highs, index = self._pair_row(attacker, move)
+                cells += defenders
+                if rows:
+                    matrix_rows.append((self.ids[attacker], move[0],
+                                        list(map(lows.__getitem__, index)),
+                                        list(map(highs.__getitem__, index))))
+                accuracy = move[4]
+                packed = [((low + high) * accuracy << MOVE_BITS) | move_index
+                          for low, high in zip(lows, highs)]
+                best = list(map(max, best, map(packed.__getitem__, index)))
+
+            for defender, key in enumerate(best):
+                if key < 0 or defender == attacker:
+                    continue
+                share = round((key >> MOVE_BITS) / 200 / self.hp[defender], 4)
+                heap = counters[defender]
+                if len(heap) == top and (share, -attacker) <= heap[0][:2]:
+                    continue
+                move = moves[key & ((1 << MOVE_BITS) - 1)]
+                entry = (share, -attacker, move[0]) + self.damage_range(attacker, defender, move)
+                if len(heap) < top:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heapreplace(heap, entry)
+        return {"counters": counters, "rows": matrix_rows, "cells": cells}
+
+    def iter_chunks(self, top: int = DEFAULT_TOP, chunk_size: int = CHUNK_SIZE, workers: int = 1,
+                    rows: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield compute_chunk() results in attacker order.
+
+        With several workers, at most 2 x workers chunks are in flight, so
+        memory is bounded by the chunk size rather than the matrix size.
+        """
+        ranges = [(start, min(start + chunk_size, len(self.ids)))
+                  for start in range(0, len(self.ids), chunk_size)]
+        if workers <= 1:
+            for start, stop in ranges:
+                yield self.compute_chunk(start, stop, top, rows)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self,)) as pool:
+            pending: List[Future] = []
+            for start, stop in ranges:
+                pending.append(pool.submit(_compute_chunk, start, stop, top, rows))
+                if len(pending) >= 2 * workers:
+                    yield pending.pop(0).result()
+            for future in pending:
+                yield future.result()
+
+    def counters_to(self, defender_id: int, top: int = DEFAULT_TOP) -> List[Dict[str, Any]]:
+        """Best counters to one Pokémon: every attacker's moves against just this defender.
+
+        Raises:
+            KeyError: If the ID is not in the dataset
+        """
+        defender = self.positions[defender_id]
+        hp = self.hp[defender]
+        ranked = []
+        for attacker, moves in enumerate(self.moves):
+            if attacker == defender:
+                continue
+            best = None
+            for move in moves:
+                low, high = self.damage_range(attacker, defender, move)
+                expected = (low + high) * move[4] / 200
+                if best is None or expected > best[0]:
+                    best = (expected, move[0], low, high)
+            if best and best[0] > 0:
+                ranked.append((round(best[0] / hp, 4), -attacker, best[1], best[2], best[3]))
+        return [self._counter_entry(entry, hp) for entry in heapq.nlargest(top, ranked)]
+
+    def damage_range(self, attacker: int, defender: int, move: AttackMove) -> Tuple[int, int]:
+        """Damage range of one move against one defender (same steps as _pair_row)."""
+        _, type_id, damage_class, power, _, stab = move
+        attack_stat, defense_stat = DAMAGE_CLASSES[damage_class]
+        attack = self.stats[attack_stat][attacker]
+        base = self.factor * power * attack // self.stats[defense_stat][defender] // 50 + 2
+        low = base * 85 // 100
+        if stab:
+            base, low = base * 3 // 2, low * 3 // 2
+        quarters = self.quarters[type_id][defender]
+        return (low * quarters >> 2) or (quarters and 1), (base * quarters >> 2) or (quarters and 1)
+
+    def _counter_entry(self, entry: Tuple[float, int, str, int, int], hp: int) -> Dict[str, Any]:
+        share, attacker, move, low, high = entry
+        return {
+            "id": self.ids[-attacker],
+            "name": self.names[-attacker],
+            "move": move,
+            "damage": [low, high],
+            "percent": [round(100 * low / hp, 1), round(100 * high / hp, 1)],
+            "expected_percent": round(100 * share, 1)
+        }
+
+
+# Engine shared by the worker processes (set by _init_worker)
+_engine: Optional[DamageEngine] = None
+
+
+def _init_worker(engine: DamageEngine) -> None:
+    global _engine
+    _engine = engine
+
+
+def _compute_chunk(start: int, stop: int, top: int, rows: bool) -> Dict[str, Any]:
+    return _engine.compute_chunk(start, stop, top, rows)
+
+
+def build_counters(engine: DamageEngine, top: int, workers: int,
+                   matrix_output: Optional[str] = None,
+                   chunk_size: int = CHUNK_SIZE) -> Tuple[Dict[str, Any], int]:
+    """Stream every chunk, merge per-defender counters and optionally write the matrix.
+
+    The matrix file is NDJSON: a header line with the level and defender
+    IDs/HP, then one line per (attacker, move) with min and max damage
+    against each defender in header order.
+
+    Returns:
+        (counters artifact, number of damage cells computed)
+    """
+    counters: List[List[Tuple[float, int, str, int, int]]] = [[] for _ in engine.ids]
+    cells = 0
+    matrix = open(matrix_output, "w", encoding="utf-8") if matrix_output else None
+    try:
+        if matrix:
+            header = {"level": engine.level, "defenders": engine.ids, "hp": engine.hp}
+            matrix.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for chunk in engine.iter_chunks(top, chunk_size, workers, rows=matrix is not None):
+            cells += chunk["cells"]
+            for defender, entries in enumerate(chunk["counters"]):
+                for entry in entries:
+                    if len(counters[defender]) < top:
+                        heapq.heappush(counters[defender], entry)
+                    elif entry > counters[defender][0]:
+                        heapq.heapreplace(counters[defender], entry)
+            if matrix:
+                for attacker_id, move, lows, highs in chunk["rows"]:
+                    row = {"attacker": attacker_id, "move": move, "min": lows, "max": highs}
+                    matrix.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n")
+    finally:
+        if matrix:
+            matrix.close()
+
+    artifact = {
+        "level": engine.level,
+        "top": top,
+        "ids": engine.ids,
+        "counters": [[engine._counter_entry(entry, engine.hp[defender])
+                      for entry in sorted(entries, reverse=True)]
+                     for defender, entries in enumerate(counters)]
+    }
+    return artifact, cells
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compute move-versus-defender damage in bulk")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--output", default="assets/data/top_counters.json",
+                        help="Top counters artifact")
+    parser.add_argument("--matrix-output",
+                        help="Also stream the full damage matrix to this NDJSON file")
+    parser.add_argument("--level", type=int, default=DEFAULT_LEVEL,
+                        help=f"Level of both sides (default: {DEFAULT_LEVEL})")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP,
+                        help=f"Counters per Pokémon (default: {DEFAULT_TOP})")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help=f"Attackers per chunk (default: {CHUNK_SIZE})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--counters-to", type=int, metavar="ID",
+                        help="Print the best counters to ID and exit")
+    args = parser.parse_args()
+
+    if not 1 <= args.level <= 100:
+        logger.error("❌ --level must be between 1 and 100")
+        return 1
+    engine = DamageEngine(load_pokedex_data(args.input), args.level)
+    if not engine.ids:
+        logger.error("❌ No Pokémon with stats and types found")
+        return 1
+
+    if args.counters_to is not None:
+        if args.counters_to not in engine.positions:
+            logger.error(f"❌ Pokémon #{args.counters_to} not found")
+            return 1
+        name = engine.names[engine.positions[args.counters_to]]
+        logger.info(f"Best counters to #{args.counters_to} {name} (level {args.level}):")
+        for rank, counter in enumerate(engine.counters_to(args.counters_to, max(1, args.top)), 1):
+            logger.info(f"   {rank:2d}. #{counter['id']} {counter['name']} — {counter['move']}: "
+                        f"{counter['percent'][0]}-{counter['percent'][1]}% "
+                        f"(expected {counter['expected_percent']}%)")
+        return 0
+
+    started = time.perf_counter()
+    artifact, cells = build_counters(engine, max(1, args.top), args.workers, args.matrix_output,
+                                     max(1, args.chunk_size))
+    elapsed = time.perf_counter() - started
+    rate = cells / max(elapsed, 1e-9)
+    logger.info(f"Computed {cells:,} damage ranges in {elapsed:.2f}s ({rate:,.0f}/s)")
+    if args.matrix_output:
+        logger.info(f"✅ Streamed damage matrix to {args.matrix_output}")
+
+    write_json(args.output, artifact, compact=True)
+    logger.info(f"✅ Wrote top {artifact['top']} counters for {len(engine.ids)} Pokémon "
+                f"to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
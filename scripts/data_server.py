@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Local HTTP data server for the Pokédex dataset (stdlib asyncio only).
+
+Loads the dataset once, from pokedex_data.json or from the memory-mapped
+binary file written by pokedex_binary.py, and serves:
+
+    GET /pokedex_data.json              full dataset (drop-in for DATA.JSON_FILE)
+    GET /pokemon/{id}                   one record
+    GET /pokemon?type=Fire&gen=1        records filtered by type and/or generation
+    GET /index                          list index: id, names, types, sprite
+    GET /search?q=pika&limit=20         index entries whose ID or name matches
+    GET /health                         liveness probe
+
+Every body is JSON. Responses carry a strong ETag (SHA-256 of the body) and
+answer `If-None-Match` with 304; clients sending `Accept-Encoding: gzip` get
+a gzip body compressed once and kept with the response, with its own ETag.
+Connections are HTTP/1.1 keep-alive. Per-ID and full-dataset responses are
+built at startup in JSON mode; filter/search results and (in binary mode)
+records are built on first request and cached.
+
+    python scripts/data_server.py --port 8080
+    python scripts/data_server.py --binary assets/data/pokedex.bin
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import re
+import sys
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from build_utils import get_generation, load_pokedex_data
+from pokedex_binary import PokedexFile
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+INDEX_FIELDS: Tuple[str, ...] = (
+    "id", "name_en", "name_jp", "name_romaji", "types_en", "types_jp", "sprite"
+)
+KEEP_ALIVE_SECONDS: int = 5
+MAX_HEADERS: int = 100
+DEFAULT_SEARCH_LIMIT: int = 20
+GZIP_MIN_BYTES: int = 256
+# ASCII digits only: str.isdigit() also accepts e.g. '²', which int() rejects
+NUMBER_PATTERN = re.compile(r"[0-9]+")
+
+
+def is_number(text: str) -> bool:
+    """True if text is a non-empty run of ASCII digits."""
+    return NUMBER_PATTERN.fullmatch(text) is not None
+
+
+class Representation:
+    """A response body with its gzip variant and ETags, built once."""
+
+    __slots__ = ("body", "etag", "gzip_body", "gzip_etag")
+
+    def __init__(self, payload: Any):
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        if len(self.body) >= GZIP_MIN_BYTES:
+            self.gzip_body = gzip.compress(self.body, compresslevel=9, mtime=0)
+            self.gzip_etag = f'"{digest}-gz"'
+        else:
+            self.gzip_body = None
+            self.gzip_etag = None
+
+
+class ResponseCache:
+    """Bounded LRU of Representations keyed by canonical request."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Representation]" = OrderedDict()
+
+    def get_or_build(self, key: str, build: Callable[[], Any]) -> Representation:
+        representation = self.entries.get(key)
+        if representation is not None:
+            self.entries.move_to_end(key)
+            return representation
+        representation = Representation(build())
+        self.entries[key] = representation
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return representation
+
+
+class PokedexStore:
+    """Dataset access for the server, backed by the JSON file or the binary file."""
+
+    def __init__(self, records: Optional[List[Dict[str, Any]]] = None,
+                 binary: Optional[PokedexFile] = None):
+        self.binary = binary
+        self.records_by_id: Dict[int, Dict[str, Any]] = {}
+        if records is not None:
+            self.records_by_id = {record["id"]: record for record in records}
+            source = records
+        else:
+            source = binary
+        self.index: List[Dict[str, Any]] = [
+            {field: record.get(field) for field in INDEX_FIELDS if field in record}
+            for record in source
+        ]
+
+    @classmethod
+    def load(cls, input_path: str, binary_path: Optional[str] = None) -> "PokedexStore":
+        if binary_path:
+            store = cls(binary=PokedexFile(binary_path))
+            logger.info(f"Mapped {len(store.index)} Pokémon from {binary_path}")
+            return store
+        return cls(records=load_pokedex_data(input_path))
+
+    def ids(self) -> List[int]:
+        return [entry["id"] for entry in self.index]
+
+    def record(self, pokemon_id: int) -> Optional[Dict[str, Any]]:
+        if self.binary is not None:
+            view = self.binary.get(pokemon_id)
+            return view.to_dict() if view is not None else None
+        return self.records_by_id.get(pokemon_id)
+
+    def all_records(self) -> List[Dict[str, Any]]:
+        return [self.record(pokemon_id) for pokemon_id in self.ids()]
+
+    def filter(self, type_name: Optional[str], generation: Optional[int]) -> List[Dict[str, Any]]:
+        """Full records matching a type (English name, any case) and/or a generation."""
+        wanted = type_name.lower() if type_name else None
+        matches = []
+        for entry in self.index:
+            if wanted and wanted not in (t.lower() for t in entry.get("types_en") or []):
+                continue
+            if generation is not None and get_generation(entry["id"]) != generation:
+                continue
+            matches.append(self.record(entry["id"]))
+        return matches
+
+    def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Index entries whose ID equals the query or whose names contain it, prefixes first."""
+        query = query.strip().lower()
+        if not query:
+            return []
+        prefix, contains = [], []
+        for entry in self.index:
+            if is_number(query) and entry["id"] == int(query):
+                prefix.insert(0, entry)
+                continue
+            names = [str(entry.get(field) or "").lower()
+                     for field in ("name_en", "name_jp", "name_romaji")]
+            if any(name.startswith(query) for name in names):
+                prefix.append(entry)
+            elif any(query in name for name in names):
+                contains.append(entry)
+        return (prefix + contains)[:limit]
+
+
+class DataServer:
+    """HTTP/1.1 keep-alive server over asyncio streams."""
+
+    def __init__(self, store: PokedexStore, cache_entries: int = 512):
+        self.store = store
+        self.cache = ResponseCache(cache_entries)
+        self.requests_served = 0
+        self.static: Dict[str, Representation] = {
+            "/index": Representation(store.index),
+            "/health": Representation({"status": "ok", "pokemon": len(store.index)})
+        }
+        if store.binary is None:
+            # Everything per ID is cheap to prebuild from the parsed JSON
+            self.static["/pokedex_data.json"] = Representation(store.all_records())
+            for pokemon_id, record in store.records_by_id.items():
+                self.static[f"/pokemon/{pokemon_id}"] = Representation(record)
+
+    def route(self, target: str) -> Tuple[HTTPStatus, Optional[Representation]]:
+        """Resolve a request target to a status and body."""
+        parts = urlsplit(target)
+        path = unquote(parts.path).rstrip("/") or "/"
+        representation = self.static.get(path)
+        if representation is not None and not parts.query:
+            return HTTPStatus.OK, representation
+
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        if path == "/pokedex_data.json":
+            return HTTPStatus.OK, self.cache.get_or_build(path, self.store.all_records)
+        if path.startswith("/pokemon/"):
+            pokemon_id = path[len("/pokemon/"):]
+            if not is_number(pokemon_id):
+                error = {"error": "Pokémon ID must be a number"}
+                return HTTPStatus.BAD_REQUEST, Representation(error)
+            record = self.store.record(int(pokemon_id))
+            if record is None:
+                error = {"error": f"No Pokémon with ID {pokemon_id}"}
+                return HTTPStatus.NOT_FOUND, Representation(error)
+            return HTTPStatus.OK, self.cache.get_or_build(path, lambda: record)
+        if path == "/pokemon":
+            type_name = query.get("type")
+            generation = query.get("gen")
+            if generation is not None and not is_number(generation):
+                return HTTPStatus.BAD_REQUEST, Representation({"error": "gen must be a number"})
+            key = f"/pokemon?type={(type_name or '').lower()}&gen={generation or ''}"
+            return HTTPStatus.OK, self.cache.get_or_build(
+                key, lambda: self.store.filter(type_name, int(generation) if generation else None))
+        if path == "/search":
+            limit = query.get("limit", str(DEFAULT_SEARCH_LIMIT))
+            if not is_number(limit):
+                return HTTPStatus.BAD_REQUEST, Representation({"error": "limit must be a number"})
+            text = query.get("q", "")
+            key = f"/search?q={text.strip().lower()}&limit={limit}"
+            return HTTPStatus.OK, self.cache.get_or_build(
+                key, lambda: self.store.search(text, int(limit)))
+        if representation is not None:
+            return HTTPStatus.OK, representation
+        return HTTPStatus.NOT_FOUND, Representation({"error": f"Unknown path {path}"})
+
+    def build_response(self, method: str, target: str, headers: Dict[str, str],
+                       keep_alive: bool) -> bytes:
+        """Render the full HTTP response for one request."""
+        if method not in ("GET", "HEAD"):
+            status = HTTPStatus.METHOD_NOT_ALLOWED
+            representation = Representation({"error": "Use GET or HEAD"})
+        else:
+            try:
+                status, representation = self.route(target)
+            except Exception:
+                logger.exception(f"❌ Failed to handle {method} {target}")
+                status = HTTPStatus.INTERNAL_SERVER_ERROR
+                representation = Representation({"error": "Internal server error"})
+
+        use_gzip = (representation.gzip_body is not None
+                    and "gzip" in headers.get("accept-encoding", "").lower())
+        body = representation.gzip_body if use_gzip else representation.body
+        etag = representation.gzip_etag if use_gzip else representation.etag
+
+        if status == HTTPStatus.OK:
+            candidates = [tag.strip() for tag in headers.get("if-none-match", "").split(",")]
+            if etag in candidates or "*" in candidates:
+                status, body = HTTPStatus.NOT_MODIFIED, b""
+
+        lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json; charset=utf-8",
+            "Cache-Control: no-cache",
+            "Access-Control-Allow-Origin: *",
+            "Vary: Accept-Encoding",
+            f"ETag: {etag}",
+            f"Content-Length: {len(body) if status != HTTPStatus.NOT_MODIFIED else 0}",
+        ]
+        if use_gzip and status != HTTPStatus.NOT_MODIFIED:
+            lines.append("Content-Encoding: gzip")
+        if status == HTTPStatus.METHOD_NOT_ALLOWED:
+            lines.append("Allow: GET, HEAD")
+        if keep_alive:
+            lines += ["Connection: keep-alive", f"Keep-Alive: timeout={KEEP_ALIVE_SECONDS}"]
+        else:
+            lines.append("Connection: close")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head if method == "HEAD" or status == HTTPStatus.NOT_MODIFIED else head + body
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until it closes or idles out."""
+        try:
+            while True:
+                request_line = await asyncio.wait_for(reader.readline(), timeout=KEEP_ALIVE_SECONDS)
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+                    writer.write(b"HTTP/1.1 400 Bad Request\r\n"
+                                 b"Content-Length: 0\r\nConnection: close\r\n\r\n")
+                    break
+                method, target, version = parts
+
+                headers: Dict[str, str] = {}
+                for _ in range(MAX_HEADERS):
+                    line = await asyncio.wait_for(reader.readline(), timeout=KEEP_ALIVE_SECONDS)
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                if version == "HTTP/1.1":
+                    keep_alive = connection != "close"
+                else:
+                    keep_alive = connection == "keep-alive"
+                # GET/HEAD bodies are not expected; skip one if a client sends it anyway
+                content_length = headers.get("content-length", "0")
+                if is_number(content_length) and int(content_length):
+                    await reader.readexactly(int(content_length))
+
+                writer.write(self.build_response(method, target, headers, keep_alive))
+                await writer.drain()
+                self.requests_served += 1
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        addresses = ", ".join(f"http://{sock.getsockname()[0]}:{sock.getsockname()[1]}"
+                              for sock in server.sockets)
+        logger.info(f"✅ Serving {len(self.store.index)} Pokémon on {addresses}")
+        async with server:
+            await server.serve_forever()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve the Pokédex dataset over HTTP with per-ID endpoints")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--binary", default=None,
+                        help="Serve from a binary dataset written by pokedex_binary.py "
+                             "instead of --input")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port (default: 8080)")
+    parser.add_argument("--cache-entries", type=int, default=512,
+                        help="Filter/search responses kept in memory (default: 512)")
+    args = parser.parse_args()
+
+    store = PokedexStore.load(args.input, args.binary)
+    server = DataServer(store, cache_entries=args.cache_entries)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        logger.info(f"Stopped after {server.requests_served} requests")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
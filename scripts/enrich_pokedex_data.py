@@ -3,29 +3,79 @@
 
 import argparse
 import json
+import os
 import time
-from typing import Dict, Any, List, Optional
-
-import requests
-
-BASE_URL = "https://pokeapi.co/api/v2/"
-
-
-def get_json(url: str, cache: Dict[str, Any], sleep_time: float = 0.0) -> Optional[Dict[str, Any]]:
-    if url in cache:
-        return cache[url]
-
-    try:
-        response = requests.get(url, timeout=20)
-        response.raise_for_status()
-        payload = response.json()
-        cache[url] = payload
-        if sleep_time > 0:
-            time.sleep(sleep_time)
-        return payload
-    except requests.RequestException:
-        cache[url] = None
-        return None
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional
+
+import pokeapi_fetch
+from profiling import RunProfiler, add_profiling_arguments, stage
+
+BASE_URL = pokeapi_fetch.BASE_URL
+
+# Requests go through pokeapi_fetch.get_data, which records into its metrics
+metrics = pokeapi_fetch.metrics
+
+
+def get_json(url: str, sleep_time: float = 0.0) -> Optional[Dict[str, Any]]:
+    """Fetch a PokeAPI URL through pokeapi_fetch's cached, rate-limited get_data.
+
+    Payloads already loaded this run or present in the `--cache-dir` cache
+    are returned without a request. Failed requests are not cached, so a
+    later call for the same URL tries again.
+
+    Args:
+        url: Full PokeAPI URL
+        sleep_time: Extra delay after each request that hit the network
+
+    Returns:
+        JSON payload, or None if the request failed
+    """
+    endpoint = pokeapi_fetch.to_endpoint(url)
+    if pokeapi_fetch.load_cached_payload(endpoint):
+        return pokeapi_fetch.payload_cache[endpoint]
+
+    payload = pokeapi_fetch.get_data(endpoint)
+    if sleep_time > 0:
+        time.sleep(sleep_time)
+        metrics.record_sleep("throttle", sleep_time)
+    return payload
+
+
+def fetch_all_json(urls: Iterable[str], sleep_time: float = 0.0,
+                   workers: int = 1) -> List[Optional[Dict[str, Any]]]:
+    """Fetch several URLs through get_json, optionally on a thread pool."""
+    urls = list(urls)
+    if workers <= 1:
+        return [get_json(url, sleep_time) for url in urls]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda url: get_json(url, sleep_time), urls))
+
+
+def list_evolution_chain_urls(sleep_time: float = 0.0, page_size: int = 100) -> List[str]:
+    """Page through the evolution-chain list endpoint and return every chain URL."""
+    urls: List[str] = []
+    page_url: Optional[str] = f"{BASE_URL}evolution-chain/?limit={page_size}&offset=0"
+    while page_url:
+        page = get_json(page_url, sleep_time)
+        if not page:
+            break
+        urls.extend(result["url"] for result in page.get("results", []))
+        page_url = page.get("next")
+    return urls
+
+
+def build_species_chain_index(chain_payloads: Iterable[Optional[Dict[str, Any]]]
+                              ) -> Dict[int, Dict[str, Any]]:
+    """Map every species ID to the evolution graph of the chain it belongs to."""
+    index: Dict[int, Dict[str, Any]] = {}
+    for payload in chain_payloads:
+        if not payload:
+            continue
+        graph = build_evolution_graph(payload)
+        for node in graph["nodes"]:
+            index[node["id"]] = graph
+    return index
 
 
 def to_slug(title_name: str) -> str:
@@ -136,17 +186,11 @@ def build_evolution_graph(evolution_chain_payload: Dict[str, Any]) -> Dict[str,
     return {"nodes": nodes, "transitions": transitions}
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Enrich pokedex_data.json with Milestone 3 metadata")
-    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
-    parser.add_argument("--output", default="pokedex_data.json", help="Output JSON file")
-    parser.add_argument("--sleep", type=float, default=0.0, help="Sleep time between API calls")
-    args = parser.parse_args()
-
-    with open(args.input, "r", encoding="utf-8") as fh:
+def enrich(args: argparse.Namespace) -> None:
+    """Run the enrichment with parsed command-line options."""
+    with stage("load"), open(args.input, "r", encoding="utf-8") as fh:
         pokemon_data = json.load(fh)
 
-    cache: Dict[str, Any] = {}
     evolution_graph_cache: Dict[str, Dict[str, Any]] = {}
     move_damage_cache: Dict[str, Optional[str]] = {}
 
@@ -159,9 +203,12 @@ def main() -> None:
     })
 
     print(f"Resolving damage class for {len(unique_move_slugs)} unique moves...")
-    for idx, move_slug in enumerate(unique_move_slugs, 1):
-        move_url = f"{BASE_URL}move/{move_slug}"
-        move_payload = get_json(move_url, cache, args.sleep)
+    with stage("fetch moves"):
+        move_payloads = fetch_all_json(
+            (f"{BASE_URL}move/{move_slug}" for move_slug in unique_move_slugs),
+            args.sleep, args.workers
+        )
+    for idx, (move_slug, move_payload) in enumerate(zip(unique_move_slugs, move_payloads), 1):
         if move_payload and move_payload.get("damage_class"):
             move_damage_cache[move_slug] = move_payload["damage_class"]["name"]
         else:
@@ -169,35 +216,92 @@ def main() -> None:
         if idx % 100 == 0 or idx == len(unique_move_slugs):
             print(f"  {idx}/{len(unique_move_slugs)} moves processed")
 
+    # Bulk mode: fetch every chain from the list endpoint and index it by species,
+    # so no per-species request is needed.
+    species_chain_index: Dict[int, Dict[str, Any]] = {}
+    if args.evolution_source == "chain-list":
+        with stage("fetch evolution chains"):
+            chain_urls = list_evolution_chain_urls(args.sleep)
+            print(f"Fetching {len(chain_urls)} evolution chains...")
+            species_chain_index = build_species_chain_index(
+                fetch_all_json(chain_urls, args.sleep, args.workers)
+            )
+        print(f"  Indexed {len(species_chain_index)} species")
+
     # Resolve evolution graph once per evolution chain URL.
     print(f"Resolving evolution chains for {len(pokemon_data)} Pokémon...")
-    for idx, pokemon in enumerate(pokemon_data, 1):
-        species_url = f"{BASE_URL}pokemon-species/{pokemon['id']}"
-        species_payload = get_json(species_url, cache, args.sleep)
-        if species_payload and species_payload.get("evolution_chain", {}).get("url"):
-            chain_url = species_payload["evolution_chain"]["url"]
-            if chain_url not in evolution_graph_cache:
-                chain_payload = get_json(chain_url, cache, args.sleep)
-                if chain_payload:
-                    evolution_graph_cache[chain_url] = build_evolution_graph(chain_payload)
-                else:
-                    evolution_graph_cache[chain_url] = {"nodes": [], "transitions": []}
-            pokemon["evolution_chain"] = evolution_graph_cache[chain_url]
-
-        for move in pokemon.get("moves", []):
-            move_slug = to_slug(move.get("name_en", ""))
-            raw_damage_class = move_damage_cache.get(move_slug)
-            move["damage_class"] = raw_damage_class
-            move["damage_class_en"] = raw_damage_class.replace("-", " ").title() if raw_damage_class else None
-
-        if idx % 100 == 0 or idx == len(pokemon_data):
-            print(f"  {idx}/{len(pokemon_data)} Pokémon processed")
-
-    with open(args.output, "w", encoding="utf-8") as fh:
+    with stage("apply"):
+        for idx, pokemon in enumerate(pokemon_data, 1):
+            if pokemon["id"] in species_chain_index:
+                pokemon["evolution_chain"] = species_chain_index[pokemon["id"]]
+            else:
+                species_url = f"{BASE_URL}pokemon-species/{pokemon['id']}"
+                species_payload = get_json(species_url, args.sleep)
+                if species_payload and species_payload.get("evolution_chain", {}).get("url"):
+                    chain_url = species_payload["evolution_chain"]["url"]
+                    if chain_url not in evolution_graph_cache:
+                        chain_payload = get_json(chain_url, args.sleep)
+                        if chain_payload:
+                            evolution_graph_cache[chain_url] = build_evolution_graph(chain_payload)
+                        else:
+                            evolution_graph_cache[chain_url] = {"nodes": [], "transitions": []}
+                    pokemon["evolution_chain"] = evolution_graph_cache[chain_url]
+
+            for move in pokemon.get("moves", []):
+                move_slug = to_slug(move.get("name_en", ""))
+                raw_damage_class = move_damage_cache.get(move_slug)
+                move["damage_class"] = raw_damage_class
+                move["damage_class_en"] = (raw_damage_class.replace("-", " ").title()
+                                           if raw_damage_class else None)
+
+            if idx % 100 == 0 or idx == len(pokemon_data):
+                print(f"  {idx}/{len(pokemon_data)} Pokémon processed")
+
+    with stage("save"), open(args.output, "w", encoding="utf-8") as fh:
         json.dump(pokemon_data, fh, ensure_ascii=False, indent=2)
 
     print(f"Done. Wrote enriched data to {args.output}")
-    print(f"Evolution chains cached: {len(evolution_graph_cache)}")
+    indexed_chains = {id(graph) for graph in species_chain_index.values()}
+    chains_resolved = len(evolution_graph_cache) + len(indexed_chains)
+    print(f"Evolution chains cached: {chains_resolved}")
+    print(f"API payloads used: {len(pokeapi_fetch.payload_cache)}")
+    for line in metrics.summary_lines():
+        print(line)
+    metrics.write(args.metrics_json, args.metrics_prom)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Enrich pokedex_data.json with Milestone 3 metadata")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--output", default="pokedex_data.json", help="Output JSON file")
+    parser.add_argument("--sleep", type=float, default=0.0, help="Sleep time between API calls")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent API requests")
+    parser.add_argument("--rate-limit", type=int, default=100,
+                        help="Maximum API calls per minute (default: 100)")
+    parser.add_argument("--cache-dir",
+                        help="PokeAPI payload cache shared with pokeapi_fetch.py --cache-dir; "
+                             "reruns reuse it instead of refetching")
+    parser.add_argument(
+        "--evolution-source",
+        choices=["chain-list", "species"],
+        default="chain-list",
+        help="Resolve chains from the evolution-chain list (~540 requests) or per species "
+             "(default: chain-list)"
+    )
+    parser.add_argument("--metrics-json",
+                        help="Write per-endpoint request metrics as JSON to this path")
+    parser.add_argument("--metrics-prom",
+                        help="Write request metrics in Prometheus text format to this path")
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+    pokeapi_fetch.rate_limiter.calls_per_minute = args.rate_limit
+    if args.cache_dir:
+        os.makedirs(args.cache_dir, exist_ok=True)
+        pokeapi_fetch.payload_cache_dir = args.cache_dir
+
+    with RunProfiler.from_args(args, "enrich_pokedex_data"):
+        enrich(args)
 
 
 if __name__ == "__main__":
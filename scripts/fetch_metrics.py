@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Transport metrics for the PokeAPI fetch scripts.
+
+Records every request made by pokeapi_fetch.get_data and
+enrich_pokedex_data.get_json, grouped by endpoint kind (the first path
+segment, e.g. `pokemon-species`): request count, latency percentiles,
+response bytes, cache hits, retries, time spent sleeping versus waiting on
+I/O, throughput over time and, when the adaptive controller is used, the
+concurrency limit over time. The report can be written as JSON and in
+the Prometheus text exposition format (for node_exporter's textfile
+collector or a quick diff between runs).
+"""
+
+import json
+import math
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+# Width of each throughput bucket in the report
+THROUGHPUT_BUCKET_SECONDS: int = 10
+LATENCY_QUANTILES: List[float] = [0.5, 0.95, 0.99]
+
+
+def endpoint_kind(endpoint: str) -> str:
+    """Return the resource kind of an endpoint or full PokeAPI URL.
+
+    Args:
+        endpoint: e.g. `pokemon/25`, `move?limit=1` or `https://pokeapi.co/api/v2/type/3/`
+
+    Returns:
+        First path segment after the API root (e.g. `pokemon`)
+    """
+    path = urlparse(endpoint).path if "://" in endpoint else endpoint.split("?", 1)[0]
+    if "/api/v2/" in path:
+        path = path.split("/api/v2/", 1)[1]
+    return path.strip("/").split("/", 1)[0] or "root"
+
+
+def percentile(sorted_values: List[float], quantile: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(quantile * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class FetchMetrics:
+    """Thread-safe request metrics, keyed by endpoint kind."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.requests: Dict[str, int] = defaultdict(int)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.bytes: Dict[str, int] = defaultdict(int)
+        self.cache_hits: Dict[str, int] = defaultdict(int)
+        self.retries: Dict[str, int] = defaultdict(int)
+        self.sleep_seconds: Dict[str, float] = defaultdict(float)
+        # bucket -> [requests, bytes]
+        self.timeline: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+        self.concurrency: List[Dict[str, Any]] = []
+
+    def record_request(self, kind: str, latency: float, size: int = 0, ok: bool = True) -> None:
+        """Record one network request.
+
+        Args:
+            kind: Endpoint kind (see endpoint_kind)
+            latency: Seconds from send to parsed response
+            size: Response body size in bytes
+            ok: False if the request failed
+        """
+        bucket = int((time.monotonic() - self.started) // THROUGHPUT_BUCKET_SECONDS)
+        with self._lock:
+            self.requests[kind] += 1
+            self.latencies[kind].append(latency)
+            self.bytes[kind] += size
+            if not ok:
+                self.errors[kind] += 1
+            self.timeline[bucket][0] += 1
+            self.timeline[bucket][1] += size
+
+    def record_cache_hit(self, kind: str) -> None:
+        """Record a payload served without a request."""
+        with self._lock:
+            self.cache_hits[kind] += 1
+
+    def record_retry(self, kind: str) -> None:
+        """Record a request that is being retried."""
+        with self._lock:
+            self.retries[kind] += 1
+
+    def record_sleep(self, reason: str, seconds: float) -> None:
+        """Record time spent deliberately not making requests.
+
+        Args:
+            reason: e.g. `rate_limit` (waiting on the limiter) or `throttle` (--sleep)
+            seconds: Time slept
+        """
+        if seconds > 0:
+            with self._lock:
+                self.sleep_seconds[reason] += seconds
+
+    def record_concurrency(self, limit: int, reason: str) -> None:
+        """Record a change of the adaptive concurrency limit.
+
+        Args:
+            limit: New in-flight request limit
+            reason: What caused the change (`initial`, `healthy`, `errors`, `latency`)
+        """
+        with self._lock:
+            self.concurrency.append({
+                "at_seconds": round(time.monotonic() - self.started, 3),
+                "limit": limit,
+                "reason": reason
+            })
+
+    def report(self) -> Dict[str, Any]:
+        """Build the JSON-serializable report.
+
+        Returns:
+            Dictionary with `totals`, per-kind `endpoints`, `throughput` and
+            `concurrency` (limit changes; empty without the adaptive controller)
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            endpoints = {}
+            for kind in sorted(set(self.requests) | set(self.cache_hits)):
+                latencies = sorted(self.latencies[kind])
+                lookups = self.requests[kind] + self.cache_hits[kind]
+                endpoints[kind] = {
+                    "requests": self.requests[kind],
+                    "errors": self.errors[kind],
+                    "retries": self.retries[kind],
+                    "bytes": self.bytes[kind],
+                    "cache_hits": self.cache_hits[kind],
+                    "cache_hit_ratio": (round(self.cache_hits[kind] / lookups, 4)
+                                        if lookups else 0.0),
+                    "io_seconds": round(sum(latencies), 3),
+                    "latency_seconds": {
+                        f"p{round(q * 100)}": round(percentile(latencies, q), 4)
+                        for q in LATENCY_QUANTILES
+                    }
+                }
+            all_latencies = sorted(value for values in self.latencies.values() for value in values)
+            requests = sum(self.requests.values())
+            hits = sum(self.cache_hits.values())
+            throughput = [
+                {
+                    "start_seconds": bucket * THROUGHPUT_BUCKET_SECONDS,
+                    "requests": counts[0],
+                    "requests_per_second": round(counts[0] / THROUGHPUT_BUCKET_SECONDS, 2),
+                    "bytes": counts[1]
+                }
+                for bucket, counts in sorted(self.timeline.items())
+            ]
+            return {
+                "totals": {
+                    "elapsed_seconds": round(elapsed, 3),
+                    "requests": requests,
+                    "errors": sum(self.errors.values()),
+                    "retries": sum(self.retries.values()),
+                    "bytes": sum(self.bytes.values()),
+                    "cache_hits": hits,
+                    "cache_hit_ratio": (round(hits / (requests + hits), 4)
+                                        if requests + hits else 0.0),
+                    # Summed across workers, so both can exceed elapsed time
+                    "io_seconds": round(sum(all_latencies), 3),
+                    "sleep_seconds": {reason: round(seconds, 3)
+                                      for reason, seconds in self.sleep_seconds.items()},
+                    "requests_per_second": round(requests / elapsed, 2) if elapsed > 0 else 0.0,
+                    "latency_seconds": {
+                        f"p{round(q * 100)}": round(percentile(all_latencies, q), 4)
+                        for q in LATENCY_QUANTILES
+                    }
+                },
+                "endpoints": endpoints,
+                "throughput": throughput,
+                "concurrency": list(self.concurrency)
+            }
+
+    def to_prometheus(self, prefix: str = "pokeapi") -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Text suitable for a `.prom` file
+        """
+        report = self.report()
+        lines: List[str] = []
+
+        def metric(name: str, metric_type: str, help_text: str, samples: List[str]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            lines.extend(f"{prefix}_{name}{sample}" for sample in samples)
+
+        endpoints = report["endpoints"]
+        metric("requests_total", "counter", "Requests sent, by endpoint kind.",
+               [f'{{kind="{kind}"}} {data["requests"]}' for kind, data in endpoints.items()])
+        metric("request_errors_total", "counter", "Failed requests, by endpoint kind.",
+               [f'{{kind="{kind}"}} {data["errors"]}' for kind, data in endpoints.items()])
+        metric("request_retries_total", "counter", "Retried requests, by endpoint kind.",
+               [f'{{kind="{kind}"}} {data["retries"]}' for kind, data in endpoints.items()])
+        metric("response_bytes_total", "counter", "Response body bytes, by endpoint kind.",
+               [f'{{kind="{kind}"}} {data["bytes"]}' for kind, data in endpoints.items()])
+        metric("cache_hits_total", "counter", "Payloads served from cache, by endpoint kind.",
+               [f'{{kind="{kind}"}} {data["cache_hits"]}' for kind, data in endpoints.items()])
+
+        samples = []
+        for kind, data in endpoints.items():
+            for q in LATENCY_QUANTILES:
+                samples.append(f'{{kind="{kind}",quantile="{q}"}} '
+                               f'{data["latency_seconds"][f"p{round(q * 100)}"]}')
+            samples.append(f'_sum{{kind="{kind}"}} {data["io_seconds"]}')
+            samples.append(f'_count{{kind="{kind}"}} {data["requests"]}')
+        metric("request_duration_seconds", "summary", "Request latency, by endpoint kind.", samples)
+
+        metric("sleep_seconds_total", "counter",
+               "Time spent sleeping instead of requesting, by reason.",
+               [f'{{reason="{reason}"}} {seconds}'
+                for reason, seconds in report["totals"]["sleep_seconds"].items()])
+        if report["concurrency"]:
+            metric("concurrency_limit", "gauge", "Current adaptive in-flight request limit.",
+                   [f' {report["concurrency"][-1]["limit"]}'])
+        metric("run_duration_seconds", "gauge", "Wall time covered by these metrics.",
+               [f' {report["totals"]["elapsed_seconds"]}'])
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_path: Optional[str] = None, prometheus_path: Optional[str] = None) -> None:
+        """Write the JSON report and/or Prometheus text file (parents are created).
+
+        Args:
+            json_path: Destination for report() as JSON
+            prometheus_path: Destination for to_prometheus()
+        """
+        if json_path:
+            Path(json_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(json_path, "w", encoding="utf-8") as fh:
+                json.dump(self.report(), fh, indent=2)
+        if prometheus_path:
+            Path(prometheus_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(prometheus_path, "w", encoding="utf-8") as fh:
+                fh.write(self.to_prometheus())
+
+    def summary_lines(self) -> List[str]:
+        """Short human-readable summary, one line per endpoint kind."""
+        report = self.report()
+        totals = report["totals"]
+        lines = [
+            f"{totals['requests']} requests ({totals['errors']} failed, "
+            f"{totals['retries']} retried), {totals['bytes'] / 1024 / 1024:.1f} MB, "
+            f"cache hit ratio {totals['cache_hit_ratio']:.0%}, "
+            f"{totals['requests_per_second']} req/s"
+        ]
+        for kind, data in report["endpoints"].items():
+            latency = data["latency_seconds"]
+            lines.append(f"  {kind:<18} {data['requests']:>6} req  "
+                         f"p50 {latency['p50'] * 1000:.0f} ms  "
+                         f"p95 {latency['p95'] * 1000:.0f} ms  "
+                         f"p99 {latency['p99'] * 1000:.0f} ms")
+        sleep = ", ".join(f"{reason} {seconds:.1f}s"
+                          for reason, seconds in totals["sleep_seconds"].items())
+        lines.append(f"  I/O wait {totals['io_seconds']:.1f}s"
+                     + (f", sleeping: {sleep}" if sleep else ""))
+        if report["concurrency"]:
+            limits = [change["limit"] for change in report["concurrency"]]
+            lines.append(f"  concurrency limit {limits[-1]} (range {min(limits)}-{max(limits)}, "
+                         f"{len(limits) - 1} changes)")
+        return lines
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Build a manifest for the cry audio files and optional per-generation packs.
+
+Hashes every file in assets/pokemon/cries/latest/, groups byte-identical
+cries, and records size, hash and owning Pokémon for each ID. With --packs
+it also concatenates each generation's cries into a single binary pack with
+a byte-offset index, so a client can prefetch a whole generation in one
+request and slice individual cries out with Range requests or Blob.slice().
+"""
+
+import argparse
+import hashlib
+import logging
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from build_utils import file_sha256, get_generation, load_pokedex_data, write_json
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+CRIES_DIR: str = "assets/pokemon/cries/latest"
+
+
+def scan_cries(cries_dir: str, names: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+    """Hash every cry file and group duplicates.
+
+    The first ID (lowest) with a given hash is the canonical owner; later
+    IDs with the same bytes get `duplicate_of` pointing at it.
+
+    Args:
+        cries_dir: Directory containing `<id>.ogg` files
+        names: Optional mapping of Pokémon ID to English name
+
+    Returns:
+        Manifest dictionary with `cries`, `duplicates` and `totals`
+    """
+    names = names or {}
+    files = sorted(Path(cries_dir).glob("*.ogg"), key=lambda p: int(p.stem))
+
+    cries: Dict[str, Dict[str, Any]] = {}
+    owners: Dict[str, int] = {}
+    duplicate_groups: Dict[str, List[int]] = defaultdict(list)
+    total_bytes = 0
+    duplicate_bytes = 0
+
+    for path in files:
+        pokemon_id = int(path.stem)
+        size = path.stat().st_size
+        digest = file_sha256(str(path))
+        total_bytes += size
+
+        entry = {
+            "file": path.name,
+            "size": size,
+            "sha256": digest,
+            "name": names.get(pokemon_id),
+            "generation": get_generation(pokemon_id)
+        }
+        if digest in owners:
+            entry["duplicate_of"] = owners[digest]
+            duplicate_groups[digest].append(pokemon_id)
+            duplicate_bytes += size
+        else:
+            owners[digest] = pokemon_id
+            duplicate_groups[digest].append(pokemon_id)
+        cries[str(pokemon_id)] = entry
+
+    duplicates = [ids for ids in duplicate_groups.values() if len(ids) > 1]
+    return {
+        "cries": cries,
+        "duplicates": duplicates,
+        "totals": {
+            "files": len(files),
+            "unique": len(owners),
+            "bytes": total_bytes,
+            "duplicate_bytes": duplicate_bytes
+        }
+    }
+
+
+def build_packs(manifest: Dict[str, Any], cries_dir: str, packs_dir: str) -> Dict[str, Any]:
+    """Concatenate cries into one pack per generation.
+
+    Duplicate cries are stored once per pack; every ID still gets an index
+    entry pointing at the shared bytes. Forms (IDs without a generation) go
+    into a `forms` pack.
+
+    Args:
+        manifest: Output of scan_cries()
+        cries_dir: Directory containing the source `.ogg` files
+        packs_dir: Directory the packs are written to
+
+    Returns:
+        Mapping of pack name to {file, size, sha256, index: {id: [offset, length]}}
+    """
+    out_path = Path(packs_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for pokemon_id, entry in manifest["cries"].items():
+        generation = entry["generation"]
+        groups[f"gen{generation}" if generation else "forms"].append(pokemon_id)
+
+    packs: Dict[str, Any] = {}
+    for pack_name in sorted(groups):
+        blob = bytearray()
+        index: Dict[str, List[int]] = {}
+        offsets_by_hash: Dict[str, List[int]] = {}
+
+        for pokemon_id in sorted(groups[pack_name], key=int):
+            entry = manifest["cries"][pokemon_id]
+            if entry["sha256"] not in offsets_by_hash:
+                data = (Path(cries_dir) / entry["file"]).read_bytes()
+                offsets_by_hash[entry["sha256"]] = [len(blob), len(data)]
+                blob.extend(data)
+            index[pokemon_id] = offsets_by_hash[entry["sha256"]]
+
+        digest = hashlib.sha256(blob).hexdigest()
+        for stale in out_path.glob(f"{pack_name}.*.bin"):
+            stale.unlink()
+        pack_file = out_path / f"{pack_name}.{digest[:8]}.bin"
+        pack_file.write_bytes(blob)
+
+        packs[pack_name] = {
+            "file": pack_file.as_posix(),
+            "size": len(blob),
+            "sha256": digest,
+            "index": index
+        }
+        logger.info(f"Wrote {pack_file} ({len(index)} cries, {len(blob) / 1024:.0f} KB)")
+
+    return packs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Hash cry audio files and build prefetch packs")
+    parser.add_argument("--cries-dir", default=CRIES_DIR, help="Directory of <id>.ogg files")
+    parser.add_argument("--data", default="pokedex_data.json",
+                        help="Dataset used to label owners (optional)")
+    parser.add_argument("--output", default=f"{CRIES_DIR}/manifest.json", help="Manifest output")
+    parser.add_argument("--packs", action="store_true", help="Also build per-generation packs")
+    parser.add_argument("--packs-dir", default="assets/pokemon/cries/packs",
+                        help="Directory for generation packs")
+    args = parser.parse_args()
+
+    if not Path(args.cries_dir).is_dir():
+        logger.error(f"❌ {args.cries_dir} not found")
+        return 1
+
+    names: Dict[int, str] = {}
+    if Path(args.data).exists():
+        names = {p["id"]: p.get("name_en") for p in load_pokedex_data(args.data)}
+    else:
+        logger.warning(f"{args.data} not found; manifest will not include Pokémon names")
+
+    manifest = scan_cries(args.cries_dir, names)
+    if args.packs:
+        manifest["packs"] = build_packs(manifest, args.cries_dir, args.packs_dir)
+
+    write_json(args.output, manifest, compact=True)
+
+    totals = manifest["totals"]
+    logger.info(f"✅ {totals['files']} cries hashed, {totals['unique']} unique "
+                f"({len(manifest['duplicates'])} duplicate groups, "
+                f"{totals['duplicate_bytes'] / 1024:.0f} KB reclaimable)")
+    logger.info(f"   Manifest: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Diff two versions of pokedex_data.json and write a JSON-Patch delta feed.
+
+Records are matched by Pokémon ID and compared field by field, so a changed
+stat produces one `replace` at `/25/stats/attack` instead of a new 2.9 MB
+file. Patches (RFC 6902) target the dataset keyed by ID as a string
+(`{"25": {...}}`), which is how a client holding a cached copy can look
+records up; list values (types, moves, ...) are replaced as a whole.
+
+Each run writes assets/data/deltas/<from>-<to>.json and records it in
+assets/data/deltas/manifest.json, which lists the current version and the
+delta chain. A client on an older version applies the deltas from its
+version forward and falls back to a full download when its version is not
+in the chain.
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from build_utils import load_pokedex_data, write_json
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+DELTAS_DIR: str = "assets/data/deltas"
+VERSION_LENGTH: int = 16
+
+
+def dataset_version(pokemon_data: List[Dict[str, Any]]) -> str:
+    """Content version of a dataset, independent of file formatting."""
+    canonical = json.dumps(pokemon_data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:VERSION_LENGTH]
+
+
+def escape_pointer(token: Any) -> str:
+    """Escape one JSON Pointer reference token (RFC 6901)."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def diff_values(old: Any, new: Any, path: str, ops: List[Dict[str, Any]]) -> None:
+    """Append the operations turning `old` into `new` at `path`.
+
+    Objects are compared key by key; anything else (including lists) is
+    replaced whole when it differs.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{escape_pointer(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                diff_values(old[key], value, child, ops)
+    elif old != new or type(old) is not type(new):
+        ops.append({"op": "replace", "path": path, "value": new})
+
+
+def diff_datasets(old_data: List[Dict[str, Any]],
+                  new_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keyed structural diff of two datasets as JSON-Patch operations.
+
+    Args:
+        old_data: Previous pokedex_data.json contents
+        new_data: Current pokedex_data.json contents
+
+    Returns:
+        Operations against the datasets keyed by ID
+    """
+    old_by_id = {str(p["id"]): p for p in old_data}
+    new_by_id = {str(p["id"]): p for p in new_data}
+    ops: List[Dict[str, Any]] = []
+    for pokemon_id in old_by_id:
+        if pokemon_id not in new_by_id:
+            ops.append({"op": "remove", "path": f"/{pokemon_id}"})
+    for pokemon_id, record in new_by_id.items():
+        if pokemon_id not in old_by_id:
+            ops.append({"op": "add", "path": f"/{pokemon_id}", "value": record})
+        else:
+            diff_values(old_by_id[pokemon_id], record, f"/{pokemon_id}", ops)
+    return ops
+
+
+def apply_patch(keyed_data: Dict[str, Any], ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply add/remove/replace operations to a copy of a keyed dataset.
+
+    Args:
+        keyed_data: Dataset keyed by ID string
+        ops: Output of diff_datasets()
+
+    Returns:
+        Patched copy
+    """
+    result = copy.deepcopy(keyed_data)
+    for op in ops:
+        tokens = [token.replace("~1", "/").replace("~0", "~")
+                  for token in op["path"].split("/")[1:]]
+        parent = result
+        for token in tokens[:-1]:
+            parent = parent[token]
+        if op["op"] == "remove":
+            del parent[tokens[-1]]
+        else:
+            parent[tokens[-1]] = copy.deepcopy(op["value"])
+    return result
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    """Load the delta manifest, or start an empty one."""
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    return {"current": None, "deltas": []}
+
+
+def update_manifest(manifest: Dict[str, Any], entry: Dict[str, Any], full_size: int,
+                    keep: int) -> Dict[str, Any]:
+    """Append a delta, drop those beyond `keep`, and mark the new current version.
+
+    Args:
+        manifest: Output of load_manifest()
+        entry: {from, to, file, operations, size}
+        full_size: Size of the full dataset in bytes (client fallback threshold)
+        keep: Number of most recent deltas to list
+
+    Returns:
+        Updated manifest
+    """
+    deltas = [d for d in manifest.get("deltas", []) if d["from"] != entry["from"]] + [entry]
+    return {
+        "current": entry["to"],
+        "full_size": full_size,
+        "deltas": deltas[-keep:]
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Write a JSON-Patch delta between two dataset versions")
+    parser.add_argument("--old", required=True, help="Previous pokedex_data.json")
+    parser.add_argument("--new", default="pokedex_data.json", help="Current pokedex_data.json")
+    parser.add_argument("--output-dir", default=DELTAS_DIR,
+                        help="Directory for deltas and manifest.json")
+    parser.add_argument("--keep", type=int, default=20,
+                        help="Number of deltas kept in the manifest")
+    parser.add_argument("--force", action="store_true",
+                        help="Write the delta even if --old is not the manifest's current version")
+    args = parser.parse_args()
+
+    old_data = load_pokedex_data(args.old)
+    new_data = load_pokedex_data(args.new)
+    old_version = dataset_version(old_data)
+    new_version = dataset_version(new_data)
+    if old_version == new_version:
+        logger.info(f"✅ Datasets are identical (version {new_version}); nothing to write")
+        return 0
+
+    output_dir = Path(args.output_dir)
+    manifest_path = output_dir / "manifest.json"
+    manifest = load_manifest(manifest_path)
+    current = manifest.get("current")
+    if current is not None and current != old_version:
+        # Clients on `current` could not reach the new version through the chain
+        message = (f"--old is version {old_version}, but the manifest's current version "
+                   f"is {current}; the delta chain would have a gap")
+        if not args.force:
+            logger.error(f"❌ {message} "
+                         f"(pass --old with the dataset published as {current}, or --force)")
+            return 1
+        logger.warning(f"⚠️ {message}")
+
+    ops = diff_datasets(old_data, new_data)
+    patched = apply_patch({str(p["id"]): p for p in old_data}, ops)
+    if patched != {str(p["id"]): p for p in new_data}:
+        logger.error("❌ Patch does not reproduce the new dataset")
+        return 1
+
+    delta_file = output_dir / f"{old_version}-{new_version}.json"
+    write_json(str(delta_file), {"from": old_version, "to": new_version, "patch": ops},
+               compact=True)
+
+    entry = {
+        "from": old_version,
+        "to": new_version,
+        "file": delta_file.name,
+        "operations": len(ops),
+        "size": delta_file.stat().st_size
+    }
+    full_size = Path(args.new).stat().st_size
+    manifest = update_manifest(manifest, entry, full_size, args.keep)
+    write_json(str(manifest_path), manifest)
+
+    listed = {d["file"] for d in manifest["deltas"]}
+    for stale in output_dir.glob("*-*.json"):
+        if stale.name not in listed:
+            stale.unlink()
+
+    changed = len({op["path"].split("/")[1] for op in ops})
+    logger.info(f"✅ {old_version} -> {new_version}: {len(ops)} operations "
+                f"across {changed} Pokémon, {entry['size'] / 1024:.1f} KB "
+                f"(full dataset {full_size / 1024:.0f} KB)")
+    logger.info(f"   Delta: {delta_file}")
+    logger.info(f"   Manifest: {manifest_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
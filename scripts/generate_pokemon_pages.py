@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Prerender one static HTML page per Pokémon from pokedex_data.json.
+
+Each page lives at /pokemon/{id}/{slug}/ and carries only that Pokémon's
+data: the visible summary (names, sprite, types, bio, base stats), the
+JSON-LD blocks the app injects at runtime (same shape as
+assets/js/utils/structuredData.js, with the page's real URL), and the
+record itself as inline JSON. Crawlers and deep links get a complete
+document without downloading the full dataset or running the app.
+
+The page template is compiled once into literal and field parts, so a
+page render is one join over pre-escaped values. Pages are rendered and
+written in chunks across a process pool; files whose content is unchanged
+are not rewritten, and pages of IDs/slugs no longer in the dataset are
+removed. pokemon/manifest.json, listing every page, is written last, so
+it exists only for a complete tree (build_pipeline.py tracks it).
+
+    python scripts/generate_pokemon_pages.py
+    python scripts/generate_pokemon_pages.py --input .build/pokedex.json --output-dir dist
+"""
+
+import argparse
+import html
+import json
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from build_utils import SITE_URL, load_pokedex_data, pokemon_page_path, pokemon_slug, write_json
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+PAGE_DIR: str = "pokemon"
+PAGE_MANIFEST: str = f"{PAGE_DIR}/manifest.json"
+DEFAULT_CHUNK_SIZE: int = 64
+
+# (dataset key, label) in display order; the first three also go into JSON-LD like the app
+STAT_LABELS: List[Tuple[str, str]] = [
+    ("hp", "HP"),
+    ("attack", "Attack"),
+    ("defense", "Defense"),
+    ("special-attack", "Sp. Atk"),
+    ("special-defense", "Sp. Def"),
+    ("speed", "Speed"),
+]
+
+# Pages run no scripts; JSON-LD and the inline record are data blocks
+CONTENT_SECURITY_POLICY: str = "; ".join([
+    "default-src 'self'",
+    "script-src 'self'",
+    "style-src 'self' 'unsafe-inline'",
+    "img-src 'self' https://raw.githubusercontent.com https://cdn.jsdelivr.net data:",
+    "object-src 'none'",
+    "base-uri 'self'",
+])
+
+PAGE_TEMPLATE: str = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta http-equiv="Content-Security-Policy" content="{{content_security_policy}}">
+    <meta name="theme-color" content="#ff3b30">
+    <title>{{title}}</title>
+    <meta name="description" content="{{description}}">
+    <link rel="canonical" href="{{url}}">
+    <meta property="og:type" content="website">
+    <meta property="og:title" content="{{title}}">
+    <meta property="og:description" content="{{description}}">
+    <meta property="og:url" content="{{url}}">
+    <meta property="og:image" content="{{image}}">
+    <link rel="icon" href="/assets/Poke_Ball_icon.png" type="image/png">
+    <style>
+        body {
+            font-family: system-ui, sans-serif;
+            margin: 0 auto; max-width: 40rem; padding: 1rem; color: #222;
+        }
+        header a { color: #ff3b30; font-weight: bold; text-decoration: none; }
+        h1 small { color: #666; font-weight: normal; }
+        .type {
+            display: inline-block; padding: 0.1rem 0.6rem; border-radius: 1rem; background: #eee;
+        }
+        table { border-collapse: collapse; }
+        th { text-align: left; padding-right: 1rem; }
+        nav { display: flex; justify-content: space-between; margin-top: 2rem; }
+    </style>
+    <script type="application/ld+json" id="pokemon-structured-data">{{pokemon_schema}}</script>
+    <script type="application/ld+json"
+            id="breadcrumb-structured-data">{{breadcrumb_schema}}</script>
+</head>
+<body>
+    <header><a href="/">Pokédex</a></header>
+    <main>
+        <h1>{{name}} <small>#{{number}}</small></h1>
+        <p lang="ja">{{name_jp}}</p>
+        <img src="{{image}}" alt="{{name}}" width="192" height="192">
+        <p>{{types}}</p>
+        <p><strong>{{genus}}</strong></p>
+        <p>{{bio}}</p>
+        <table>
+            <caption>Base stats</caption>
+{{stat_rows}}
+        </table>
+        <p>Height: {{height}} m · Weight: {{weight}} kg</p>
+        <p>Abilities: {{abilities}}</p>
+        <p><a href="{{app_url}}">Open {{name}} in the interactive Pokédex</a></p>
+        <nav>{{previous_link}}{{next_link}}</nav>
+    </main>
+    <script type="application/json" id="pokemon-data">{{data}}</script>
+</body>
+</html>
+"""
+
+
+class PageTemplate:
+    """A `{{field}}` template split once into literal and field parts."""
+
+    PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+    def __init__(self, text: str):
+        parts = self.PLACEHOLDER.split(text)
+        self.literals = parts[0::2]
+        self.fields = parts[1::2]
+
+    def render(self, values: Dict[str, str]) -> str:
+        """Fill every field; values must already be escaped for their context.
+
+        Raises:
+            KeyError: If a field has no value
+        """
+        output = [self.literals[0]]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            output.append(values[field])
+            output.append(literal)
+        return "".join(output)
+
+
+TEMPLATE = PageTemplate(PAGE_TEMPLATE)
+
+
+def inline_json(payload: Any) -> str:
+    """JSON safe to embed in a <script> element (no `<` can close it)."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).replace("<", "\\u003c")
+
+
+def page_url(pokemon: Dict[str, Any]) -> str:
+    """Absolute canonical URL of a Pokémon's page."""
+    return f"{SITE_URL}/{pokemon_page_path(pokemon)}"
+
+
+def image_url(pokemon: Dict[str, Any]) -> Optional[str]:
+    """Absolute sprite URL (relative sprites are resolved against the site)."""
+    sprite = pokemon.get("sprite")
+    if not sprite:
+        return None
+    return sprite if "://" in sprite else f"{SITE_URL}/{sprite.lstrip('/')}"
+
+
+def pokemon_schema(pokemon: Dict[str, Any]) -> Dict[str, Any]:
+    """Thing schema as built by StructuredDataGenerator.generatePokemonSchema (English)."""
+    name = pokemon["name_en"]
+    types = pokemon.get("types_en") or []
+    stats = pokemon.get("stats") or {}
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "Thing",
+        "name": name,
+        "identifier": pokemon["id"],
+        "description": pokemon.get("bio_en") or f"{name} is a {'/'.join(types)} type Pokémon.",
+        "url": page_url(pokemon),
+        "image": image_url(pokemon),
+        "additionalProperty": [
+            {"@type": "PropertyValue", "name": "National Pokédex Number", "value": pokemon["id"]},
+            {"@type": "PropertyValue", "name": "Type", "value": ", ".join(types)},
+        ] + [
+            {"@type": "PropertyValue", "name": label, "value": stats.get(key) or 0}
+            for key, label in STAT_LABELS[:3]
+        ]
+    }
+    if schema["image"] is None:
+        del schema["image"]
+    return schema
+
+
+def breadcrumb_schema(pokemon: Dict[str, Any]) -> Dict[str, Any]:
+    """BreadcrumbList as built by StructuredDataGenerator.generateBreadcrumbSchema."""
+    return {
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": 1, "name": "Home", "item": f"{SITE_URL}/"},
+            {"@type": "ListItem", "position": 2, "name": pokemon["name_en"],
+             "item": page_url(pokemon)}
+        ]
+    }
+
+
+def neighbor_link(neighbor: Optional[Tuple[int, str]], rel: str) -> str:
+    """Link to the previous/next page, or nothing at either end of the dex."""
+    if neighbor is None:
+        return ""
+    pokemon_id, name = neighbor
+    path = pokemon_page_path({"id": pokemon_id, "name_en": name})
+    label = f"← #{pokemon_id} {name}" if rel == "prev" else f"#{pokemon_id} {name} →"
+    return f'<a rel="{rel}" href="/{path}">{html.escape(label)}</a>'
+
+
+def render_page(pokemon: Dict[str, Any], previous: Optional[Tuple[int, str]] = None,
+                following: Optional[Tuple[int, str]] = None) -> str:
+    """Render one Pokémon's page.
+
+    Args:
+        pokemon: Dataset record (needs at least `id` and `name_en`)
+        previous: (id, name_en) of the preceding Pokémon
+        following: (id, name_en) of the next Pokémon
+
+    Returns:
+        Complete HTML document
+    """
+    name = pokemon["name_en"]
+    types = pokemon.get("types_en") or []
+    stats = pokemon.get("stats") or {}
+    bio = pokemon.get("bio_en") or f"{name} is a {'/'.join(types)} type Pokémon."
+    description = f"#{pokemon['id']} {name}: {'/'.join(types)} type Pokémon. {bio}"
+    abilities = [ability["name_en"] + (" (hidden)" if ability.get("is_hidden") else "")
+                 for ability in pokemon.get("abilities") or []]
+    stat_rows = "\n".join(f"            <tr><th>{label}</th><td>{stats.get(key, '?')}</td></tr>"
+                          for key, label in STAT_LABELS)
+
+    return TEMPLATE.render({
+        "content_security_policy": CONTENT_SECURITY_POLICY,
+        "title": html.escape(f"{name} #{pokemon['id']} - Pokédex"),
+        "description": html.escape(" ".join(description.split())),
+        "url": html.escape(page_url(pokemon)),
+        "image": html.escape(image_url(pokemon) or ""),
+        "pokemon_schema": inline_json(pokemon_schema(pokemon)),
+        "breadcrumb_schema": inline_json(breadcrumb_schema(pokemon)),
+        "name": html.escape(name),
+        "number": str(pokemon["id"]),
+        "name_jp": html.escape(pokemon.get("name_jp") or ""),
+        "types": " ".join(f'<span class="type type-{pokemon_slug(type_name)}">'
+                          f'{html.escape(type_name)}</span>'
+                          for type_name in types),
+        "genus": html.escape(pokemon.get("genus_en") or ""),
+        "bio": html.escape(bio),
+        "stat_rows": stat_rows,
+        "height": html.escape(str(pokemon.get("height", "?"))),
+        "weight": html.escape(str(pokemon.get("weight", "?"))),
+        "abilities": html.escape(", ".join(abilities) or "Unknown"),
+        "app_url": html.escape(f"/#pokemon/{pokemon['id']}/{pokemon_slug(name)}"),
+        "previous_link": neighbor_link(previous, "prev"),
+        "next_link": neighbor_link(following, "next"),
+        "data": inline_json(pokemon),
+    })
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write a file unless it already has exactly this content.
+
+    Returns:
+        True if the file was written
+    """
+    encoded = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(encoded) and path.read_bytes() == encoded:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encoded)
+    return True
+
+
+PageJob = Tuple[Dict[str, Any], Optional[Tuple[int, str]], Optional[Tuple[int, str]]]
+
+
+def render_chunk(jobs: List[PageJob], output_dir: str) -> Tuple[int, int]:
+    """Render and write a chunk of pages (process-pool entry point).
+
+    Returns:
+        (pages written, pages already up to date)
+    """
+    written = 0
+    for pokemon, previous, following in jobs:
+        path = Path(output_dir) / pokemon_page_path(pokemon) / "index.html"
+        written += write_if_changed(path, render_page(pokemon, previous, following))
+    return written, len(jobs) - written
+
+
+def prune_stale_pages(output_dir: str, keep: Set[str]) -> int:
+    """Delete generated pages that are not in `keep`, then their empty directories.
+
+    Args:
+        output_dir: Site root containing PAGE_DIR
+        keep: Page paths (pokemon_page_path) generated this run
+
+    Returns:
+        Number of pages removed
+    """
+    root = Path(output_dir) / PAGE_DIR
+    if not root.is_dir():
+        return 0
+    removed = 0
+    for page in root.glob("*/*/index.html"):
+        if f"{PAGE_DIR}/{page.parent.relative_to(root).as_posix()}/" not in keep:
+            page.unlink()
+            removed += 1
+    for directory in sorted(root.glob("*/*"), reverse=True) + sorted(root.glob("*")):
+        if directory.is_dir() and not any(directory.iterdir()):
+            directory.rmdir()
+    return removed
+
+
+def generate_pages(pokemon_data: List[Dict[str, Any]], output_dir: str = ".",
+                   workers: Optional[int] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, int]:
+    """Render every Pokémon's page in parallel and prune stale ones.
+
+    Args:
+        pokemon_data: Dataset records (entries without id/name_en are skipped)
+        output_dir: Site root; pages go under PAGE_DIR
+        workers: Worker processes (1 renders in-process; default: CPU count)
+        chunk_size: Pages per task
+
+    Returns:
+        Counts of pages rendered, written, unchanged and removed
+    """
+    # Removed up front and rewritten last, so an interrupted run leaves no manifest
+    manifest_path = Path(output_dir) / PAGE_MANIFEST
+    if manifest_path.exists():
+        manifest_path.unlink()
+
+    pokemon_list = sorted((pokemon for pokemon in pokemon_data
+                           if pokemon.get("id") and pokemon.get("name_en")),
+                          key=lambda pokemon: pokemon["id"])
+    neighbors = [(pokemon["id"], pokemon["name_en"]) for pokemon in pokemon_list]
+    jobs: List[PageJob] = [
+        (pokemon, neighbors[index - 1] if index > 0 else None,
+         neighbors[index + 1] if index + 1 < len(neighbors) else None)
+        for index, pokemon in enumerate(pokemon_list)
+    ]
+    chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(render_chunk, chunks, [output_dir] * len(chunks)))
+    else:
+        results = [render_chunk(chunk, output_dir) for chunk in chunks]
+
+    page_paths = [pokemon_page_path(pokemon) for pokemon in pokemon_list]
+    removed = prune_stale_pages(output_dir, set(page_paths))
+    write_json(str(manifest_path), {"count": len(page_paths), "pages": page_paths})
+    return {
+        "pages": len(jobs),
+        "written": sum(written for written, _ in results),
+        "unchanged": sum(unchanged for _, unchanged in results),
+        "removed": removed,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Prerender static per-Pokémon pages from pokedex_data.json")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--output-dir", default=".",
+                        help=f"Site root; pages go under {PAGE_DIR}/ (default: .)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Pages per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+
+    try:
+        pokemon_data = load_pokedex_data(args.input)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"❌ Could not load {args.input}: {e}")
+        return 1
+
+    started = time.perf_counter()
+    counts = generate_pages(pokemon_data, args.output_dir, args.workers, max(1, args.chunk_size))
+    elapsed = time.perf_counter() - started
+    page_dir = os.path.join(args.output_dir, PAGE_DIR)
+    logger.info(f"✅ Rendered {counts['pages']} pages under {page_dir}/ "
+                f"in {elapsed:.2f}s ({counts['written']} written, {counts['unchanged']} unchanged, "
+                f"{counts['removed']} stale removed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Generate precache-manifest.js for service-worker.js.
+
+Hashes every shipped asset and writes a manifest of URL + content revision.
+The service worker caches each file under its revision, so a deploy only
+re-fetches the files whose contents changed and keeps everything else.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from build_utils import file_sha256
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Glob patterns (relative to the site root) for assets to precache.
+# Documents ('/', '/index.html') stay network-first in the worker and are
+# deliberately not listed here.
+PRECACHE_PATTERNS: List[str] = [
+    "manifest.json",
+    "assets/style.css",
+    "assets/Poke_Ball_icon.png",
+    "assets/js/**/*.js",
+    "pokedex_data.json",
+    # Derived artifacts
+    "assets/sprites/atlas/*.png",
+    "assets/sprites/atlas/sprite_atlas.json",
+    "assets/pokemon/cries/latest/manifest.json",
+    "assets/data/*.json",
+]
+
+REVISION_LENGTH: int = 16
+
+
+def collect_entries(root: str, patterns: List[str]) -> List[Dict[str, Any]]:
+    """Hash every file matching the precache patterns.
+
+    Args:
+        root: Site root directory
+        patterns: Glob patterns relative to root
+
+    Returns:
+        Sorted list of {url, revision, size} entries
+    """
+    root_path = Path(root)
+    files = set()
+    for pattern in patterns:
+        matches = [p for p in root_path.glob(pattern) if p.is_file()]
+        if not matches:
+            logger.info(f"No files match {pattern}, skipping")
+        files.update(matches)
+
+    entries = []
+    for path in sorted(files):
+        entries.append({
+            "url": "/" + path.relative_to(root_path).as_posix(),
+            "revision": file_sha256(str(path))[:REVISION_LENGTH],
+            "size": path.stat().st_size
+        })
+    return entries
+
+
+def build_manifest(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap entries with an overall version derived from every revision.
+
+    Args:
+        entries: Output of collect_entries()
+
+    Returns:
+        Manifest dictionary
+    """
+    digest = hashlib.sha256()
+    for entry in entries:
+        digest.update(f"{entry['url']}:{entry['revision']}\n".encode("utf-8"))
+    return {
+        "version": digest.hexdigest()[:REVISION_LENGTH],
+        "entries": entries
+    }
+
+
+def write_manifest_script(manifest: Dict[str, Any], output_path: str) -> None:
+    """Write the manifest as a classic script the worker loads with importScripts().
+
+    Args:
+        manifest: Output of build_manifest()
+        output_path: Destination file
+    """
+    content = (
+        "// AUTO-GENERATED by scripts/generate_precache_manifest.py - DO NOT EDIT\n"
+        f"self.__PRECACHE_MANIFEST = {json.dumps(manifest, indent=2)};\n"
+    )
+    with open(output_path, "w", encoding="utf-8") as fh:
+        fh.write(content)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the service worker precache manifest")
+    parser.add_argument("--root", default=".", help="Site root directory")
+    parser.add_argument("--output", default="precache-manifest.js", help="Output script")
+    args = parser.parse_args()
+
+    entries = collect_entries(args.root, PRECACHE_PATTERNS)
+    if not entries:
+        logger.error("❌ No assets found to precache")
+        return 1
+
+    manifest = build_manifest(entries)
+    write_manifest_script(manifest, args.output)
+
+    total_kb = sum(entry["size"] for entry in entries) / 1024
+    logger.info(f"✅ Wrote {args.output}: {len(entries)} assets, {total_kb:.0f} KB, "
+                f"version {manifest['version']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
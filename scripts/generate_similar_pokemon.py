@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Precompute the most similar Pokémon for every entry.
+
+Each Pokémon becomes a feature vector:
+
+- the six base stats, standardised (z-scores over the dataset)
+- a one-hot vector of its types, scaled by TYPE_WEIGHT
+- log height and log weight, standardised and scaled by SIZE_WEIGHT
+
+and similarity is Euclidean distance between vectors. Exact k-nearest-
+neighbour queries go through per-typing KD-trees (see SimilarityIndex)
+instead of comparing every pair. The top-10 neighbours of every Pokémon
+are written as a compact column-oriented artifact
+(assets/data/similar_pokemon.json) together with the normalisation
+parameters, so a client can build vectors for arbitrary queries the same
+way.
+
+The same index answers ad-hoc queries:
+
+    python scripts/generate_similar_pokemon.py --like 25
+    python scripts/generate_similar_pokemon.py --query types=fire,flying speed=120 attack=110
+"""
+
+import argparse
+import heapq
+import logging
+import math
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from build_utils import load_pokedex_data, write_json
+from generate_type_effectiveness import TYPE_NAMES
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+STAT_KEYS: List[str] = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+SIZE_KEYS: List[str] = ["height", "weight"]
+
+# Relative importance of each feature group (stats are z-scores, weight 1)
+TYPE_WEIGHT: float = 1.5
+SIZE_WEIGHT: float = 0.5
+
+FEATURES: List[str] = STAT_KEYS + [f"type:{name}" for name in TYPE_NAMES] + SIZE_KEYS
+# Position of the type features within a vector
+TYPE_SLICE = slice(len(STAT_KEYS), len(STAT_KEYS) + len(TYPE_NAMES))
+DEFAULT_NEIGHBORS: int = 10
+
+
+class KDTree:
+    """Exact nearest-neighbour search over fixed-length vectors."""
+
+    def __init__(self, points: List[List[float]], indexes: Optional[List[int]] = None,
+                 leaf_size: int = 8):
+        """Build the tree.
+
+        Args:
+            points: Vectors, all of the same length
+            indexes: Positions in `points` to index (default: all)
+            leaf_size: Maximum points in a leaf
+        """
+        self.points = points
+        self.leaf_size = max(1, leaf_size)
+        self.root = self._build(list(range(len(points))) if indexes is None else list(indexes))
+
+    def _build(self, indexes: List[int]) -> Any:
+        """Split on the widest axis at the median; leaves are lists of indexes."""
+        if len(indexes) <= self.leaf_size:
+            return indexes
+        dimensions = len(self.points[indexes[0]])
+        spreads = [max(self.points[i][axis] for i in indexes)
+                   - min(self.points[i][axis] for i in indexes)
+                   for axis in range(dimensions)]
+        axis = max(range(dimensions), key=spreads.__getitem__)
+        if spreads[axis] == 0:
+            return indexes
+        indexes.sort(key=lambda i: self.points[i][axis])
+        middle = len(indexes) // 2
+        split = self.points[indexes[middle]][axis]
+        # Left holds values <= split, right values >= split
+        return (axis, split, self._build(indexes[:middle]), self._build(indexes[middle:]))
+
+    def search(self, point: List[float], k: int, best: List[Tuple[float, int]], offset: float = 0.0,
+               exclude: Optional[int] = None) -> None:
+        """Merge this tree's nearest points into `best`.
+
+        Args:
+            point: Query vector
+            k: Number of neighbours to keep
+            best: Max-heap of (-squared distance, -index), updated in place
+            offset: Squared distance added to every point (from dimensions not in the tree)
+            exclude: Point index to skip (the query's own entry)
+        """
+        def visit(node: Any) -> None:
+            if isinstance(node, list):
+                for index in node:
+                    if index == exclude:
+                        continue
+                    distance = offset + sum((a - b) ** 2 for a, b in zip(point, self.points[index]))
+                    entry = (-distance, -index)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+                return
+            axis, split, left, right = node
+            gap = point[axis] - split
+            near, far = (left, right) if gap < 0 else (right, left)
+            visit(near)
+            if len(best) < k or offset + gap * gap <= -best[0][0]:
+                visit(far)
+
+        if k > 0:
+            visit(self.root)
+
+    def query(self, point: List[float], k: int,
+              exclude: Optional[int] = None) -> List[Tuple[float, int]]:
+        """The k nearest points to `point`.
+
+        Returns:
+            (distance, point index) pairs, nearest first; ties go to the lower index
+        """
+        best: List[Tuple[float, int]] = []
+        self.search(point, k, best, exclude=exclude)
+        return [(math.sqrt(-distance), -index) for distance, index in sorted(best, reverse=True)]
+
+
+class SimilarityIndex:
+    """Feature vectors of every Pokémon with stats, searchable by similarity.
+
+    A vector's type part only takes a few distinct values, so the squared
+    distance splits into a typing term (shared by every Pokémon of a typing)
+    plus the distance over the continuous features. Each typing gets a
+    KD-tree over the continuous features; a query visits typings in order
+    of their typing term and stops once that term alone is farther than the
+    k-th neighbour found so far, which skips most of the dataset exactly.
+    """
+
+    def __init__(self, pokemon_data: List[Dict[str, Any]]):
+        rows = sorted((p for p in pokemon_data if p.get("stats")), key=lambda p: p["id"])
+        self.ids = [row["id"] for row in rows]
+        self.names = [row.get("name_en", "") for row in rows]
+        self.positions = {pokemon_id: position for position, pokemon_id in enumerate(self.ids)}
+
+        raw = [self._raw_numeric(row.get("stats") or {}, row.get("height"), row.get("weight"))
+               for row in rows]
+        self.scales: Dict[str, List[float]] = {}
+        for column, key in enumerate(STAT_KEYS + SIZE_KEYS):
+            values = [values[column] for values in raw]
+            mean = sum(values) / len(values) if values else 0.0
+            variance = sum((value - mean) ** 2 for value in values) / len(values) if values else 0.0
+            self.scales[key] = [round(mean, 4), round(math.sqrt(variance) or 1.0, 4)]
+
+        self.vectors = [self._normalize(values, row.get("types_en") or [])
+                        for values, row in zip(raw, rows)]
+        self.continuous = [self._continuous(vector) for vector in self.vectors]
+
+        typings: Dict[Tuple[float, ...], List[int]] = {}
+        for position, vector in enumerate(self.vectors):
+            typings.setdefault(tuple(vector[TYPE_SLICE]), []).append(position)
+        self.typings = [(list(part), KDTree(self.continuous, members))
+                        for part, members in typings.items()]
+
+    @staticmethod
+    def _raw_numeric(stats: Dict[str, Any], height: Any, weight: Any) -> List[float]:
+        """Stats as-is, height and weight on a log scale (they span orders of magnitude)."""
+        return ([float(stats.get(stat, 0) or 0) for stat in STAT_KEYS]
+                + [math.log1p(float(height or 0)), math.log1p(float(weight or 0))])
+
+    @staticmethod
+    def _continuous(vector: List[float]) -> List[float]:
+        """The stat and size features of a vector (everything but the types)."""
+        return vector[:TYPE_SLICE.start] + vector[TYPE_SLICE.stop:]
+
+    def _normalize(self, values: List[float], types: List[str]) -> List[float]:
+        vector = [(value - self.scales[key][0]) / self.scales[key][1]
+                  for key, value in zip(STAT_KEYS, values)]
+        type_set = {t.lower() for t in types}
+        vector += [TYPE_WEIGHT if name in type_set else 0.0 for name in TYPE_NAMES]
+        vector += [SIZE_WEIGHT * (value - self.scales[key][0]) / self.scales[key][1]
+                   for key, value in zip(SIZE_KEYS, values[len(STAT_KEYS):])]
+        return vector
+
+    def vector(self, stats: Optional[Dict[str, float]] = None, types: Optional[List[str]] = None,
+               height: Optional[float] = None, weight: Optional[float] = None) -> List[float]:
+        """Feature vector for arbitrary attributes; anything omitted is the dataset average.
+
+        Args:
+            stats: Base stats by key (e.g. {"speed": 120})
+            types: Type names in any case
+            height: Height in metres
+            weight: Weight in kilograms
+
+        Returns:
+            Vector comparable with the indexed Pokémon (same layout as FEATURES)
+        """
+        stats = stats or {}
+        values = [float(stats[stat]) if stat in stats else self.scales[stat][0]
+                  for stat in STAT_KEYS]
+        values.append(math.log1p(height) if height is not None else self.scales["height"][0])
+        values.append(math.log1p(weight) if weight is not None else self.scales["weight"][0])
+        return self._normalize(values, types or [])
+
+    def query(self, vector: List[float], k: int = DEFAULT_NEIGHBORS,
+              exclude_id: Optional[int] = None) -> List[Tuple[int, float]]:
+        """The k Pokémon closest to any vector laid out as FEATURES.
+
+        Returns:
+            (Pokémon ID, distance) pairs, nearest first; ties go to the lower ID
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        if len(vector) != len(FEATURES):
+            raise ValueError(f"Expected a vector of {len(FEATURES)} features, got {len(vector)}")
+        exclude = self.positions.get(exclude_id) if exclude_id is not None else None
+        type_part = vector[TYPE_SLICE]
+        offsets = sorted(
+            (sum((a - b) ** 2 for a, b in zip(type_part, part)), order)
+            for order, (part, _) in enumerate(self.typings)
+        )
+
+        best: List[Tuple[float, int]] = []
+        continuous = self._continuous(vector)
+        for offset, order in offsets:
+            if len(best) == k and offset > -best[0][0]:
+                break
+            self.typings[order][1].search(continuous, k, best, offset, exclude)
+        return [(self.ids[-index], math.sqrt(-distance))
+                for distance, index in sorted(best, reverse=True)]
+
+    def similar(self, pokemon_id: int, k: int = DEFAULT_NEIGHBORS) -> List[Tuple[int, float]]:
+        """The k Pokémon most similar to an indexed Pokémon (excluding itself).
+
+        Raises:
+            KeyError: If the ID is not indexed
+        """
+        return self.query(self.vectors[self.positions[pokemon_id]], k, exclude_id=pokemon_id)
+
+    def to_artifact(self, k: int = DEFAULT_NEIGHBORS) -> Dict[str, Any]:
+        """Top-k neighbours of every Pokémon, column-oriented."""
+        neighbors = [self.similar(pokemon_id, k) for pokemon_id in self.ids]
+        return {
+            "k": k,
+            "features": FEATURES,
+            "weights": {"stats": 1, "types": TYPE_WEIGHT, "size": SIZE_WEIGHT},
+            "normalization": self.scales,
+            "ids": self.ids,
+            "similar": [[pokemon_id for pokemon_id, _ in row] for row in neighbors],
+            "distance": [[round(distance, 3) for _, distance in row] for row in neighbors]
+        }
+
+
+def parse_query(values: List[str]) -> Dict[str, Any]:
+    """Parse KEY=VALUE query terms into SimilarityIndex.vector() arguments.
+
+    Raises:
+        ValueError: On an unknown key, a non-numeric value or a negative size
+    """
+    arguments: Dict[str, Any] = {"stats": {}}
+    for value in values:
+        key, _, amount = value.partition("=")
+        key = key.strip().lower()
+        if key == "types":
+            types = [t for t in amount.split(",") if t]
+            unknown = [t for t in types if t.lower() not in TYPE_NAMES]
+            if unknown:
+                raise ValueError(f"Unknown type(s): {', '.join(unknown)}")
+            arguments["types"] = types
+            continue
+        try:
+            number = float(amount)
+        except ValueError:
+            raise ValueError(f"Invalid query term '{value}' (expected KEY=NUMBER)") from None
+        if not math.isfinite(number):
+            raise ValueError(f"Invalid query term '{value}' (expected a finite number)")
+        if key in STAT_KEYS:
+            arguments["stats"][key] = number
+        elif key in SIZE_KEYS:
+            if number < 0:
+                raise ValueError(f"Invalid query term '{value}' ({key} cannot be negative)")
+            arguments[key] = number
+        else:
+            expected = ", ".join(["types"] + STAT_KEYS + SIZE_KEYS)
+            raise ValueError(f"Unknown query key '{key}' (expected {expected})")
+    return arguments
+
+
+def log_neighbors(index: SimilarityIndex, neighbors: List[Tuple[int, float]]) -> None:
+    for rank, (pokemon_id, distance) in enumerate(neighbors, 1):
+        name = index.names[index.positions[pokemon_id]]
+        logger.info(f"   {rank:2d}. #{pokemon_id} {name} ({distance:.3f})")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Precompute the most similar Pokémon for every entry")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--output", default="assets/data/similar_pokemon.json",
+                        help="Output artifact")
+    parser.add_argument("--k", type=int, default=DEFAULT_NEIGHBORS,
+                        help=f"Neighbours per Pokémon (default: {DEFAULT_NEIGHBORS})")
+    parser.add_argument("--like", type=int, metavar="ID",
+                        help="Print the Pokémon most similar to ID and exit")
+    parser.add_argument("--query", nargs="+", metavar="KEY=VALUE",
+                        help="Print the Pokémon closest to a query "
+                             "(types=fire,flying speed=120 ...) and exit")
+    args = parser.parse_args()
+    if args.k < 1:
+        parser.error("--k must be at least 1")
+
+    index = SimilarityIndex(load_pokedex_data(args.input))
+    if not index.ids:
+        logger.error("❌ No Pokémon with stats found")
+        return 1
+
+    if args.like is not None:
+        if args.like not in index.positions:
+            logger.error(f"❌ Pokémon #{args.like} not found")
+            return 1
+        logger.info(f"Most similar to #{args.like} {index.names[index.positions[args.like]]}:")
+        log_neighbors(index, index.similar(args.like, args.k))
+        return 0
+    if args.query:
+        try:
+            query = parse_query(args.query)
+        except ValueError as e:
+            logger.error(f"❌ {e}")
+            return 1
+        logger.info(f"Closest to {' '.join(args.query)}:")
+        log_neighbors(index, index.query(index.vector(**query), args.k))
+        return 0
+
+    artifact = index.to_artifact(args.k)
+    write_json(args.output, artifact, compact=True)
+    logger.info(f"✅ Wrote {args.k} similar Pokémon for each of {len(index.ids)} Pokémon "
+                f"to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
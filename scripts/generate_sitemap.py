@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """
 Generate sitemap.xml for the Pokedex website
-This script creates a sitemap with all Pokemon URLs for better SEO
+This script creates a sitemap with all Pokemon URLs for better SEO.
+Pokemon entries point at the prerendered pages from generate_pokemon_pages.py
+(/pokemon/{id}/{slug}/), which crawlers can fetch without running the app.
 """
 
+import argparse
 import json
 from datetime import datetime
-from pathlib import Path
 import logging
 
+from build_utils import SITE_URL, pokemon_page_path
+from profiling import RunProfiler, add_profiling_arguments, stage
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,16 +23,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def generate_sitemap():
+def generate_sitemap(data_file: str = "pokedex_data.json", sitemap_file: str = "sitemap.xml"):
     """Generate sitemap.xml with all Pokemon URLs"""
     
-    base_url = "https://www.pokedex.tech"
+    base_url = SITE_URL
     
     # Load Pokemon data
-    data_file = Path(__file__).parent / "pokedex_data.json"
     
     try:
-        with open(data_file, 'r', encoding='utf-8') as f:
+        with stage("load"), open(data_file, 'r', encoding='utf-8') as f:
             pokemon_data = json.load(f)
     except FileNotFoundError:
         logger.error(f"Error: {data_file} not found. Run pokeapi_fetch.py first.")
@@ -52,30 +56,26 @@ def generate_sitemap():
     sitemap.append('  </url>')
     
     # Add Pokemon pages
-    for pokemon in pokemon_data:
-        pokemon_id = pokemon.get('id')
-        pokemon_name = pokemon.get('name_en', '').lower().replace(' ', '-').replace('.', '')
-        
-        if not pokemon_id or not pokemon_name:
-            continue
+    with stage("render"):
+        for pokemon in pokemon_data:
+            if not pokemon.get('id') or not pokemon.get('name_en'):
+                continue
         
-        # Create URL with Pokemon ID and name slug
-        pokemon_url = f"{base_url}/#pokemon/{pokemon_id}/{pokemon_name}"
+            # Prerendered page URL with Pokemon ID and name slug
+            pokemon_url = f"{base_url}/{pokemon_page_path(pokemon)}"
         
-        sitemap.append('  <url>')
-        sitemap.append(f'    <loc>{pokemon_url}</loc>')
-        sitemap.append(f'    <lastmod>{today}</lastmod>')
-        sitemap.append('    <changefreq>monthly</changefreq>')
-        sitemap.append('    <priority>0.8</priority>')
-        sitemap.append('  </url>')
+            sitemap.append('  <url>')
+            sitemap.append(f'    <loc>{pokemon_url}</loc>')
+            sitemap.append(f'    <lastmod>{today}</lastmod>')
+            sitemap.append('    <changefreq>monthly</changefreq>')
+            sitemap.append('    <priority>0.8</priority>')
+            sitemap.append('  </url>')
     
     sitemap.append('</urlset>')
     
     # Write sitemap to file
-    sitemap_file = Path(__file__).parent / "sitemap.xml"
-    
     try:
-        with open(sitemap_file, 'w', encoding='utf-8') as f:
+        with stage("write"), open(sitemap_file, 'w', encoding='utf-8') as f:
             f.write('\n'.join(sitemap))
         
         logger.info(f"✅ Generated sitemap.xml with {len(pokemon_data) + 1} URLs")
@@ -88,5 +88,12 @@ def generate_sitemap():
 
 
 if __name__ == "__main__":
-    success = generate_sitemap()
+    parser = argparse.ArgumentParser(description="Generate sitemap.xml for the Pokedex website")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--output", default="sitemap.xml", help="Output sitemap")
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
+    with RunProfiler.from_args(args, "generate_sitemap"):
+        success = generate_sitemap(args.input, args.output)
     exit(0 if success else 1)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Pack front sprites into per-generation atlas sheets.
+
+The card grid otherwise issues one image request per Pokémon. This script
+downloads each `sprite`, packs them into one PNG sheet per generation and
+writes the tile coordinates to sprite_atlas.json (keyed by Pokémon ID) so
+PokemonCardRenderer can draw every card from a handful of cached sheets.
+The dataset itself is left untouched; the pipeline's `atlas` stage runs
+this after pokedex_data.json is written.
+
+Requires Pillow (`pip install Pillow`).
+"""
+
+import argparse
+import hashlib
+import io
+import logging
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from build_utils import get_generation, load_pokedex_data, write_json
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional build dependency
+    Image = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+TILE_SIZE: int = 96  # PokeAPI front sprites are 96x96
+COLUMNS: int = 16
+
+
+def fetch_sprite(pokemon: Dict[str, Any], cache_dir: Path) -> Optional[bytes]:
+    """Return the raw PNG bytes of a Pokémon's front sprite.
+
+    Args:
+        pokemon: Pokémon record with `id` and `sprite`
+        cache_dir: Directory used to avoid re-downloading sprites between runs
+
+    Returns:
+        PNG bytes, or None if the sprite is missing or could not be downloaded
+    """
+    cached = cache_dir / f"{pokemon['id']}.png"
+    if cached.exists():
+        return cached.read_bytes()
+
+    url = pokemon.get("sprite")
+    if not url:
+        return None
+
+    try:
+        response = requests.get(url, timeout=20)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.error(f"Error fetching sprite for #{pokemon['id']}: {e}")
+        return None
+
+    cached.write_bytes(response.content)
+    return response.content
+
+
+def build_sheet(sprites: List[Any], tile_size: int, columns: int) -> "Image.Image":
+    """Paste sprites into a single RGBA sheet in row-major order.
+
+    Args:
+        sprites: Decoded sprite images
+        tile_size: Width and height of each tile in pixels
+        columns: Number of tiles per row
+
+    Returns:
+        The packed sheet
+    """
+    rows = (len(sprites) + columns - 1) // columns
+    sheet = Image.new("RGBA", (min(len(sprites), columns) * tile_size, rows * tile_size))
+    for index, sprite in enumerate(sprites):
+        x = (index % columns) * tile_size
+        y = (index // columns) * tile_size
+        sheet.paste(sprite, (x, y))
+    return sheet
+
+
+def generate_sprite_atlas(pokemon_data: List[Dict[str, Any]], output_dir: str,
+                          cache_dir: str, tile_size: int = TILE_SIZE,
+                          columns: int = COLUMNS,
+                          site_root: str = ".") -> Dict[int, Dict[str, Any]]:
+    """Build one atlas sheet per generation and return the coordinate map.
+
+    Sheet filenames carry a short content hash so a regenerated sheet gets a
+    new URL and unchanged sheets stay cached.
+
+    Args:
+        pokemon_data: List of Pokémon records
+        output_dir: Directory the sheets are written to (inside site_root)
+        cache_dir: Sprite download cache directory
+        tile_size: Width and height of each tile in pixels
+        columns: Number of tiles per row
+        site_root: Directory served as the site root; sheet URLs are relative to it
+
+    Returns:
+        Mapping of Pokémon ID to {sheet, x, y, size}
+
+    Raises:
+        ValueError: If output_dir is not inside site_root
+    """
+    out_path = Path(output_dir)
+    root_path = Path(site_root).resolve()
+    try:
+        url_prefix = out_path.resolve().relative_to(root_path).as_posix()
+    except ValueError:
+        raise ValueError(f"Atlas directory {output_dir} is not inside the site root {site_root}")
+    out_path.mkdir(parents=True, exist_ok=True)
+    cache_path = Path(cache_dir)
+    cache_path.mkdir(parents=True, exist_ok=True)
+
+    by_generation: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for pokemon in sorted(pokemon_data, key=lambda p: p["id"]):
+        generation = get_generation(pokemon["id"])
+        by_generation[f"gen{generation}" if generation else "forms"].append(pokemon)
+
+    coordinates: Dict[int, Dict[str, Any]] = {}
+    for group, members in by_generation.items():
+        tiles = []
+        for pokemon in members:
+            raw = fetch_sprite(pokemon, cache_path)
+            if raw is None:
+                continue
+            sprite = Image.open(io.BytesIO(raw)).convert("RGBA")
+            if sprite.size != (tile_size, tile_size):
+                sprite = sprite.resize((tile_size, tile_size), Image.NEAREST)
+            tiles.append((pokemon["id"], sprite))
+
+        if not tiles:
+            logger.warning(f"No sprites available for {group}, skipping sheet")
+            continue
+
+        sheet = build_sheet([sprite for _, sprite in tiles], tile_size, columns)
+        buffer = io.BytesIO()
+        sheet.save(buffer, format="PNG", optimize=True)
+        digest = hashlib.sha256(buffer.getvalue()).hexdigest()[:8]
+
+        for stale in out_path.glob(f"{group}.*.png"):
+            stale.unlink()
+        sheet_file = out_path / f"{group}.{digest}.png"
+        sheet_file.write_bytes(buffer.getvalue())
+        sheet_url = f"{url_prefix}/{sheet_file.name}" if url_prefix != "." else sheet_file.name
+
+        for index, (pokemon_id, _) in enumerate(tiles):
+            coordinates[pokemon_id] = {
+                "sheet": sheet_url,
+                "x": (index % columns) * tile_size,
+                "y": (index // columns) * tile_size,
+                "size": tile_size
+            }
+        logger.info(f"Packed {len(tiles)} sprites into {sheet_url} "
+                    f"({len(buffer.getvalue()) / 1024:.0f} KB)")
+
+    return coordinates
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Pack front sprites into per-generation atlas sheets")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--site-root", default=".",
+                        help="Site root the sheet URLs are relative to (default: .)")
+    parser.add_argument("--atlas-dir", default="assets/sprites/atlas",
+                        help="Directory for atlas sheets, inside the site root")
+    parser.add_argument("--map", default="assets/sprites/atlas/sprite_atlas.json",
+                        help="Coordinate map output, keyed by Pokémon ID")
+    parser.add_argument("--cache-dir", default=".sprite_cache", help="Sprite download cache")
+    parser.add_argument("--columns", type=int, default=COLUMNS, help="Tiles per sheet row")
+    args = parser.parse_args()
+
+    if Image is None:
+        logger.error("Pillow is required for atlas generation: pip install Pillow")
+        return 1
+
+    pokemon_data = load_pokedex_data(args.input)
+    try:
+        coordinates = generate_sprite_atlas(pokemon_data, args.atlas_dir, args.cache_dir,
+                                            columns=args.columns, site_root=args.site_root)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    write_json(args.map, {str(pokemon_id): entry for pokemon_id, entry in coordinates.items()},
+               compact=True)
+
+    sheets = {entry["sheet"] for entry in coordinates.values()}
+    logger.info(f"✅ {len(coordinates)}/{len(pokemon_data)} sprites packed "
+                f"into {len(sheets)} sheets")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Precompute stat analytics for the detail view and comparison panel.
+
+Computes base-stat totals, per-stat percentiles across the dataset and
+base-stat-total ranks within each type and generation, and writes them as a
+compact column-oriented companion artifact (assets/data/stat_analytics.json).
+assets/js/utils/statComparison.js loads it so the detail view and comparison
+panel read benchmarks, percentiles and ranks by ID instead of scanning the
+dataset.
+
+Every metric is computed column-wise over the whole dataset: each stat
+column is sorted once and values are placed with binary search, so the
+build is O(n log n) per column instead of comparing every pair.
+"""
+
+import argparse
+import logging
+import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from build_utils import get_generation, load_pokedex_data, write_json
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+STAT_KEYS: List[str] = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+
+# Mirrors STAT_BENCHMARKS.topTier in assets/js/utils/statComparison.js
+TOP_TIER: Dict[str, int] = {
+    "hp": 100,
+    "attack": 120,
+    "defense": 110,
+    "special-attack": 120,
+    "special-defense": 110,
+    "speed": 100
+}
+
+
+def percentile_ranks(values: List[int]) -> List[int]:
+    """Percent of the dataset each value beats, with ties sharing the midpoint.
+
+    Args:
+        values: One column of stat values
+
+    Returns:
+        Integer percentiles (0-100) aligned with `values`
+    """
+    ordered = sorted(values)
+    count = len(ordered)
+    if count <= 1:
+        return [100] * count
+    result = []
+    for value in values:
+        below = bisect_left(ordered, value)
+        ties = bisect_right(ordered, value) - below - 1
+        result.append(round(100 * (below + ties / 2) / (count - 1)))
+    return result
+
+
+def group_ranks(totals: List[int], groups: List[List[Optional[str]]]) -> List[List[Optional[int]]]:
+    """Rank totals (1 = highest) within each group a row belongs to.
+
+    Uses competition ranking: equal totals share a rank.
+
+    Args:
+        totals: Base-stat totals
+        groups: Group keys for each row (e.g. its types)
+
+    Returns:
+        Ranks aligned with `groups`
+    """
+    members: Dict[str, List[int]] = defaultdict(list)
+    for total, keys in zip(totals, groups):
+        for key in keys:
+            if key is not None:
+                members[key].append(total)
+    for key in members:
+        members[key].sort()
+
+    ranks = []
+    for total, keys in zip(totals, groups):
+        row = []
+        for key in keys:
+            if key is None:
+                row.append(None)
+            else:
+                ordered = members[key]
+                row.append(len(ordered) - bisect_right(ordered, total) + 1)
+        ranks.append(row)
+    return ranks
+
+
+def compute_stat_analytics(pokemon_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute totals, percentiles, benchmarks and group ranks.
+
+    Args:
+        pokemon_data: List of Pokémon records
+
+    Returns:
+        Column-oriented analytics dictionary
+    """
+    rows = sorted((p for p in pokemon_data if p.get("stats")), key=lambda p: p["id"])
+    if not rows:
+        return {"stats": STAT_KEYS, "count": 0}
+
+    columns = {stat: [row["stats"].get(stat, 0) for row in rows] for stat in STAT_KEYS}
+    totals = [sum(values) for values in zip(*columns.values())]
+    count = len(rows)
+
+    type_keys = [[t.lower() for t in row.get("types_en", [])] for row in rows]
+    generations = [get_generation(row["id"]) for row in rows]
+    gen_keys = [[str(generation) if generation else None] for generation in generations]
+
+    type_counts: Dict[str, int] = defaultdict(int)
+    gen_counts: Dict[str, int] = defaultdict(int)
+    for keys in type_keys:
+        for key in keys:
+            type_counts[key] += 1
+    for (key,) in gen_keys:
+        if key is not None:
+            gen_counts[key] += 1
+
+    percentiles = {stat: percentile_ranks(values) for stat, values in columns.items()}
+    percentiles["total"] = percentile_ranks(totals)
+
+    return {
+        "stats": STAT_KEYS,
+        "count": count,
+        "benchmarks": {
+            "averages": {stat: round(sum(values) / count) for stat, values in columns.items()},
+            "max": {stat: max(values) for stat, values in columns.items()},
+            "topTier": TOP_TIER,
+            "averageTotal": round(sum(totals) / count),
+            "maxTotal": max(totals)
+        },
+        "ids": [row["id"] for row in rows],
+        "total": totals,
+        "percentiles": percentiles,
+        "type_rank": group_ranks(totals, type_keys),
+        "type_counts": dict(type_counts),
+        "generation": generations,
+        "generation_rank": [rank for (rank,) in group_ranks(totals, gen_keys)],
+        "generation_counts": dict(gen_counts)
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Precompute stat totals, percentiles and ranks")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--output", default="assets/data/stat_analytics.json",
+                        help="Output artifact")
+    args = parser.parse_args()
+
+    pokemon_data = load_pokedex_data(args.input)
+    analytics = compute_stat_analytics(pokemon_data)
+    if not analytics["count"]:
+        logger.error("❌ No Pokémon with stats found")
+        return 1
+
+    write_json(args.output, analytics, compact=True)
+    logger.info(f"✅ Wrote stat analytics for {analytics['count']} Pokémon to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
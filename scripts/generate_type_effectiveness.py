@@ -6,9 +6,15 @@ This script ensures type effectiveness data is consistent between
 Python (pokeapi_fetch.py) and JavaScript (assets/js/utils/typeEffectiveness.js).
 """
 
+import argparse
 import json
 import logging
-from datetime import datetime
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -41,68 +47,269 @@ TYPE_EFFECTIVENESS = {
 }
 
 
-def generate_javascript_file(output_path: str = "assets/js/utils/typeEffectiveness.js") -> None:
-    """Generate JavaScript file from TYPE_EFFECTIVENESS data.
-    
-    Args:
-        output_path: Path to output JavaScript file
+# Type IDs are positions in TYPE_EFFECTIVENESS (shared by the Python and JS tables)
+TYPE_NAMES: List[str] = list(TYPE_EFFECTIVENESS)
+
+# One digit per multiplier in the emitted dual-type table
+MULTIPLIER_CODES: Dict[float, str] = {0: "0", 0.25: "1", 0.5: "2", 1: "3", 2: "4", 4: "5"}
+
+
+def effectiveness_matrix() -> List[List[float]]:
+    """Attack multipliers as matrix[attack_id][defend_id]."""
+    return [[TYPE_EFFECTIVENESS[attacker].get(defender, 1) for defender in TYPE_NAMES]
+            for attacker in TYPE_NAMES]
+
+
+def dual_type_combinations() -> List[Tuple[int, int]]:
+    """Every single (a, a) and dual (a, b > a) typing, in dualTypeIndex() order.
+
+    That is 171 typings for 18 types.
     """
-    logger.info(f"Generating {output_path} from Python TYPE_EFFECTIVENESS data...")
-    
-    # Convert Python dict to JavaScript object literal
-    js_content = f"""/**
+    type_count = len(TYPE_NAMES)
+    return [(first, second) for first in range(type_count) for second in range(first, type_count)]
+
+
+def dual_type_index(first: int, second: int) -> int:
+    """Row of a typing in the dual-type table; mirrors dualTypeIndex() in the JS."""
+    low, high = min(first, second), max(first, second)
+    return low * len(TYPE_NAMES) - low * (low - 1) // 2 + (high - low)
+
+
+def dual_type_defense() -> List[List[float]]:
+    """Multiplier of every attacking type against each typing in dual_type_combinations()."""
+    matrix = effectiveness_matrix()
+    return [
+        [matrix[attacker][first] * (matrix[attacker][second] if second != first else 1)
+         for attacker in range(len(TYPE_NAMES))]
+        for first, second in dual_type_combinations()
+    ]
+
+
+def js_number(value: float) -> str:
+    return str(int(value)) if value == int(value) else str(value)
+
+
+def to_js_object(chart: dict) -> str:
+    """Render the chart as a JavaScript object literal in the repo's lint style."""
+    lines = ["{"]
+    for index, (attacking_type, matchups) in enumerate(chart.items()):
+        lines.append(f"    '{attacking_type}': {{")
+        entries = [f"        '{defending_type}': {multiplier}"
+                   for defending_type, multiplier in matchups.items()]
+        lines.append(",\n".join(entries))
+        lines.append("    }" + ("," if index < len(chart) - 1 else ""))
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def render_type_names() -> str:
+    return ",\n".join(f"    '{name}'" for name in TYPE_NAMES)
+
+
+def render_type_ids() -> str:
+    return ",\n".join(f"    '{name}': {type_id}" for type_id, name in enumerate(TYPE_NAMES))
+
+
+def render_matrix() -> str:
+    rows = [
+        "    " + ", ".join(js_number(value) for value in row)
+        + ("," if index < len(TYPE_NAMES) - 1 else "") + f" // {TYPE_NAMES[index]}"
+        for index, row in enumerate(effectiveness_matrix())
+    ]
+    return "\n".join(rows)
+
+
+def render_dual_type_codes() -> str:
+    combinations = dual_type_combinations()
+    rows = []
+    for index, (row, (first, second)) in enumerate(zip(dual_type_defense(), combinations)):
+        label = (TYPE_NAMES[first] if first == second
+                 else f"{TYPE_NAMES[first]}/{TYPE_NAMES[second]}")
+        codes = "".join(MULTIPLIER_CODES[value] for value in row)
+        separator = "," if index < len(combinations) - 1 else ""
+        rows.append(f"    '{codes}'{separator} // {label}")
+    return "\n".join(rows)
+
+
+def render_javascript() -> str:
+    """Render typeEffectiveness.js; the output depends only on TYPE_EFFECTIVENESS."""
+    return f"""/**
  * Type Effectiveness Data
- * 
+ *
  * This file is AUTO-GENERATED by generate_type_effectiveness.py
  * DO NOT EDIT MANUALLY - changes will be overwritten
- * 
+ *
  * To update type effectiveness data:
- * 1. Edit TYPE_EFFECTIVENESS in pokeapi_fetch.py
- * 2. Run: python generate_type_effectiveness.py
- * 
- * Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+ * 1. Edit TYPE_EFFECTIVENESS in scripts/pokeapi_fetch.py
+ * 2. Run: python scripts/generate_type_effectiveness.py
  */
 
 /**
  * Type effectiveness multipliers for Pokemon type matchups
- * 
+ *
  * Structure: {{attacking_type: {{defending_type: multiplier}}}}
- * 
+ *
  * Multipliers:
  * - 2.0: Super effective
  * - 1.0: Normal damage (not listed)
  * - 0.5: Not very effective
  * - 0: No effect (immune)
- * 
+ *
  * @type {{Object.<string, Object.<string, number>>}}
  */
-export const TYPE_EFFECTIVENESS = {json.dumps(TYPE_EFFECTIVENESS, indent=2)};
+export const TYPE_EFFECTIVENESS = {to_js_object(TYPE_EFFECTIVENESS)};
+
+/**
+ * Number of types; type IDs run from 0 to TYPE_COUNT - 1
+ *
+ * @type {{number}}
+ */
+export const TYPE_COUNT = {len(TYPE_NAMES)};
+
+/**
+ * Type names by type ID (TYPE_EFFECTIVENESS order)
+ *
+ * @type {{Array<string>}}
+ */
+export const TYPE_NAMES = Object.freeze([
+{render_type_names()}
+]);
+
+/**
+ * Type IDs by lowercase type name
+ *
+ * @type {{Object.<string, number>}}
+ */
+export const TYPE_IDS = Object.freeze({{
+{render_type_ids()}
+}});
+
+/**
+ * Attack multipliers as a flat TYPE_COUNT x TYPE_COUNT matrix:
+ * TYPE_MATRIX[attackId * TYPE_COUNT + defendId]
+ *
+ * @type {{Float32Array}}
+ */
+export const TYPE_MATRIX = new Float32Array([
+{render_matrix()}
+]);
+
+/**
+ * Defensive multipliers of every single and dual typing ({len(dual_type_combinations())} rows, see
+ * dualTypeIndex), one digit per attacking type in type ID order:
+ * 0 = 0, 1 = 0.25, 2 = 0.5, 3 = 1, 4 = 2, 5 = 4
+ */
+const DUAL_TYPE_DEFENSE_CODES = [
+{render_dual_type_codes()}
+];
+
+const MULTIPLIER_BY_CODE = [0, 0.25, 0.5, 1, 2, 4];
+
+/**
+ * Decoded dual-type table:
+ * DUAL_TYPE_DEFENSE[dualTypeIndex(firstId, secondId) * TYPE_COUNT + attackId]
+ *
+ * @type {{Float32Array}}
+ */
+export const DUAL_TYPE_DEFENSE = Float32Array.from(
+    DUAL_TYPE_DEFENSE_CODES.join(''),
+    (code) => MULTIPLIER_BY_CODE[code]
+);
+
+/**
+ * Get the type ID of a type name (any case)
+ *
+ * @param {{string}} typeName - Type name, e.g. 'Fire'
+ * @returns {{number}} Type ID, or -1 for unknown types
+ */
+export function getTypeId(typeName) {{
+    const id = TYPE_IDS[String(typeName).toLowerCase()];
+    return typeof id === 'number' ? id : -1;
+}}
+
+/**
+ * Row of a single or dual typing in DUAL_TYPE_DEFENSE (order of the IDs does not matter)
+ *
+ * @param {{number}} firstId - First type ID
+ * @param {{number}} [secondId=firstId] - Second type ID; omit for single-type Pokemon
+ * @returns {{number}} Row index (0-{len(dual_type_combinations()) - 1})
+ */
+export function dualTypeIndex(firstId, secondId = firstId) {{
+    const low = Math.min(firstId, secondId);
+    const high = Math.max(firstId, secondId);
+    return low * TYPE_COUNT - (low * (low - 1)) / 2 + (high - low);
+}}
+
+/**
+ * Multiplier of one attacking type against one defending type, by ID
+ *
+ * @param {{number}} attackId - Attacking type ID
+ * @param {{number}} defendId - Defending type ID
+ * @returns {{number}} Damage multiplier
+ */
+export function getEffectivenessById(attackId, defendId) {{
+    return TYPE_MATRIX[attackId * TYPE_COUNT + defendId];
+}}
+
+/**
+ * Multipliers of all attacking types against a single or dual typing, by ID
+ *
+ * @param {{number}} firstId - First type ID
+ * @param {{number}} [secondId=firstId] - Second type ID; omit for single-type Pokemon
+ * @returns {{Float32Array}} TYPE_COUNT multipliers indexed by attacking type ID
+ *     (a view, do not modify)
+ */
+export function getDefensiveMultipliersById(firstId, secondId = firstId) {{
+    const start = dualTypeIndex(firstId, secondId) * TYPE_COUNT;
+    return DUAL_TYPE_DEFENSE.subarray(start, start + TYPE_COUNT);
+}}
+
+/**
+ * Calculate damage multiplier for an attacking type against defending types, by ID
+ *
+ * @param {{number}} attackId - Attacking type ID
+ * @param {{Array<number>}} defendingIds - Defending type IDs
+ * @returns {{number}} Combined damage multiplier
+ */
+export function calculateTypeEffectivenessById(attackId, defendingIds) {{
+    if (defendingIds.length === 2 && defendingIds[0] !== defendingIds[1]) {{
+        const row = dualTypeIndex(defendingIds[0], defendingIds[1]);
+        return DUAL_TYPE_DEFENSE[row * TYPE_COUNT + attackId];
+    }}
+    let multiplier = 1;
+    for (const defendId of defendingIds) {{
+        multiplier *= TYPE_MATRIX[attackId * TYPE_COUNT + defendId];
+    }}
+    return multiplier;
+}}
 
 /**
  * Calculate damage multiplier for an attacking type against defending types
- * 
+ *
  * @param {{string}} attackingType - The type of the attacking move
  * @param {{Array<string>}} defendingTypes - Array of defending Pokemon's types
  * @returns {{number}} Combined damage multiplier
  */
 export function calculateTypeEffectiveness(attackingType, defendingTypes) {{
+    const attackId = getTypeId(attackingType);
+    if (attackId < 0) {{
+        return 1;
+    }}
+
     let multiplier = 1;
-    
-    const effectiveness = TYPE_EFFECTIVENESS[attackingType.toLowerCase()] || {{}};
-    
     for (const defendingType of defendingTypes) {{
-        const typeMultiplier = effectiveness[defendingType.toLowerCase()];
-        if (typeMultiplier !== undefined) {{
-            multiplier *= typeMultiplier;
+        const defendId = getTypeId(defendingType);
+        if (defendId >= 0) {{
+            multiplier *= TYPE_MATRIX[attackId * TYPE_COUNT + defendId];
         }}
     }}
-    
+
     return multiplier;
 }}
 
 /**
  * Get effectiveness category for a multiplier
- * 
+ *
  * @param {{number}} multiplier - Damage multiplier
  * @returns {{string}} Category: 'immune', 'not-very-effective', 'normal', or 'super-effective'
  */
@@ -115,7 +322,7 @@ export function getEffectivenessCategory(multiplier) {{
 
 /**
  * Get all types that a given type is super effective against
- * 
+ *
  * @param {{string}} attackingType - The attacking type
  * @returns {{Array<string>}} Array of type names
  */
@@ -126,7 +333,7 @@ export function getSuperEffectiveAgainst(attackingType) {{
 
 /**
  * Get all types that a given type is not very effective against
- * 
+ *
  * @param {{string}} attackingType - The attacking type
  * @returns {{Array<string>}} Array of type names
  */
@@ -137,7 +344,7 @@ export function getNotVeryEffectiveAgainst(attackingType) {{
 
 /**
  * Get all types that a given type has no effect against
- * 
+ *
  * @param {{string}} attackingType - The attacking type
  * @returns {{Array<string>}} Array of type names
  */
@@ -145,7 +352,66 @@ export function getNoEffectAgainst(attackingType) {{
     const effectiveness = TYPE_EFFECTIVENESS[attackingType.toLowerCase()] || {{}};
     return Object.keys(effectiveness).filter(type => effectiveness[type] === 0);
 }}
+
+/**
+ * Get type matchups for defending Pokemon types
+ * Returns weaknesses, resistances, and immunities
+ *
+ * @param {{Array<string>}} pokemonTypes - Array of Pokemon's types (e.g., ['Fire', 'Flying'])
+ * @returns {{Object}} Object with weaknesses, resistances, and immunities
+ */
+export function getTypeMatchups(pokemonTypes) {{
+    const matchups = {{
+        weaknesses: {{}},
+        resistances: {{}},
+        immunities: []
+    }};
+
+    // Single and dual typings come straight from the precomputed table
+    const ids = pokemonTypes.map(getTypeId).filter((id) => id >= 0);
+    const multipliers = ids.length === 1 || (ids.length === 2 && ids[0] !== ids[1])
+        ? getDefensiveMultipliersById(ids[0], ids[ids.length - 1])
+        : TYPE_NAMES.map((attackingType) =>
+            calculateTypeEffectiveness(attackingType, pokemonTypes));
+
+    for (let attackId = 0; attackId < TYPE_COUNT; attackId++) {{
+        const attackingType = TYPE_NAMES[attackId];
+        const multiplier = multipliers[attackId];
+
+        if (multiplier === 0) {{
+            matchups.immunities.push(attackingType);
+        }} else if (multiplier > 1) {{
+            matchups.weaknesses[attackingType] = multiplier;
+        }} else if (multiplier < 1) {{
+            matchups.resistances[attackingType] = multiplier;
+        }}
+        // multiplier === 1 means normal effectiveness, we don't track that
+    }}
+
+    return matchups;
+}}
 """
+
+
+def generate_javascript_file(output_path: str = "assets/js/utils/typeEffectiveness.js") -> bool:
+    """Generate JavaScript file from TYPE_EFFECTIVENESS data.
+
+    The file is only rewritten when its content changes, so unchanged data
+    leaves it (and its mtime) untouched for incremental builds.
+
+    Args:
+        output_path: Path to output JavaScript file
+
+    Returns:
+        True if the file was written
+    """
+    logger.info(f"Generating {output_path} from Python TYPE_EFFECTIVENESS data...")
+    js_content = render_javascript()
+
+    output = Path(output_path)
+    if output.exists() and output.read_text(encoding='utf-8') == js_content:
+        logger.info(f"{output_path} is up to date")
+        return False
     
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(js_content)
@@ -156,8 +422,131 @@ export function getNoEffectAgainst(attackingType) {{
     # Count total matchups
     total_matchups = sum(len(matchups) for matchups in TYPE_EFFECTIVENESS.values())
     logger.info(f"Total matchup definitions: {total_matchups}")
+    return True
+
+
+def parse_javascript_tables(js_content: str) -> Dict[str, object]:
+    """Read the emitted tables back out of typeEffectiveness.js source.
+
+    Args:
+        js_content: Contents of the generated file
+
+    Returns:
+        Dictionary with chart, names, ids, matrix (flat) and dual_type (decoded rows)
+    """
+    def block(pattern: str) -> str:
+        match = re.search(pattern, js_content, re.S)
+        if not match:
+            raise ValueError(f"Table not found: {pattern}")
+        return re.sub(r"//[^\n]*", "", match.group(1))
+
+    codes = re.findall(r"'([0-5]+)'", block(r"const DUAL_TYPE_DEFENSE_CODES = \[(.*?)\];"))
+    values_by_code = {code: value for value, code in MULTIPLIER_CODES.items()}
+    chart = block(r"export const TYPE_EFFECTIVENESS = (\{.*?\n\});")
+    names = block(r"export const TYPE_NAMES = Object\.freeze\(\[(.*?)\]\);")
+    ids = block(r"export const TYPE_IDS = Object\.freeze\(\{(.*?)\}\);")
+    matrix = block(r"export const TYPE_MATRIX = new Float32Array\(\[(.*?)\]\);")
+    return {
+        "chart": json.loads(chart.replace("'", '"')),
+        "names": re.findall(r"'(\w+)'", names),
+        "ids": {name: int(type_id) for name, type_id in re.findall(r"'(\w+)': (\d+)", ids)},
+        "matrix": [float(value) for value in re.findall(r"[\d.]+", matrix)],
+        "dual_type": [[values_by_code[code] for code in row] for row in codes]
+    }
+
+
+def evaluate_javascript_tables(output_path: str) -> Dict[str, list]:
+    """Import the generated module with Node and return its decoded typed arrays."""
+    script = ("const t = await import(process.argv[1]);"
+              "console.log(JSON.stringify({matrix: Array.from(t.TYPE_MATRIX), "
+              "dual: Array.from(t.DUAL_TYPE_DEFENSE), names: t.TYPE_NAMES}));")
+    module_uri = Path(output_path).resolve().as_uri()
+    result = subprocess.run(["node", "--input-type=module", "-e", script, module_uri],
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def check_javascript_file(output_path: str = "assets/js/utils/typeEffectiveness.js") -> List[str]:
+    """Check that the generated JS agrees with the Python tables.
+
+    Compares the nested chart, type IDs, the 18x18 matrix and the dual-type
+    table parsed from the file, and (when Node is installed) the typed arrays
+    the module actually builds. Also checks that pokeapi_fetch.py holds the
+    same chart and that the file is what this script would write.
+
+    Args:
+        output_path: Generated JavaScript file
+
+    Returns:
+        Problems found (empty if everything agrees)
+    """
+    output = Path(output_path)
+    if not output.exists():
+        return [f"{output_path} does not exist"]
+    js_content = output.read_text(encoding='utf-8')
+    problems = []
+
+    expected_matrix = [value for row in effectiveness_matrix() for value in row]
+    expected_dual = dual_type_defense()
+    try:
+        tables = parse_javascript_tables(js_content)
+        if tables["chart"] != TYPE_EFFECTIVENESS:
+            problems.append("TYPE_EFFECTIVENESS differs from the Python chart")
+        expected_ids = {name: i for i, name in enumerate(TYPE_NAMES)}
+        if tables["names"] != TYPE_NAMES or tables["ids"] != expected_ids:
+            problems.append("TYPE_NAMES / TYPE_IDS do not match the Python type order")
+        if tables["matrix"] != expected_matrix:
+            problems.append("TYPE_MATRIX differs from the Python chart")
+        if tables["dual_type"] != expected_dual:
+            problems.append("DUAL_TYPE_DEFENSE_CODES differ from the Python dual-type table")
+    except ValueError as e:
+        problems.append(f"Could not parse {output_path}: {e}")
+
+    if shutil.which("node"):
+        try:
+            evaluated = evaluate_javascript_tables(output_path)
+            if evaluated["names"] != TYPE_NAMES or evaluated["matrix"] != expected_matrix:
+                problems.append("TYPE_MATRIX built by the module differs from the Python chart")
+            if evaluated["dual"] != [value for row in expected_dual for value in row]:
+                problems.append("DUAL_TYPE_DEFENSE built by the module differs from the Python "
+                                "dual-type table")
+        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+            problems.append(f"Node could not evaluate {output_path}: {e}")
+    else:
+        logger.warning("node not found; skipping the runtime table check")
+
+    try:
+        from pokeapi_fetch import TYPE_EFFECTIVENESS as FETCH_TYPE_EFFECTIVENESS
+        if FETCH_TYPE_EFFECTIVENESS != TYPE_EFFECTIVENESS:
+            problems.append("TYPE_EFFECTIVENESS in pokeapi_fetch.py differs from "
+                            "generate_type_effectiveness.py")
+    except ImportError as e:
+        logger.warning(f"Could not import pokeapi_fetch ({e}); skipping the fetch chart comparison")
+
+    if js_content != render_javascript():
+        problems.append(f"{output_path} is out of date; "
+                        "run python scripts/generate_type_effectiveness.py")
+    return problems
 
 
 if __name__ == "__main__":
-    generate_javascript_file()
+    parser = argparse.ArgumentParser(
+        description="Generate typeEffectiveness.js from TYPE_EFFECTIVENESS")
+    parser.add_argument("--output", default="assets/js/utils/typeEffectiveness.js",
+                        help="Output JavaScript file")
+    parser.add_argument("--check", action="store_true",
+                        help="Verify the generated file agrees with the Python tables "
+                             "instead of writing it")
+    args = parser.parse_args()
+
+    if args.check:
+        problems = check_javascript_file(args.output)
+        for problem in problems:
+            logger.error(f"❌ {problem}")
+        if problems:
+            sys.exit(1)
+        logger.info(f"✅ {args.output} agrees with the Python type tables")
+        sys.exit(0)
+
+    generate_javascript_file(args.output)
     logger.info("Type effectiveness generation complete!")
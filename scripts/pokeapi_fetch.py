@@ -3,10 +3,20 @@ import json
 import time
 import argparse
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from typing import Dict, Iterable, List, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
+from adaptive_concurrency import AdaptiveController, CircuitBreaker
+from build_utils import write_json
+from fetch_metrics import FetchMetrics, endpoint_kind
+from profiling import RunProfiler, add_profiling_arguments, stage
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,6 +27,7 @@ logger = logging.getLogger(__name__)
 
 BASE_URL: str = "https://pokeapi.co/api/v2/"
 POKEMON_COUNT: int = 1025  # All generations (1-9) - default value
+REQUEST_TIMEOUT: float = 20.0  # Seconds before a stalled request is treated as a transient error
 
 
 class RateLimiter:
@@ -34,13 +45,18 @@ class RateLimiter:
         """
         self.calls_per_minute = calls_per_minute
         self.calls: List[datetime] = []
+        self._lock = threading.Lock()
         
     def wait_if_needed(self) -> None:
         """Wait if necessary to respect rate limits.
         
         Removes old calls outside the time window and sleeps if
-        we've reached the rate limit.
+        we've reached the rate limit. Safe to call from worker threads.
         """
+        with self._lock:
+            self._wait_locked()
+
+    def _wait_locked(self) -> None:
         now = datetime.now()
         
         # Remove calls older than 1 minute
@@ -87,6 +103,18 @@ VERSION_PRIORITY = [
     "firered-leafgreen", "emerald", "ruby-sapphire",
     "crystal", "gold-silver", "yellow", "red-blue"
 ]
+# Precomputed rank lookup (lower is preferred); unknown versions rank last
+VERSION_PRIORITY_RANK: Dict[str, int] = {name: rank for rank, name in enumerate(VERSION_PRIORITY)}
+
+# Languages always extracted into the base record fields (*_en / *_jp)
+BASE_LANGUAGES: Tuple[str, ...] = ("en", "ja")
+# Lookups for a language fall back to these codes, in order
+LANGUAGE_FALLBACKS: Dict[str, List[str]] = {"ja-Hrkt": ["ja"]}
+# Preferred game versions for Pokedex entries; any entry in the language is used after these
+FLAVOR_TEXT_VERSIONS: Tuple[str, ...] = ("red", "blue", "yellow")
+
+# Learn methods kept in full learnsets (index = method ID in the learnset arrays)
+LEARN_METHODS: List[str] = ["level-up", "machine", "egg", "tutor"]
 
 # Type effectiveness chart - damage multipliers
 TYPE_EFFECTIVENESS = {
@@ -112,10 +140,61 @@ TYPE_EFFECTIVENESS = {
 
 # Global rate limiter instance (100 calls per minute by default)
 rate_limiter = RateLimiter(calls_per_minute=100)
+metrics = FetchMetrics()
+
+# Adaptive concurrency/circuit breaker (set with --adaptive); replaces --sleep and --workers
+adaptive_controller: Optional[AdaptiveController] = None
+
+# Payloads fetched during this run, keyed by endpoint (see to_endpoint)
+payload_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
+# Optional on-disk payload cache (set with --cache-dir) so rebuilds skip the network
+payload_cache_dir: Optional[str] = None
+
+# Assumed average request latency, used only for dry-run time estimates
+ASSUMED_LATENCY_SECONDS: float = 0.3
+
+# Bundles collected and assembled at a time; bounds how many raw payloads stay alive
+ASSEMBLY_CHUNK_SIZE: int = 128
+
+
+def to_endpoint(url: str) -> str:
+    """Normalize a full PokeAPI URL to the endpoint form used as cache key."""
+    return url.replace(BASE_URL, "")
+
+
+def cache_file_path(endpoint: str) -> str:
+    """Path of an endpoint's payload in the on-disk cache."""
+    return os.path.join(payload_cache_dir, endpoint.strip("/").replace("/", "_") + ".json")
+
+
+def load_cached_payload(endpoint: str) -> bool:
+    """Load an endpoint from the on-disk cache into payload_cache.
+
+    Returns:
+        True if the payload is now in payload_cache
+    """
+    if endpoint in payload_cache:
+        metrics.record_cache_hit(endpoint_kind(endpoint))
+        return True
+    if not payload_cache_dir or not os.path.exists(cache_file_path(endpoint)):
+        return False
+    try:
+        with open(cache_file_path(endpoint), "r", encoding="utf-8") as f:
+            payload_cache[endpoint] = json.load(f)
+        metrics.record_cache_hit(endpoint_kind(endpoint))
+        return True
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable cache file for {endpoint}: {e}")
+        return False
+
 
 def get_data(endpoint: str, use_rate_limiter: bool = True) -> Optional[Dict[str, Any]]:
     """Helper function to get data from PokeAPI and handle errors.
     
+    Payloads already fetched this run (e.g. by prefetch_resources) or
+    present in the on-disk cache are returned without a request.
+
     Args:
         endpoint: API endpoint to fetch from
         use_rate_limiter: Whether to apply rate limiting (default: True)
@@ -123,20 +202,423 @@ def get_data(endpoint: str, use_rate_limiter: bool = True) -> Optional[Dict[str,
     Returns:
         JSON data as dictionary if successful, None otherwise
     """
+    if load_cached_payload(endpoint):
+        return payload_cache[endpoint]
+
+    kind = endpoint_kind(endpoint)
+
+    def wait_for_rate_limit() -> None:
+        wait_started = time.perf_counter()
+        rate_limiter.wait_if_needed()
+        metrics.record_sleep("rate_limit", time.perf_counter() - wait_started)
+
+    # Apply rate limiting before making the request (per attempt under the adaptive controller)
+    if use_rate_limiter and adaptive_controller is None:
+        wait_for_rate_limit()
+
+    request_started = time.perf_counter()
+    response = None
     try:
-        # Apply rate limiting before making the request
-        if use_rate_limiter:
-            rate_limiter.wait_if_needed()
-            
-        response = requests.get(BASE_URL + endpoint)
+        if adaptive_controller is not None:
+            response = adaptive_controller.send(
+                lambda: requests.get(BASE_URL + endpoint, timeout=REQUEST_TIMEOUT),
+                transient_errors=(requests.exceptions.ConnectionError, requests.exceptions.Timeout),
+                before_attempt=wait_for_rate_limit if use_rate_limiter else None,
+                on_retry=lambda: metrics.record_retry(kind)
+            )
+        else:
+            response = requests.get(BASE_URL + endpoint, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()  # Raises an HTTPError for bad responses (4XX or 5XX)
-        return response.json()
+        payload = response.json()
+        metrics.record_request(kind, time.perf_counter() - request_started, len(response.content))
+        payload_cache[endpoint] = payload
+        if payload_cache_dir:
+            with open(cache_file_path(endpoint), "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+        return payload
     except requests.exceptions.RequestException as e:
         logger.error(f"Error fetching {endpoint}: {e}")
-        return None
     except json.JSONDecodeError as e:
         logger.error(f"Error decoding JSON from {endpoint}: {e}")
-        return None
+    size = len(response.content) if response is not None else 0
+    metrics.record_request(kind, time.perf_counter() - request_started, size, ok=False)
+    return None
+
+
+def select_level_up_moves(pokemon_main_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Pick each move's level-up entry from the most recent version group.
+
+    Args:
+        pokemon_main_data: Payload from the pokemon/ endpoint
+
+    Returns:
+        List of {name, url, level} sorted by level
+    """
+    level_up_moves = []
+
+    # Try to get level-up moves from any version, prioritizing more recent games
+    for move_entry in pokemon_main_data["moves"]:
+        best_version = None
+        best_priority = len(VERSION_PRIORITY)
+        best_level = 0
+
+        for version_group_detail in move_entry["version_group_details"]:
+            if version_group_detail["move_learn_method"]["name"] == "level-up":
+                version_name = version_group_detail["version_group"]["name"]
+                level = version_group_detail["level_learned_at"]
+
+                # Unknown versions get lowest priority
+                priority = VERSION_PRIORITY_RANK.get(version_name, len(VERSION_PRIORITY))
+
+                # Prefer versions with higher priority (lower index) and level > 0
+                if level > 0 and priority < best_priority:
+                    best_version = version_name
+                    best_priority = priority
+                    best_level = level
+
+        # If we found a valid level-up move, add it
+        if best_version is not None:
+            level_up_moves.append({
+                "name": move_entry["move"]["name"],
+                "url": move_entry["move"]["url"],
+                "level": best_level
+            })
+
+    level_up_moves.sort(key=lambda m: m["level"])
+    return level_up_moves
+
+
+class FetchPlan:
+    """Deduplicated PokeAPI resources grouped into dependency waves.
+
+    Every endpoint in a wave depends only on payloads from earlier waves,
+    so a whole wave can be fetched concurrently.
+    """
+
+    def __init__(self):
+        self.waves: List[List[str]] = []
+        self.seen: set = set()
+
+    def add_wave(self, endpoints: List[str]) -> List[str]:
+        """Add a wave, dropping endpoints already planned.
+
+        Args:
+            endpoints: Candidate endpoints
+
+        Returns:
+            The endpoints that were new
+        """
+        new_endpoints = []
+        for endpoint in endpoints:
+            if endpoint not in self.seen:
+                self.seen.add(endpoint)
+                new_endpoints.append(endpoint)
+        self.waves.append(new_endpoints)
+        return new_endpoints
+
+    @property
+    def request_count(self) -> int:
+        return len(self.seen)
+
+
+def plan_initial_wave(pokemon_count: int) -> List[str]:
+    """Endpoints known before any fetching: every pokemon/species and type."""
+    endpoints = [f"type/{type_name}" for type_name in TYPE_EFFECTIVENESS]
+    for i in range(1, pokemon_count + 1):
+        endpoints.append(f"pokemon/{i}")
+        endpoints.append(f"pokemon-species/{i}")
+    return endpoints
+
+
+def pokemon_dependencies(pokemon_main_data: Dict[str, Any],
+                         full_learnsets: bool = False) -> List[str]:
+    """Ability and move endpoints referenced by one pokemon/ payload."""
+    endpoints = [to_endpoint(ability_entry["ability"]["url"])
+                 for ability_entry in pokemon_main_data["abilities"]]
+    for move_info in select_level_up_moves(pokemon_main_data)[:4]:
+        endpoints.append(to_endpoint(move_info["url"]))
+    if full_learnsets:
+        for move_entry in pokemon_main_data["moves"]:
+            endpoints.append(to_endpoint(move_entry["move"]["url"]))
+    return endpoints
+
+
+def list_species_forms(pokemon_count: int) -> Dict[int, List[int]]:
+    """Map each fetched species to the IDs of its non-default varieties.
+
+    Args:
+        pokemon_count: Number of species fetched
+
+    Returns:
+        Dictionary of species ID -> form Pokemon IDs (10001+), in API order
+    """
+    species_forms: Dict[int, List[int]] = {}
+    for i in range(1, pokemon_count + 1):
+        pokemon_species_data = payload_cache.get(f"pokemon-species/{i}")
+        if not pokemon_species_data:
+            continue
+        form_ids = [int(variety["pokemon"]["url"].rstrip("/").split("/")[-1])
+                    for variety in pokemon_species_data.get("varieties", [])
+                    if not variety["is_default"]]
+        if form_ids:
+            species_forms[i] = form_ids
+    return species_forms
+
+
+def discover_dependencies(pokemon_count: int, full_learnsets: bool = False,
+                          include_forms: bool = False) -> List[str]:
+    """Endpoints referenced by the first wave's pokemon/ and species payloads.
+
+    Args:
+        pokemon_count: Number of Pokemon planned
+        full_learnsets: Include every move the Pokemon can learn, not just
+            the four level-up moves kept on each record
+        include_forms: Include the pokemon/ payloads of every species' alternate forms
+
+    Returns:
+        Ability, move, evolution chain and form endpoints (may contain duplicates)
+    """
+    endpoints = []
+    for i in range(1, pokemon_count + 1):
+        pokemon_main_data = payload_cache.get(f"pokemon/{i}")
+        pokemon_species_data = payload_cache.get(f"pokemon-species/{i}")
+        if pokemon_main_data:
+            endpoints.extend(pokemon_dependencies(pokemon_main_data, full_learnsets))
+        if pokemon_species_data and pokemon_species_data.get("evolution_chain"):
+            endpoints.append(to_endpoint(pokemon_species_data["evolution_chain"]["url"]))
+    if include_forms:
+        for form_ids in list_species_forms(pokemon_count).values():
+            endpoints.extend(f"pokemon/{form_id}" for form_id in form_ids)
+    return endpoints
+
+
+def discover_form_dependencies(pokemon_count: int, full_learnsets: bool = False) -> List[str]:
+    """Ability and move endpoints referenced by the fetched form payloads."""
+    endpoints = []
+    for form_ids in list_species_forms(pokemon_count).values():
+        for form_id in form_ids:
+            form_data = payload_cache.get(f"pokemon/{form_id}")
+            if form_data:
+                endpoints.extend(pokemon_dependencies(form_data, full_learnsets))
+    return endpoints
+
+
+def fetch_wave(endpoints: List[str], workers: int = 4, sleep_time: float = 0.0) -> int:
+    """Fetch a wave of endpoints concurrently into payload_cache.
+
+    Args:
+        endpoints: Endpoints with no unfetched dependencies
+        workers: Maximum concurrent requests
+        sleep_time: Pause per worker after each request
+
+    Returns:
+        Number of endpoints that failed
+    """
+    def fetch(endpoint: str) -> bool:
+        payload = get_data(endpoint)
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+            metrics.record_sleep("throttle", sleep_time)
+        return payload is not None
+
+    pending = [endpoint for endpoint in endpoints if not load_cached_payload(endpoint)]
+    if len(pending) < len(endpoints):
+        logger.info(f"  {len(endpoints) - len(pending)} loaded from cache, {len(pending)} to fetch")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(fetch, pending))
+    return results.count(False)
+
+
+def prefetch_resources(pokemon_count: int, workers: int = 4, sleep_time: float = 0.0,
+                       full_learnsets: bool = False, include_forms: bool = False) -> FetchPlan:
+    """Plan and fetch every resource the build needs, wave by wave.
+
+    Args:
+        pokemon_count: Number of Pokemon to fetch
+        workers: Maximum concurrent requests
+        sleep_time: Pause per worker after each request
+        full_learnsets: Also fetch every learnable move (see build_learnsets)
+        include_forms: Also fetch alternate forms and their abilities/moves (see build_forms)
+
+    Returns:
+        The executed plan
+    """
+    plan = FetchPlan()
+    wave = plan.add_wave(plan_initial_wave(pokemon_count))
+    logger.info(f"Wave 1: fetching {len(wave)} pokemon, species and type resources...")
+    failures = fetch_wave(wave, workers, sleep_time)
+
+    wave = plan.add_wave(discover_dependencies(pokemon_count, full_learnsets, include_forms))
+    logger.info(f"Wave 2: fetching {len(wave)} ability, move, evolution chain "
+                f"and form resources...")
+    failures += fetch_wave(wave, workers, sleep_time)
+
+    if include_forms:
+        wave = plan.add_wave(discover_form_dependencies(pokemon_count, full_learnsets))
+        logger.info(f"Wave 3: fetching {len(wave)} ability and move resources for forms...")
+        failures += fetch_wave(wave, workers, sleep_time)
+
+    if failures:
+        logger.warning(f"{failures} of {plan.request_count} planned requests failed")
+    return plan
+
+
+def estimate_fetch_seconds(request_count: int, workers: int, calls_per_minute: int) -> float:
+    """Estimate wall time for a number of requests under the rate limit."""
+    rate_bound = request_count / (calls_per_minute / 60)
+    concurrency_bound = request_count * ASSUMED_LATENCY_SECONDS / max(1, workers)
+    return max(rate_bound, concurrency_bound)
+
+
+def print_fetch_plan(pokemon_count: int, workers: int, calls_per_minute: int,
+                     full_learnsets: bool = False, include_forms: bool = False) -> None:
+    """Log a dry-run plan: request counts per wave and estimated time.
+
+    Wave 1 is exact. Wave 2 depends on wave-1 payloads, so it is bounded
+    using the counts reported by the ability, move and evolution-chain list
+    endpoints (three requests).
+    """
+    wave1 = len(set(plan_initial_wave(pokemon_count)))
+    moves_per_pokemon = 100 if full_learnsets else 4
+    bounds = {}
+    per_pokemon_bounds = (("ability", 3), ("move", moves_per_pokemon), ("evolution-chain", 1))
+    for resource, per_pokemon in per_pokemon_bounds:
+        listing = get_data(f"{resource}?limit=1")
+        listed = listing.get("count") if listing else None
+        estimate = pokemon_count * per_pokemon
+        bounds[resource] = min(listed, estimate) if listed else estimate
+
+    if include_forms:
+        # The pokemon/ list counts every species plus every form
+        listing = get_data("pokemon?limit=1")
+        bounds["forms"] = (max(0, listing["count"] - POKEMON_COUNT) if listing
+                           else pokemon_count // 3)
+
+    wave2 = sum(bounds.values())
+    total = wave1 + wave2
+    logger.info("Fetch plan (dry run)")
+    logger.info("-" * 60)
+    logger.info(f"Wave 1  pokemon/species/type: {wave1:>6} requests (exact)")
+    logger.info(f"Wave 2  abilities:            {bounds['ability']:>6} requests (upper bound)")
+    logger.info(f"        moves:                {bounds['move']:>6} requests (upper bound)")
+    logger.info(f"        evolution chains:     {bounds['evolution-chain']:>6} requests "
+                f"(upper bound)")
+    if include_forms:
+        logger.info(f"        forms:                {bounds['forms']:>6} requests (upper bound; "
+                    f"their new abilities/moves follow in wave 3)")
+    logger.info("-" * 60)
+    logger.info(f"Total: <= {total} requests with {workers} workers "
+                f"at {calls_per_minute} calls/min")
+    estimated_minutes = estimate_fetch_seconds(total, workers, calls_per_minute) / 60
+    logger.info(f"Estimated time: <= {estimated_minutes:.1f} minutes")
+
+
+def build_move_table(move_endpoints: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Build the shared move table referenced by integer-indexed learnsets.
+
+    Args:
+        move_endpoints: Unique move/ endpoints, already fetched
+
+    Returns:
+        Tuple of (move table ordered by move ID, endpoint -> table index)
+    """
+    def move_id(endpoint: str) -> int:
+        return int(endpoint.rstrip("/").split("/")[-1])
+
+    type_names: Dict[str, Dict[str, str]] = {}
+
+    def localized_type_name(type_name: str) -> str:
+        if type_name not in type_names:
+            type_detail_data = payload_cache.get(f"type/{type_name}")
+            type_names[type_name] = (index_localized(type_detail_data["names"])
+                                     if type_detail_data else {})
+        return lookup_localized(type_names[type_name], "ja-Hrkt") or type_name.capitalize()
+
+    moves = []
+    move_index = {}
+    for endpoint in sorted(move_endpoints, key=move_id):
+        move_detail_data = payload_cache.get(endpoint)
+        if not move_detail_data:
+            continue
+        move_name_en = move_detail_data["name"].replace("-", " ").title()
+        move_index[endpoint] = len(moves)
+        moves.append({
+            "id": move_detail_data["id"],
+            "name_en": move_name_en,
+            "name_jp": get_localized_name(move_detail_data["names"]) or move_name_en,
+            "type_en": move_detail_data["type"]["name"].capitalize(),
+            "type_jp": localized_type_name(move_detail_data["type"]["name"]),
+            "damage_class": (move_detail_data["damage_class"]["name"]
+                             if move_detail_data.get("damage_class") else None),
+            "power": move_detail_data["power"],
+            "accuracy": move_detail_data["accuracy"],
+            "pp": move_detail_data["pp"]
+        })
+    return moves, move_index
+
+
+def build_learnsets(pokemon_count: int) -> Dict[str, Any]:
+    """Build full learnsets (level-up, TM, egg, tutor) for every version group.
+
+    Each move appears once in a shared table; learnsets reference it by
+    index, so richer data costs a few integers per entry instead of a copy
+    of the move. Reads only from payload_cache, so prefetch_resources()
+    must have run with full_learnsets=True.
+
+    Args:
+        pokemon_count: Number of Pokemon fetched
+
+    Returns:
+        Dictionary with `version_groups`, `methods`, `moves` and `learnsets`,
+        where learnsets[id][version_group_index] is a flat
+        [move_index, method_index, level, ...] array
+    """
+    method_index = {name: i for i, name in enumerate(LEARN_METHODS)}
+    pokemon_payloads = {}
+    move_endpoints = set()
+    version_groups = set()
+    for i in range(1, pokemon_count + 1):
+        pokemon_main_data = payload_cache.get(f"pokemon/{i}")
+        if not pokemon_main_data:
+            continue
+        pokemon_payloads[i] = pokemon_main_data
+        for move_entry in pokemon_main_data["moves"]:
+            move_endpoints.add(to_endpoint(move_entry["move"]["url"]))
+            for detail in move_entry["version_group_details"]:
+                version_groups.add(detail["version_group"]["name"])
+
+    moves, move_index = build_move_table(list(move_endpoints))
+    # Newest version groups first, unknown ones after in name order
+    version_group_names = sorted(version_groups, key=lambda name: (
+        VERSION_PRIORITY_RANK.get(name, len(VERSION_PRIORITY)), name))
+    version_group_index = {name: i for i, name in enumerate(version_group_names)}
+
+    learnsets = {}
+    for pokemon_id, pokemon_main_data in pokemon_payloads.items():
+        entries = [[] for _ in version_group_names]
+        for move_entry in pokemon_main_data["moves"]:
+            move_idx = move_index.get(to_endpoint(move_entry["move"]["url"]))
+            if move_idx is None:
+                continue
+            for detail in move_entry["version_group_details"]:
+                method = method_index.get(detail["move_learn_method"]["name"])
+                if method is None:
+                    continue
+                entries[version_group_index[detail["version_group"]["name"]]].append(
+                    (method, detail["level_learned_at"], move_idx))
+        learnsets[str(pokemon_id)] = [
+            [value for method, level, move_idx in sorted(set(group))
+             for value in (move_idx, method, level)]
+            for group in entries
+        ]
+
+    return {
+        "version_groups": version_group_names,
+        "methods": LEARN_METHODS,
+        "moves": moves,
+        "learnsets": learnsets
+    }
 
 def validate_pokemon_data(pokemon_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """Validate that pokemon data has all required fields.
@@ -171,6 +653,71 @@ def validate_pokemon_data(pokemon_data: Dict[str, Any]) -> Tuple[bool, List[str]
     
     return (len(missing_fields) == 0, missing_fields)
 
+
+def index_localized(entries: List[Dict[str, Any]], field: str = "name") -> Dict[str, str]:
+    """Index a PokeAPI `names`/`genera` list by language in one pass.
+
+    Args:
+        entries: List of localized entries from the API
+        field: Value to keep from each entry ("name", "genus", ...)
+
+    Returns:
+        Dictionary of language code -> value (first entry per language wins)
+    """
+    index: Dict[str, str] = {}
+    for entry in entries:
+        index.setdefault(entry["language"]["name"], entry[field])
+    return index
+
+
+def lookup_localized(index: Dict[str, str], lang_code: str) -> Optional[str]:
+    """Look up a language in an index, trying LANGUAGE_FALLBACKS if it is missing."""
+    for code in [lang_code] + LANGUAGE_FALLBACKS.get(lang_code, []):
+        if code in index:
+            return index[code]
+    return None
+
+
+def index_flavor_texts(flavor_text_entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """Index flavor texts by language, then version, in one pass.
+
+    Versions keep the API's order, so the first version of each language is
+    the fallback when none of the preferred versions exist.
+
+    Args:
+        flavor_text_entries: List of flavor text dictionaries from API
+
+    Returns:
+        Dictionary of language code -> {version: cleaned text}
+    """
+    index: Dict[str, Dict[str, str]] = {}
+    for entry in flavor_text_entries:
+        by_version = index.setdefault(entry["language"]["name"], {})
+        flavor_text = entry["flavor_text"].replace("\n", " ").replace("\f", " ")
+        by_version.setdefault(entry["version"]["name"], flavor_text)
+    return index
+
+
+def select_flavor_text(index: Dict[str, Dict[str, str]], lang_code: str,
+                       versions: Sequence[str] = FLAVOR_TEXT_VERSIONS) -> str:
+    """Pick a flavor text from index_flavor_texts() output.
+
+    Args:
+        index: Output of index_flavor_texts()
+        lang_code: Language code
+        versions: Versions to try in order before falling back to any entry
+
+    Returns:
+        Flavor text, or "No description available."
+    """
+    by_version = index.get(lang_code)
+    if not by_version:
+        return "No description available."
+    for version in versions:
+        if version in by_version:
+            return by_version[version]
+    return next(iter(by_version.values()))
+
 def get_localized_name(names_list: List[Dict[str, Any]], lang_code: str = "ja-Hrkt") -> Optional[str]:
     """Extracts a localized name from a list of names.
     
@@ -181,15 +728,7 @@ def get_localized_name(names_list: List[Dict[str, Any]], lang_code: str = "ja-Hr
     Returns:
         Localized name string if found, None otherwise
     """
-    for name_entry in names_list:
-        if name_entry["language"]["name"] == lang_code:
-            return name_entry["name"]
-    # Fallback if specific lang_code not found
-    if lang_code == "ja-Hrkt": # try "ja" if "ja-Hrkt" fails
-        for name_entry in names_list:
-            if name_entry["language"]["name"] == "ja":
-                return name_entry["name"]
-    return None
+    return lookup_localized(index_localized(names_list), lang_code)
 
 def get_localized_flavor_text(flavor_text_entries: List[Dict[str, Any]], lang_code: str = "en", version: str = "red") -> Optional[str]:
     """Extracts a localized Pokedex entry for a specific game version.
@@ -202,14 +741,7 @@ def get_localized_flavor_text(flavor_text_entries: List[Dict[str, Any]], lang_co
     Returns:
         Localized flavor text if found, None otherwise
     """
-    for entry in flavor_text_entries:
-        if entry["language"]["name"] == lang_code and entry["version"]["name"] == version:
-            return entry["flavor_text"].replace("\n", " ").replace("\f", " ")
-    # Fallback to any entry if specific version not found
-    for entry in flavor_text_entries:
-        if entry["language"]["name"] == lang_code:
-            return entry["flavor_text"].replace("\n", " ").replace("\f", " ")
-    return "No description available."
+    return select_flavor_text(index_flavor_texts(flavor_text_entries), lang_code, [version])
 
 def calculate_weaknesses(pokemon_types):
     """Calculate type weaknesses based on Pokemon types."""
@@ -266,333 +798,488 @@ def calculate_resistances(pokemon_types):
     
     return resistances, immunities
 
+
+def format_evolution_method(detail: Dict[str, Any]) -> Dict[str, Any]:
+    """Formats a single PokeAPI evolution detail into a compact metadata object."""
+    def nested_name(key):
+        value = detail.get(key)
+        if isinstance(value, dict):
+            return value.get("name")
+        return None
+
+    trigger = detail.get("trigger", {}).get("name")
+    item = nested_name("item")
+    held_item = nested_name("held_item")
+    known_move = nested_name("known_move")
+    known_move_type = nested_name("known_move_type")
+    location = nested_name("location")
+    party_species = nested_name("party_species")
+    party_type = nested_name("party_type")
+    trade_species = nested_name("trade_species")
+
+    method = {
+        "trigger": trigger,
+        "min_level": detail.get("min_level"),
+        "item": item,
+        "held_item": held_item,
+        "known_move": known_move,
+        "known_move_type": known_move_type,
+        "location": location,
+        "min_happiness": detail.get("min_happiness"),
+        "min_beauty": detail.get("min_beauty"),
+        "min_affection": detail.get("min_affection"),
+        "time_of_day": detail.get("time_of_day"),
+        "gender": detail.get("gender"),
+        "relative_physical_stats": detail.get("relative_physical_stats"),
+        "needs_overworld_rain": detail.get("needs_overworld_rain"),
+        "party_species": party_species,
+        "party_type": party_type,
+        "trade_species": trade_species,
+        "turn_upside_down": detail.get("turn_upside_down", False)
+    }
+
+    description_parts = []
+    if trigger == "level-up":
+        if method["min_level"]:
+            description_parts.append(f"Level {method['min_level']}")
+        else:
+            description_parts.append("Level-up")
+    elif trigger == "use-item":
+        description_parts.append(f"Use {item.replace('-', ' ').title()}" if item else "Use item")
+    elif trigger == "trade":
+        description_parts.append("Trade")
+    else:
+        description_parts.append(trigger.replace("-", " ").title() if trigger else "Special")
+
+    if method["time_of_day"]:
+        description_parts.append(method["time_of_day"].title())
+    if method["held_item"]:
+        description_parts.append(f"Holding {method['held_item'].replace('-', ' ').title()}")
+    if method["known_move"]:
+        description_parts.append(f"Knows {method['known_move'].replace('-', ' ').title()}")
+    if method["known_move_type"]:
+        description_parts.append(f"{method['known_move_type'].replace('-', ' ').title()} move")
+    if method["location"]:
+        description_parts.append(f"At {method['location'].replace('-', ' ').title()}")
+    if method["min_happiness"]:
+        description_parts.append(f"Happiness {method['min_happiness']}+")
+    if method["min_beauty"]:
+        description_parts.append(f"Beauty {method['min_beauty']}+")
+    if method["min_affection"]:
+        description_parts.append(f"Affection {method['min_affection']}+")
+    if method["trade_species"]:
+        description_parts.append(f"for {method['trade_species'].replace('-', ' ').title()}")
+    if method["needs_overworld_rain"]:
+        description_parts.append("While raining")
+    if method["turn_upside_down"]:
+        description_parts.append("Upside-down device")
+
+    method["description"] = ", ".join(description_parts)
+    return method
+
+
+def parse_evolution_chain(chain_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse an evolution-chain payload into nodes and transition methods."""
+    evolution_nodes = []
+    evolution_transitions = []
+    seen_nodes = set()
+
+    def parse_chain(chain_link, parent_id=None):
+        """Recursively parse evolution chain and transition methods."""
+        species_name = chain_link["species"]["name"]
+        species_id = int(chain_link["species"]["url"].rstrip('/').split('/')[-1])
+
+        if species_id not in seen_nodes:
+            evolution_nodes.append({
+                "name": species_name.capitalize(),
+                "id": species_id
+            })
+            seen_nodes.add(species_id)
+
+        if parent_id is not None:
+            method_details = chain_link.get("evolution_details") or []
+            methods = [format_evolution_method(detail) for detail in method_details]
+            if not methods:
+                methods = [{"trigger": None, "description": "Unknown method"}]
+            evolution_transitions.append({
+                "from_id": parent_id,
+                "to_id": species_id,
+                "methods": methods
+            })
+
+        for evolution in chain_link.get("evolves_to", []):
+            parse_chain(evolution, species_id)
+
+    parse_chain(chain_data["chain"])
+    return {
+        "nodes": evolution_nodes,
+        "transitions": evolution_transitions
+    }
+
 def fetch_evolution_chain(evolution_chain_url):
     """Fetch and parse evolution chain data."""
     if not evolution_chain_url:
         return []
     
     try:
-        chain_data = get_data(evolution_chain_url.replace(BASE_URL, ""))
+        chain_data = get_data(to_endpoint(evolution_chain_url))
         if not chain_data:
             return []
-        
-        evolution_nodes = []
-        evolution_transitions = []
-        seen_nodes = set()
-
-        def format_evolution_method(detail):
-            """Formats a single PokeAPI evolution detail into a compact metadata object."""
-            def nested_name(key):
-                value = detail.get(key)
-                if isinstance(value, dict):
-                    return value.get("name")
-                return None
-
-            trigger = detail.get("trigger", {}).get("name")
-            item = nested_name("item")
-            held_item = nested_name("held_item")
-            known_move = nested_name("known_move")
-            known_move_type = nested_name("known_move_type")
-            location = nested_name("location")
-            party_species = nested_name("party_species")
-            party_type = nested_name("party_type")
-            trade_species = nested_name("trade_species")
-
-            method = {
-                "trigger": trigger,
-                "min_level": detail.get("min_level"),
-                "item": item,
-                "held_item": held_item,
-                "known_move": known_move,
-                "known_move_type": known_move_type,
-                "location": location,
-                "min_happiness": detail.get("min_happiness"),
-                "min_beauty": detail.get("min_beauty"),
-                "min_affection": detail.get("min_affection"),
-                "time_of_day": detail.get("time_of_day"),
-                "gender": detail.get("gender"),
-                "relative_physical_stats": detail.get("relative_physical_stats"),
-                "needs_overworld_rain": detail.get("needs_overworld_rain"),
-                "party_species": party_species,
-                "party_type": party_type,
-                "trade_species": trade_species,
-                "turn_upside_down": detail.get("turn_upside_down", False)
-            }
-
-            description_parts = []
-            if trigger == "level-up":
-                if method["min_level"]:
-                    description_parts.append(f"Level {method['min_level']}")
-                else:
-                    description_parts.append("Level-up")
-            elif trigger == "use-item":
-                description_parts.append(f"Use {item.replace('-', ' ').title()}" if item else "Use item")
-            elif trigger == "trade":
-                description_parts.append("Trade")
-            else:
-                description_parts.append(trigger.replace("-", " ").title() if trigger else "Special")
-
-            if method["time_of_day"]:
-                description_parts.append(method["time_of_day"].title())
-            if method["held_item"]:
-                description_parts.append(f"Holding {method['held_item'].replace('-', ' ').title()}")
-            if method["known_move"]:
-                description_parts.append(f"Knows {method['known_move'].replace('-', ' ').title()}")
-            if method["known_move_type"]:
-                description_parts.append(f"{method['known_move_type'].replace('-', ' ').title()} move")
-            if method["location"]:
-                description_parts.append(f"At {method['location'].replace('-', ' ').title()}")
-            if method["min_happiness"]:
-                description_parts.append(f"Happiness {method['min_happiness']}+")
-            if method["min_beauty"]:
-                description_parts.append(f"Beauty {method['min_beauty']}+")
-            if method["min_affection"]:
-                description_parts.append(f"Affection {method['min_affection']}+")
-            if method["trade_species"]:
-                description_parts.append(f"for {method['trade_species'].replace('-', ' ').title()}")
-            if method["needs_overworld_rain"]:
-                description_parts.append("While raining")
-            if method["turn_upside_down"]:
-                description_parts.append("Upside-down device")
-
-            method["description"] = ", ".join(description_parts)
-            return method
-
-        def parse_chain(chain_link, parent_id=None):
-            """Recursively parse evolution chain and transition methods."""
-            species_name = chain_link["species"]["name"]
-            species_id = int(chain_link["species"]["url"].rstrip('/').split('/')[-1])
-
-            if species_id not in seen_nodes:
-                evolution_nodes.append({
-                    "name": species_name.capitalize(),
-                    "id": species_id
-                })
-                seen_nodes.add(species_id)
-
-            if parent_id is not None:
-                method_details = chain_link.get("evolution_details") or []
-                methods = [format_evolution_method(detail) for detail in method_details]
-                if not methods:
-                    methods = [{"trigger": None, "description": "Unknown method"}]
-                evolution_transitions.append({
-                    "from_id": parent_id,
-                    "to_id": species_id,
-                    "methods": methods
-                })
-
-            for evolution in chain_link.get("evolves_to", []):
-                parse_chain(evolution, species_id)
-
-        parse_chain(chain_data["chain"])
-        return {
-            "nodes": evolution_nodes,
-            "transitions": evolution_transitions
-        }
-        
+        return parse_evolution_chain(chain_data)
     except Exception as e:
         logger.error(f"Error fetching evolution chain: {e}")
         return []
 
-def fetch_and_build_pokedex(pokemon_count=POKEMON_COUNT, base_url=BASE_URL, sleep_time=0.2):
-    all_pokemon_data = []
-    type_cache = {}
-    evolution_chain_cache = {}  # Cache to store complete evolution chains
-    validation_errors = []  # Track validation errors
+
+def convert_sprite_url(url: Optional[str]) -> Optional[str]:
+    """Convert raw.githubusercontent.com sprite URLs to the jsDelivr CDN."""
+    if url:
+        parsed = urlparse(url)
+        if parsed.hostname == "raw.githubusercontent.com":
+            return url.replace(
+                "https://raw.githubusercontent.com/",
+                "https://cdn.jsdelivr.net/gh/"
+            ).replace("/master/", "@master/")
+    return url
+
+
+def collect_pokemon_payloads(pokemon_id: int, species_id: Optional[int] = None) -> Dict[str, Any]:
+    """Gather every fetched payload needed to assemble one Pokemon.
     
-    for i in range(1, pokemon_count + 1):
-        pokemon_main_data = get_data(f"pokemon/{i}")
-        pokemon_species_data = get_data(f"pokemon-species/{i}")
-        if not pokemon_main_data or not pokemon_species_data:
-            time.sleep(sleep_time)
-            continue
-        name_en = pokemon_main_data["name"].capitalize()
-        name_jp = get_localized_name(pokemon_species_data["names"]) or name_en
-        types_en = []
-        types_jp = []
-        for type_entry in pokemon_main_data["types"]:
-            type_name_en = type_entry["type"]["name"].capitalize()
-            types_en.append(type_name_en)
-            if type_name_en not in type_cache:
-                type_detail_data = get_data(f"type/{type_entry['type']['name']}")
-                if type_detail_data:
-                    type_name_jp = get_localized_name(type_detail_data["names"]) or type_name_en
-                    type_cache[type_name_en] = type_name_jp
-                else:
-                    type_cache[type_name_en] = type_name_en
-                time.sleep(0.1)
-            types_jp.append(type_cache[type_name_en])
-        stats = {"hp": 0, "attack": 0, "defense": 0, "special-attack": 0, "special-defense": 0, "speed": 0}
-        for stat in pokemon_main_data["stats"]:
-            stats[stat["stat"]["name"]] = stat["base_stat"]
-        bio_en = get_localized_flavor_text(pokemon_species_data["flavor_text_entries"], "en", "red")
-        if bio_en == "No description available.":
-            bio_en = get_localized_flavor_text(pokemon_species_data["flavor_text_entries"], "en", "blue")
-        if bio_en == "No description available.":
-            bio_en = get_localized_flavor_text(pokemon_species_data["flavor_text_entries"], "en", "yellow")
-        bio_jp = get_localized_flavor_text(pokemon_species_data["flavor_text_entries"], "ja", "red")
-        if bio_jp == "No description available.":
-            bio_jp = get_localized_flavor_text(pokemon_species_data["flavor_text_entries"], "ja", "blue")
-        if bio_jp == "No description available.":
-            bio_jp = get_localized_flavor_text(pokemon_species_data["flavor_text_entries"], "ja", "yellow")
-        # Fetch abilities
-        abilities_data = []
-        for ability_entry in pokemon_main_data["abilities"]:
-            ability_detail = get_data(ability_entry["ability"]["url"].replace(base_url, ""))
-            if ability_detail:
-                ability_name_en = ability_detail["name"].replace("-", " ").title()
-                ability_name_jp = get_localized_name(ability_detail["names"]) or ability_name_en
-                abilities_data.append({
-                    "name_en": ability_name_en,
-                    "name_jp": ability_name_jp,
-                    "is_hidden": ability_entry["is_hidden"]
-                })
-                time.sleep(0.1)
-        
-        # Fetch genus (category) like "Seed Pokemon"
-        genus_en = "Unknown"
-        genus_jp = "Unknown"
-        for genus_entry in pokemon_species_data.get("genera", []):
-            if genus_entry["language"]["name"] == "en":
-                genus_en = genus_entry["genus"]
-            elif genus_entry["language"]["name"] == "ja":
-                genus_jp = genus_entry["genus"]
-        
-        # Get height (in decimeters) and weight (in hectograms)
-        height_dm = pokemon_main_data["height"]  # decimeters
-        weight_hg = pokemon_main_data["weight"]  # hectograms
-        height_m = height_dm / 10  # convert to meters
-        weight_kg = weight_hg / 10  # convert to kilograms
+    Args:
+        pokemon_id: National Dex ID, or form ID (10001+)
+        species_id: Species of a form (default: same as pokemon_id)
         
-        # Get additional sprites and convert to jsDelivr CDN
-        def convert_sprite_url(url):
-            if url:
-                parsed = urlparse(url)
-                if parsed.hostname == "raw.githubusercontent.com":
-                    return url.replace(
-                        "https://raw.githubusercontent.com/",
-                        "https://cdn.jsdelivr.net/gh/"
-                    ).replace("/master/", "@master/")
-            return url
+    Type payloads are reduced to their `names` list and limited to the
+    types the Pokemon and its moves actually use, since every bundle is
+    pickled to the assembly pool and full type payloads are large.
+
+    Returns:
+        Dictionary of endpoint -> payload, suitable for assemble_pokemon()
+    """
+    species_id = species_id or pokemon_id
+    payloads: Dict[str, Any] = {}
+    pokemon_main_data = payload_cache.get(f"pokemon/{pokemon_id}")
+    pokemon_species_data = payload_cache.get(f"pokemon-species/{species_id}")
+    payloads[f"pokemon/{pokemon_id}"] = pokemon_main_data
+    payloads[f"pokemon-species/{species_id}"] = pokemon_species_data
+
+    type_names = set()
+    if pokemon_main_data:
+        type_names.update(type_entry["type"]["name"] for type_entry in pokemon_main_data["types"])
+        for ability_entry in pokemon_main_data["abilities"]:
+            endpoint = to_endpoint(ability_entry["ability"]["url"])
+            payloads[endpoint] = payload_cache.get(endpoint)
+        for move_info in select_level_up_moves(pokemon_main_data)[:4]:
+            endpoint = to_endpoint(move_info["url"])
+            payloads[endpoint] = move_detail_data = payload_cache.get(endpoint)
+            if move_detail_data:
+                type_names.add(move_detail_data["type"]["name"])
+    if pokemon_species_data and pokemon_species_data.get("evolution_chain"):
+        endpoint = to_endpoint(pokemon_species_data["evolution_chain"]["url"])
+        payloads[endpoint] = payload_cache.get(endpoint)
+    for type_name in type_names:
+        type_detail_data = payload_cache.get(f"type/{type_name}")
+        payloads[f"type/{type_name}"] = ({"names": type_detail_data["names"]}
+                                         if type_detail_data else None)
+    return payloads
+
+
+def assemble_pokemon(pokemon_id: int, payloads: Dict[str, Any], species_id: Optional[int] = None,
+                     languages: Sequence[str] = BASE_LANGUAGES,
+                     flavor_versions: Sequence[str] = FLAVOR_TEXT_VERSIONS
+                     ) -> Optional[Dict[str, Any]]:
+    """Build one Pokemon record from already-fetched payloads.
+
+    Pure function with no network access or shared state, so it can run in
+    a process pool. Each payload's localized entries are indexed once and
+    every configured language is read from the index.
+
+    Args:
+        pokemon_id: National Dex ID, or form ID (10001+)
+        payloads: Output of collect_pokemon_payloads()
+        species_id: Species of a form (default: same as pokemon_id)
+        languages: Languages to extract; those beyond BASE_LANGUAGES go
+            into a `localized` object keyed by PokeAPI language code
+        flavor_versions: Preferred game versions for bios, in order
         
-        sprites = {
-            "front_default": convert_sprite_url(pokemon_main_data["sprites"]["front_default"]),
-            "front_shiny": convert_sprite_url(pokemon_main_data["sprites"]["front_shiny"]),
-            "back_default": convert_sprite_url(pokemon_main_data["sprites"]["back_default"]),
-            "back_shiny": convert_sprite_url(pokemon_main_data["sprites"]["back_shiny"]),
-            "official_artwork": convert_sprite_url(pokemon_main_data["sprites"]["other"]["official-artwork"]["front_default"]) if pokemon_main_data["sprites"].get("other", {}).get("official-artwork") else None
+    Returns:
+        Pokemon record, or None if the core payloads are missing
+    """
+    pokemon_main_data = payloads.get(f"pokemon/{pokemon_id}")
+    pokemon_species_data = payloads.get(f"pokemon-species/{species_id or pokemon_id}")
+    if not pokemon_main_data or not pokemon_species_data:
+        return None
+
+    # Each payload's names are indexed once and reused for every lookup and language
+    name_indexes: Dict[str, Dict[str, str]] = {}
+
+    def localized_name(endpoint: str, fallback: str, lang_code: str = "ja-Hrkt") -> str:
+        if endpoint not in name_indexes:
+            detail_data = payloads.get(endpoint)
+            name_indexes[endpoint] = index_localized(detail_data["names"]) if detail_data else {}
+        return lookup_localized(name_indexes[endpoint], lang_code) or fallback
+
+    def localized_type_name(type_name: str, lang_code: str = "ja-Hrkt") -> str:
+        return localized_name(f"type/{type_name}", type_name.capitalize(), lang_code)
+
+    species_names = index_localized(pokemon_species_data["names"])
+    species_genera = index_localized(pokemon_species_data.get("genera", []), "genus")
+    flavor_texts = index_flavor_texts(pokemon_species_data["flavor_text_entries"])
+
+    name_en = pokemon_main_data["name"].capitalize()
+    name_jp = lookup_localized(species_names, "ja-Hrkt") or name_en
+    types_en = []
+    types_jp = []
+    for type_entry in pokemon_main_data["types"]:
+        types_en.append(type_entry["type"]["name"].capitalize())
+        types_jp.append(localized_type_name(type_entry["type"]["name"]))
+    stats = {"hp": 0, "attack": 0, "defense": 0,
+             "special-attack": 0, "special-defense": 0, "speed": 0}
+    for stat in pokemon_main_data["stats"]:
+        stats[stat["stat"]["name"]] = stat["base_stat"]
+    bio_en = select_flavor_text(flavor_texts, "en", flavor_versions)
+    bio_jp = select_flavor_text(flavor_texts, "ja", flavor_versions)
+    # Abilities
+    abilities_data = []
+    for ability_entry in pokemon_main_data["abilities"]:
+        ability_endpoint = to_endpoint(ability_entry["ability"]["url"])
+        ability_detail = payloads.get(ability_endpoint)
+        if ability_detail:
+            ability_name_en = ability_detail["name"].replace("-", " ").title()
+            ability_name_jp = localized_name(ability_endpoint, ability_name_en)
+            abilities_data.append({
+                "name_en": ability_name_en,
+                "name_jp": ability_name_jp,
+                "is_hidden": ability_entry["is_hidden"]
+            })
+
+    # Genus (category) like "Seed Pokemon"
+    genus_en = species_genera.get("en", "Unknown")
+    genus_jp = species_genera.get("ja", "Unknown")
+
+    # Get height (in decimeters) and weight (in hectograms)
+    height_m = pokemon_main_data["height"] / 10  # convert to meters
+    weight_kg = pokemon_main_data["weight"] / 10  # convert to kilograms
+
+    # Additional sprites, converted to jsDelivr CDN
+    raw_sprites = pokemon_main_data["sprites"]
+    official_artwork = raw_sprites.get("other", {}).get("official-artwork")
+    sprites = {
+        "front_default": convert_sprite_url(raw_sprites["front_default"]),
+        "front_shiny": convert_sprite_url(raw_sprites["front_shiny"]),
+        "back_default": convert_sprite_url(raw_sprites["back_default"]),
+        "back_shiny": convert_sprite_url(raw_sprites["back_shiny"]),
+        "official_artwork": (convert_sprite_url(official_artwork["front_default"])
+                             if official_artwork else None)
+    }
+
+    moves_data = []
+    for move_info in select_level_up_moves(pokemon_main_data)[:4]:
+        move_endpoint = to_endpoint(move_info["url"])
+        move_detail_data = payloads.get(move_endpoint)
+        if move_detail_data:
+            move_name_en = move_detail_data["name"].replace("-", " ").title()
+            move_name_jp = localized_name(move_endpoint, move_name_en)
+            damage_class = (move_detail_data["damage_class"]["name"]
+                            if move_detail_data.get("damage_class") else None)
+            moves_data.append({
+                "name_en": move_name_en,
+                "name_jp": move_name_jp,
+                "type_en": move_detail_data["type"]["name"].capitalize(),
+                "type_jp": localized_type_name(move_detail_data["type"]["name"]),
+                "damage_class": damage_class,
+                "damage_class_en": damage_class.replace("-", " ").title() if damage_class else None,
+                "power": move_detail_data["power"],
+                "accuracy": move_detail_data["accuracy"],
+                "pp": move_detail_data["pp"],
+                "level": move_info["level"]
+            })
+
+    # Evolution chain
+    evolution_chain = []
+    if pokemon_species_data.get("evolution_chain"):
+        chain_data = payloads.get(to_endpoint(pokemon_species_data["evolution_chain"]["url"]))
+        if chain_data:
+            evolution_chain = parse_evolution_chain(chain_data)
+
+    # Calculate type weaknesses, resistances, and immunities
+    weaknesses = calculate_weaknesses(types_en)
+    resistances, immunities = calculate_resistances(types_en)
+
+    pokemon_obj = {
+        "id": pokemon_main_data["id"],
+        "name_en": name_en,
+        "name_jp": name_jp,
+        "sprite": convert_sprite_url(pokemon_main_data["sprites"]["front_default"]),
+        "sprites": sprites,
+        "types_en": types_en,
+        "types_jp": types_jp,
+        "stats": stats,
+        "bio_en": bio_en,
+        "bio_jp": bio_jp,
+        "abilities": abilities_data,
+        "height": height_m,
+        "weight": weight_kg,
+        "genus_en": genus_en,
+        "genus_jp": genus_jp,
+        "moves": moves_data,
+        "evolution_chain": evolution_chain,
+        "weaknesses": weaknesses,
+        "resistances": resistances,
+        "immunities": immunities
+    }
+
+    extra_languages = [lang for lang in languages if lang not in BASE_LANGUAGES]
+    if extra_languages:
+        pokemon_obj["localized"] = {
+            lang: {
+                "name": lookup_localized(species_names, lang) or name_en,
+                "genus": lookup_localized(species_genera, lang),
+                "bio": select_flavor_text(flavor_texts, lang, flavor_versions),
+                "types": [localized_type_name(type_entry["type"]["name"], lang)
+                          for type_entry in pokemon_main_data["types"]]
+            }
+            for lang in extra_languages
         }
+    return pokemon_obj
+
+
+def _assemble_from_bundle(bundle: Tuple[Any, ...], **options: Any) -> Optional[Dict[str, Any]]:
+    """Process-pool entry point for assemble_pokemon()."""
+    return assemble_pokemon(*bundle, **options)
+
+
+def assemble_all(bundles: Iterable[Tuple[Any, ...]], processes: Optional[int] = None,
+                 **options: Any) -> List[Optional[Dict[str, Any]]]:
+    """Run assemble_pokemon() over bundles, in a process pool if processes > 1.
+
+    Bundles are consumed ASSEMBLY_CHUNK_SIZE at a time, so a generator that
+    collects payloads lazily only keeps one chunk of them alive.
+
+    Args:
+        bundles: (pokemon_id, payloads[, species_id]) tuples
+        processes: Assembly processes (default: all cores; 1 assembles inline)
+        **options: Keyword arguments for assemble_pokemon()
         
-        moves_data = []
-        level_up_moves = []
-        
-        # Try to get level-up moves from any version, prioritizing more recent games
-        for move_entry in pokemon_main_data["moves"]:
-            best_version = None
-            best_priority = len(VERSION_PRIORITY)
-            best_level = 0
-            
-            for version_group_detail in move_entry["version_group_details"]:
-                if version_group_detail["move_learn_method"]["name"] == "level-up":
-                    version_name = version_group_detail["version_group"]["name"]
-                    level = version_group_detail["level_learned_at"]
-                    
-                    # Find priority for this version
-                    try:
-                        priority = VERSION_PRIORITY.index(version_name)
-                    except ValueError:
-                        priority = len(VERSION_PRIORITY)  # Unknown version gets lowest priority
-                    
-                    # Prefer versions with higher priority (lower index) and level > 0
-                    if level > 0 and priority < best_priority:
-                        best_version = version_name
-                        best_priority = priority
-                        best_level = level
-            
-            # If we found a valid level-up move, add it
-            if best_version is not None:
-                level_up_moves.append({
-                    "name": move_entry["move"]["name"],
-                    "url": move_entry["move"]["url"],
-                    "level": best_level
-                })
-        
-        level_up_moves.sort(key=lambda m: m["level"])
-        for move_info in level_up_moves[:4]:
-            move_detail_data = get_data(move_info["url"].replace(base_url, ""))
-            if move_detail_data:
-                move_name_en = move_detail_data["name"].replace("-", " ").title()
-                move_name_jp = get_localized_name(move_detail_data["names"]) or move_name_en
-                move_type_en = move_detail_data["type"]["name"].capitalize()
-                move_type_jp = type_cache.get(move_type_en, move_type_en)
-                if move_type_jp == move_type_en and move_type_en not in type_cache:
-                    type_detail = get_data(f"type/{move_detail_data['type']['name']}")
-                    if type_detail:
-                        move_type_jp = get_localized_name(type_detail["names"]) or move_type_en
-                        type_cache[move_type_en] = move_type_jp
-                    time.sleep(0.1)
-                moves_data.append({
-                    "name_en": move_name_en,
-                    "name_jp": move_name_jp,
-                    "type_en": move_type_en,
-                    "type_jp": move_type_jp,
-                    "damage_class": move_detail_data["damage_class"]["name"] if move_detail_data.get("damage_class") else None,
-                    "damage_class_en": move_detail_data["damage_class"]["name"].replace("-", " ").title() if move_detail_data.get("damage_class") else None,
-                    "power": move_detail_data["power"],
-                    "accuracy": move_detail_data["accuracy"],
-                    "pp": move_detail_data["pp"],
-                    "level": move_info["level"]
-                })
-                time.sleep(0.1)
-        # Fetch evolution chain (use cache to avoid duplicate fetches)
-        evolution_chain = []
-        if pokemon_species_data.get("evolution_chain"):
-            evolution_chain_url = pokemon_species_data["evolution_chain"]["url"]
-            
-            # Check if we've already fetched this evolution chain
-            if evolution_chain_url not in evolution_chain_cache:
-                evolution_chain_cache[evolution_chain_url] = fetch_evolution_chain(evolution_chain_url)
-                time.sleep(0.1)
-            
-            # Get the complete chain from cache
-            evolution_chain = evolution_chain_cache[evolution_chain_url]
-        
-        # Calculate type weaknesses, resistances, and immunities
-        weaknesses = calculate_weaknesses(types_en)
-        resistances, immunities = calculate_resistances(types_en)
+    Returns:
+        Records (or None) aligned with bundles
+    """
+    assemble = partial(_assemble_from_bundle, **options)
+    processes = processes or os.cpu_count() or 1
+    bundle_iter = iter(bundles)
+    first_chunk = list(islice(bundle_iter, ASSEMBLY_CHUNK_SIZE))
+    chunks = chain([first_chunk], iter(lambda: list(islice(bundle_iter, ASSEMBLY_CHUNK_SIZE)), []))
+    records: List[Optional[Dict[str, Any]]] = []
+    if processes > 1 and len(first_chunk) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            for chunk in chunks:
+                records.extend(pool.map(assemble, chunk, chunksize=16))
+        return records
+    for chunk in chunks:
+        records.extend(assemble(bundle) for bundle in chunk)
+    return records
+
+
+# Species-level fields forms read from their species record instead of repeating
+FORM_SHARED_FIELDS: Tuple[str, ...] = (
+    "name_jp", "bio_en", "bio_jp", "genus_en", "genus_jp", "evolution_chain", "localized"
+)
+
+
+def build_forms(pokemon_count: int, processes: Optional[int] = None,
+                **options: Any) -> Dict[str, Any]:
+    """Assemble alternate forms (megas, regional forms, Gigantamax, ...).
+
+    Each form keeps only what differs from its species (types, stats,
+    abilities, sprites, moves, size, matchups) plus `species_id`, which
+    points at the species record holding the shared bio, genus, Japanese
+    name and evolution chain. Reads only from payload_cache, so
+    prefetch_resources() must have run with include_forms=True.
+
+    Args:
+        pokemon_count: Number of species fetched
+        processes: Assembly processes (default: all cores)
+        **options: Keyword arguments for assemble_pokemon() (languages, ...)
         
-        # Convert sprite URLs to jsDelivr CDN for better reliability
-        sprite_url = pokemon_main_data["sprites"]["front_default"]
-        if sprite_url:
-            parsed_url = urlparse(sprite_url)
-            if parsed_url.hostname == "raw.githubusercontent.com":
-                sprite_url = sprite_url.replace(
-                    "https://raw.githubusercontent.com/",
-                    "https://cdn.jsdelivr.net/gh/"
-                ).replace("/master/", "@master/")
+    Returns:
+        Dictionary with `species_forms` (species ID -> form IDs) and `forms`
+    """
+    species_forms = list_species_forms(pokemon_count)
+    bundles = [(form_id, collect_pokemon_payloads(form_id, species_id), species_id)
+               for species_id, form_ids in species_forms.items() for form_id in form_ids]
+    records = assemble_all(bundles, processes, **options)
+
+    forms = []
+    for (form_id, payloads, species_id), record in zip(bundles, records):
+        if record is None:
+            logger.warning(f"Skipping form #{form_id}: payload missing")
+            continue
+        pokemon_name = payloads[f"pokemon/{form_id}"]["name"]
+        species_name = payloads[f"pokemon-species/{species_id}"].get("name", "")
+        form = {key: value for key, value in record.items() if key not in FORM_SHARED_FIELDS}
+        form["species_id"] = species_id
+        has_species_prefix = species_name and pokemon_name.startswith(species_name + "-")
+        form["form_name"] = (pokemon_name[len(species_name) + 1:] if has_species_prefix
+                             else pokemon_name)
+        forms.append(form)
+
+    return {
+        "species_forms": {str(species_id): form_ids
+                          for species_id, form_ids in species_forms.items()},
+        "forms": forms
+    }
+
+
+def fetch_and_build_pokedex(pokemon_count=POKEMON_COUNT, sleep_time=0.2, workers=4,
+                            processes=None, full_learnsets=False, languages=BASE_LANGUAGES,
+                            flavor_versions=FLAVOR_TEXT_VERSIONS, include_forms=False):
+    """Fetch every required payload, then assemble records in a process pool.
+
+    Each Pokemon's pokemon/ payload (and its species payload, unless forms
+    are built) is dropped from payload_cache once it is bundled, so raw
+    payloads are held for the whole dex only between the fetch and the
+    assembly stage. build_learnsets() needs them afterwards, so they are
+    kept with full_learnsets.
+
+    Args:
+        pokemon_count: Number of Pokemon to build
+        sleep_time: Pause per fetch worker after each request
+        workers: Maximum concurrent requests per fetch wave
+        processes: Assembly processes (default: all cores; 1 assembles inline)
+        full_learnsets: Also fetch every learnable move for build_learnsets()
+        languages: Languages to extract (see assemble_pokemon)
+        flavor_versions: Preferred game versions for bios, in order
+        include_forms: Also fetch alternate forms for build_forms()
         
-        pokemon_obj = {
-            "id": pokemon_main_data["id"],
-            "name_en": name_en,
-            "name_jp": name_jp,
-            "sprite": sprite_url,
-            "sprites": sprites,
-            "types_en": types_en,
-            "types_jp": types_jp,
-            "stats": stats,
-            "bio_en": bio_en,
-            "bio_jp": bio_jp,
-            "abilities": abilities_data,
-            "height": height_m,
-            "weight": weight_kg,
-            "genus_en": genus_en,
-            "genus_jp": genus_jp,
-            "moves": moves_data,
-            "evolution_chain": evolution_chain,
-            "weaknesses": weaknesses,
-            "resistances": resistances,
-            "immunities": immunities
-        }
+    Returns:
+        List of Pokemon records
+    """
+    all_pokemon_data = []
+    validation_errors = []  # Track validation errors
+    
+    # Stage 1 (I/O): all network access happens here
+    with stage("fetch"):
+        prefetch_resources(pokemon_count, workers=workers, sleep_time=sleep_time,
+                           full_learnsets=full_learnsets, include_forms=include_forms)
+
+    def bundles():
+        for i in range(1, pokemon_count + 1):
+            bundle = (i, collect_pokemon_payloads(i))
+            if not full_learnsets:
+                payload_cache.pop(f"pokemon/{i}", None)
+            if not include_forms:
+                payload_cache.pop(f"pokemon-species/{i}", None)
+            yield bundle
+
+    # Stage 2 (CPU): pure record assembly over the fetched payloads
+    with stage("assemble"):
+        records = assemble_all(bundles(), processes, languages=tuple(languages),
+                               flavor_versions=tuple(flavor_versions))
+
+    for i, pokemon_obj in zip(range(1, pokemon_count + 1), records):
+        if pokemon_obj is None:
+            continue
         # Validate Pokemon data before adding
         is_valid, missing_fields = validate_pokemon_data(pokemon_obj)
         if not is_valid:
@@ -601,12 +1288,13 @@ def fetch_and_build_pokedex(pokemon_count=POKEMON_COUNT, base_url=BASE_URL, slee
                 "name": pokemon_obj.get("name_en", "Unknown"),
                 "missing_fields": missing_fields
             })
-            logger.warning(f"Validation warning for #{i} {name_en}: Missing fields: {', '.join(missing_fields)}")
+            logger.warning(f"Validation warning for #{i} {pokemon_obj['name_en']}: "
+                           f"Missing fields: {', '.join(missing_fields)}")
         
         all_pokemon_data.append(pokemon_obj)
-        logger.info(f"Processed: #{i} {name_en}")
-        time.sleep(sleep_time)
+        logger.info(f"Processed: #{i} {pokemon_obj['name_en']}")
     
+
     # Log validation summary
     if validation_errors:
         logger.warning(f"\nValidation Summary: {len(validation_errors)} Pokemon had missing or incomplete data")
@@ -640,6 +1328,11 @@ Examples:
   python pokeapi_fetch.py --count 251        # Fetch first 251 Pokemon (Gen 1-2)
   python pokeapi_fetch.py --output test.json # Save to custom filename
   python pokeapi_fetch.py --count 10 --sleep 0.5  # Fetch 10 with longer delay
+  python pokeapi_fetch.py --dry-run          # Print the request plan without fetching
+  python pokeapi_fetch.py --cache-dir .pokeapi_cache  # Keep payloads; rebuilds skip the network
+  python pokeapi_fetch.py --adaptive         # Tune concurrency from latency/errors, not --sleep
+  python pokeapi_fetch.py --full-learnsets   # Also write assets/data/learnsets.json
+  python pokeapi_fetch.py --forms            # Also write assets/data/forms.json
         """
     )
     parser.add_argument(
@@ -658,25 +1351,176 @@ Examples:
         '--sleep', '-s',
         type=float,
         default=0.2,
-        help='Sleep time between requests in seconds (default: 0.2)'
+        help='Sleep time between requests in seconds, per worker (default: 0.2)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=4,
+        help='Maximum concurrent requests per fetch wave (default: 4)'
+    )
+    parser.add_argument(
+        '--rate-limit',
+        type=int,
+        default=100,
+        help='Maximum API calls per minute (default: 100)'
+    )
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        help='Adjust concurrency from observed latency and 429/5xx responses (AIMD), '
+             'retry failures and pause on sustained errors; --sleep and --workers are ignored'
+    )
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=16,
+        help='Upper bound for in-flight requests with --adaptive (default: 16)'
     )
+    parser.add_argument(
+        '--breaker-cooldown',
+        type=float,
+        default=30.0,
+        help='Seconds requests pause after the circuit breaker opens with --adaptive (default: 30)'
+    )
+    parser.add_argument(
+        '--processes', '-p',
+        type=int,
+        default=None,
+        help='Processes used to assemble records from fetched payloads (default: all cores)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='Directory to keep raw API payloads in; rebuilds reuse them instead of refetching'
+    )
+    parser.add_argument(
+        '--languages',
+        type=str,
+        default=','.join(BASE_LANGUAGES),
+        help='Comma-separated PokeAPI language codes to extract, e.g. en,ja,de,fr,es,ko,zh-Hans; '
+             'languages other than en/ja go into each record\'s "localized" object (default: en,ja)'
+    )
+    parser.add_argument(
+        '--flavor-versions',
+        type=str,
+        default=','.join(FLAVOR_TEXT_VERSIONS),
+        help='Comma-separated game versions to prefer for Pokedex entries, in order '
+             f'(default: {",".join(FLAVOR_TEXT_VERSIONS)})'
+    )
+    parser.add_argument(
+        '--forms',
+        action='store_true',
+        help='Also fetch alternate forms (megas, regional forms, Gigantamax; IDs 10001+)'
+    )
+    parser.add_argument(
+        '--forms-output',
+        type=str,
+        default='assets/data/forms.json',
+        help='Forms artifact written with --forms (default: assets/data/forms.json)'
+    )
+    parser.add_argument(
+        '--full-learnsets',
+        action='store_true',
+        help='Also build every level-up/TM/egg/tutor learnset per version group'
+    )
+    parser.add_argument(
+        '--learnsets-output',
+        type=str,
+        default='assets/data/learnsets.json',
+        help='Learnset artifact written with --full-learnsets (default: assets/data/learnsets.json)'
+    )
+    parser.add_argument(
+        '--metrics-json',
+        type=str,
+        default=None,
+        help='Write per-endpoint request metrics as JSON to this path'
+    )
+    parser.add_argument(
+        '--metrics-prom',
+        type=str,
+        default=None,
+        help='Write request metrics in Prometheus text format to this path'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Print the planned request count and estimated time, then exit'
+    )
+    add_profiling_arguments(parser)
     
     args = parser.parse_args()
+    rate_limiter.calls_per_minute = args.rate_limit
+    if args.cache_dir:
+        os.makedirs(args.cache_dir, exist_ok=True)
+        payload_cache_dir = args.cache_dir
     
-    logger.info(f"Starting data fetching process...")
-    logger.info(f"Fetching {args.count} Pokemon with {args.sleep}s delay between requests")
-    logger.info(f"Output file: {args.output}")
-    logger.info("-" * 60)
+    if args.dry_run:
+        print_fetch_plan(args.count, args.workers, args.rate_limit, args.full_learnsets, args.forms)
+        raise SystemExit(0)
     
-    pokedex_data = fetch_and_build_pokedex(
-        pokemon_count=args.count,
-        sleep_time=args.sleep
-    )
-    save_pokedex_to_json(pokedex_data, args.output)
+    workers, sleep_time = args.workers, args.sleep
+    if args.adaptive:
+        adaptive_controller = AdaptiveController(
+            max_limit=args.max_concurrency,
+            breaker=CircuitBreaker(cooldown_seconds=args.breaker_cooldown),
+            on_change=metrics.record_concurrency,
+            on_sleep=lambda seconds: metrics.record_sleep("backoff", seconds)
+        )
+        workers, sleep_time = args.max_concurrency, 0.0
     
-    # Log rate limiter statistics
-    stats = rate_limiter.get_stats()
-    logger.info(f"\nAll Pokemon data fetched and saved to {args.output}")
-    logger.info(f"Total Pokemon processed: {len(pokedex_data)}")
-    logger.info(f"Rate limiter stats: {stats['calls_in_window']} calls in current window "
-                f"(utilization: {stats['window_utilization']})")
+    languages = [lang.strip() for lang in args.languages.split(',') if lang.strip()]
+    flavor_versions = [version.strip() for version in args.flavor_versions.split(',')
+                       if version.strip()]
+
+    with RunProfiler.from_args(args, "pokeapi_fetch"):
+        logger.info("Starting data fetching process...")
+        if adaptive_controller is not None:
+            logger.info(f"Fetching {args.count} Pokemon with adaptive concurrency "
+                        f"(up to {workers} in flight)")
+        else:
+            logger.info(f"Fetching {args.count} Pokemon with {args.sleep}s delay between requests")
+        logger.info(f"Output file: {args.output}")
+        logger.info("-" * 60)
+    
+        pokedex_data = fetch_and_build_pokedex(
+            pokemon_count=args.count,
+            sleep_time=sleep_time,
+            workers=workers,
+            processes=args.processes,
+            full_learnsets=args.full_learnsets,
+            languages=languages,
+            flavor_versions=flavor_versions,
+            include_forms=args.forms
+        )
+        with stage("save"):
+            save_pokedex_to_json(pokedex_data, args.output)
+    
+        if args.forms:
+            with stage("forms"):
+                form_data = build_forms(args.count, args.processes, languages=tuple(languages),
+                                        flavor_versions=tuple(flavor_versions))
+                write_json(args.forms_output, form_data, compact=True)
+            logger.info(f"Forms saved to {args.forms_output}: {len(form_data['forms'])} forms "
+                        f"across {len(form_data['species_forms'])} species")
+
+        if args.full_learnsets:
+            with stage("learnsets"):
+                learnset_data = build_learnsets(args.count)
+                write_json(args.learnsets_output, learnset_data, compact=True)
+            logger.info(f"Learnsets saved to {args.learnsets_output}: "
+                        f"{len(learnset_data['moves'])} moves, "
+                        f"{len(learnset_data['version_groups'])} version groups")
+
+        # Log rate limiter statistics
+        stats = rate_limiter.get_stats()
+        logger.info(f"\nAll Pokemon data fetched and saved to {args.output}")
+        logger.info(f"Total Pokemon processed: {len(pokedex_data)}")
+        logger.info(f"Rate limiter stats: {stats['calls_in_window']} calls in current window "
+                    f"(utilization: {stats['window_utilization']})")
+        if adaptive_controller is not None:
+            logger.info(f"Adaptive fetch: {adaptive_controller.summary()}")
+        for line in metrics.summary_lines():
+            logger.info(f"Fetch metrics: {line}")
+        metrics.write(args.metrics_json, args.metrics_prom)
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped binary form of pokedex_data.json with O(1) lookup by ID.
+
+Tools that need a handful of Pokémon do not have to parse the whole JSON
+dataset: they open the binary file and decode single records on demand.
+
+    from pokedex_binary import PokedexFile
+    with PokedexFile("assets/data/pokedex.bin") as dex:
+        pikachu = dex[25]
+        print(pikachu["name_en"], pikachu.stats["speed"], pikachu.types_en)
+
+File layout (little-endian):
+
+    header      magic, version, record size, count, max ID, section offsets
+    metadata    JSON: key order, type table
+    id index    (max ID + 1) uint32 record numbers, 0xFFFFFFFF for gaps
+    records     fixed-width rows: ID, 6 stats, height, weight, 2 type IDs,
+                presence bits and string references
+    offsets     uint32 start of each pooled string (count + 1 entries)
+    pool        deduplicated UTF-8 strings
+
+Names, bios, genera and the sprite URL are pooled strings. Everything
+without a fixed slot (abilities, moves, evolution chain, ...) is stored per
+record as a pooled compact JSON string and parsed only when one of those
+fields is read. Values that do not fit their fixed slot (e.g. a third type)
+are kept in that JSON too, so to_dict() always returns the source record.
+
+The file is opened read-only with mmap, so the OS page cache is shared by
+every process reading it and opening it costs the same for 10 or 10,000
+records.
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from build_utils import load_pokedex_data
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+BINARY_OUTPUT: str = "assets/data/pokedex.bin"
+MAGIC: bytes = b"PKDX"
+FORMAT_VERSION: int = 1
+
+STAT_KEYS: Tuple[str, ...] = (
+    "hp", "attack", "defense", "special-attack", "special-defense", "speed"
+)
+STRING_FIELDS: Tuple[str, ...] = (
+    "name_en", "name_jp", "sprite", "bio_en", "bio_jp", "genus_en", "genus_jp"
+)
+# Fields with a fixed slot in the record row; bit i of `present` is FIXED_FIELDS[i]
+FIXED_FIELDS: Tuple[str, ...] = ("stats", "height", "weight", "types") + STRING_FIELDS
+
+NO_ENTRY: int = 0xFFFFFFFF
+NO_TYPE: int = 0xFF
+
+# magic, version, record size, count, max id, metadata offset/length, index, records, offsets, pool
+HEADER = struct.Struct("<4sHHIIIIIIII")
+# id, 6 stats, height, weight, type 1, type 2, present bits, string refs, rest-of-record ref
+RECORD = struct.Struct(f"<I6HHHBBH{len(STRING_FIELDS)}II")
+UINT32 = struct.Struct("<I")
+
+
+class StringPool:
+    """Deduplicating UTF-8 string pool used while writing."""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.offsets: List[int] = [0]
+        self.data = bytearray()
+
+    def add(self, value: str) -> int:
+        ref = self.index.get(value)
+        if ref is None:
+            ref = len(self.offsets) - 1
+            self.index[value] = ref
+            self.data += value.encode("utf-8")
+            self.offsets.append(len(self.data))
+        return ref
+
+
+def tenths(value: Any) -> Optional[int]:
+    """Encode a height/weight as an integer number of tenths if it round-trips exactly."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    scaled = round(value * 10)
+    if 0 <= scaled <= 0xFFFF and scaled / 10 == value and type(value) is float:
+        return scaled
+    return None
+
+
+def pack_record(pokemon: Dict[str, Any], pool: StringPool,
+                types: Dict[Tuple[str, str], int]) -> bytes:
+    """Encode one Pokémon as a fixed-width row; values without a slot go to pooled JSON.
+
+    Args:
+        pokemon: One pokedex_data.json record
+        pool: String pool being written
+        types: (type_en, type_jp) -> type ID, extended as new types appear
+
+    Returns:
+        RECORD-sized bytes
+    """
+    present = 0
+    rest = {key: value for key, value in pokemon.items() if key != "id" and key not in FIXED_FIELDS}
+
+    stats = pokemon.get("stats")
+    stat_values = [0] * len(STAT_KEYS)
+    if isinstance(stats, dict) and tuple(stats) == STAT_KEYS and all(
+            isinstance(v, int) and not isinstance(v, bool) and 0 <= v <= 0xFFFF
+            for v in stats.values()):
+        stat_values = [stats[key] for key in STAT_KEYS]
+        present |= 1 << FIXED_FIELDS.index("stats")
+    elif "stats" in pokemon:
+        rest["stats"] = stats
+
+    measures = []
+    for field in ("height", "weight"):
+        encoded = tenths(pokemon.get(field))
+        if encoded is not None:
+            present |= 1 << FIXED_FIELDS.index(field)
+        elif field in pokemon:
+            rest[field] = pokemon[field]
+        measures.append(encoded or 0)
+
+    type_ids = [NO_TYPE, NO_TYPE]
+    types_en, types_jp = pokemon.get("types_en"), pokemon.get("types_jp")
+    if (isinstance(types_en, list) and isinstance(types_jp, list) and 1 <= len(types_en) <= 2
+            and len(types_en) == len(types_jp)
+            and all(isinstance(t, str) for t in types_en + types_jp)):
+        for slot, pair in enumerate(zip(types_en, types_jp)):
+            type_ids[slot] = types.setdefault(pair, len(types))
+        present |= 1 << FIXED_FIELDS.index("types")
+    else:
+        for field in ("types_en", "types_jp"):
+            if field in pokemon:
+                rest[field] = pokemon[field]
+    if len(types) > NO_TYPE:
+        raise ValueError(f"More than {NO_TYPE} distinct types")
+
+    string_refs = []
+    for field in STRING_FIELDS:
+        value = pokemon.get(field)
+        if isinstance(value, str):
+            string_refs.append(pool.add(value))
+            present |= 1 << FIXED_FIELDS.index(field)
+        else:
+            string_refs.append(NO_ENTRY)
+            if field in pokemon:
+                rest[field] = value
+
+    rest_ref = (pool.add(json.dumps(rest, ensure_ascii=False, separators=(",", ":")))
+                if rest else NO_ENTRY)
+    return RECORD.pack(pokemon["id"], *stat_values, *measures, *type_ids, present, *string_refs,
+                       rest_ref)
+
+
+def write_binary_dataset(pokemon_data: List[Dict[str, Any]], path: str = BINARY_OUTPUT) -> int:
+    """Write a dataset in the binary format.
+
+    Args:
+        pokemon_data: pokedex_data.json contents
+        path: Output file path
+
+    Returns:
+        Size of the written file in bytes
+    """
+    ids = [pokemon["id"] for pokemon in pokemon_data]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Duplicate Pokémon IDs in dataset")
+    if any(not isinstance(pokemon_id, int) or pokemon_id < 0 for pokemon_id in ids):
+        raise ValueError("Pokémon IDs must be non-negative integers")
+
+    pool = StringPool()
+    types: Dict[Tuple[str, str], int] = {}
+    rows = b"".join(pack_record(pokemon, pool, types) for pokemon in pokemon_data)
+
+    max_id = max(ids, default=0)
+    id_index = [NO_ENTRY] * (max_id + 1)
+    for record_number, pokemon_id in enumerate(ids):
+        id_index[pokemon_id] = record_number
+
+    metadata = json.dumps({
+        "key_order": list(pokemon_data[0]) if pokemon_data else [],
+        "types": [list(pair) for pair in types]
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    sections = [metadata, struct.pack(f"<{len(id_index)}I", *id_index), rows,
+                struct.pack(f"<{len(pool.offsets)}I", *pool.offsets), bytes(pool.data)]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        offsets.append(position)
+        position += len(section)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, len(pokemon_data), max_id,
+                         offsets[0], len(metadata), offsets[1], offsets[2], offsets[3], offsets[4])
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as fh:
+        fh.write(header)
+        for section in sections:
+            fh.write(section)
+    return position
+
+
+class PokemonView:
+    """One record of a PokedexFile, decoded field by field on access."""
+
+    __slots__ = ("_dex", "_row", "_rest")
+
+    def __init__(self, dex: "PokedexFile", row: Tuple[Any, ...]):
+        self._dex = dex
+        self._row = row
+        self._rest: Optional[Dict[str, Any]] = None
+
+    def _has(self, field: str) -> bool:
+        return bool(self._row[11] & (1 << FIXED_FIELDS.index(field)))
+
+    def _extra(self) -> Dict[str, Any]:
+        if self._rest is None:
+            ref = self._row[-1]
+            self._rest = {} if ref == NO_ENTRY else json.loads(self._dex.string(ref))
+        return self._rest
+
+    @property
+    def id(self) -> int:
+        return self._row[0]
+
+    @property
+    def stats(self) -> Any:
+        if self._has("stats"):
+            return dict(zip(STAT_KEYS, self._row[1:7]))
+        return self._extra().get("stats")
+
+    @property
+    def types_en(self) -> Any:
+        return self._types(0, "types_en")
+
+    @property
+    def types_jp(self) -> Any:
+        return self._types(1, "types_jp")
+
+    def _types(self, language: int, field: str) -> Any:
+        if not self._has("types"):
+            return self._extra().get(field)
+        table = self._dex.types
+        return [table[type_id][language] for type_id in self._row[9:11] if type_id != NO_TYPE]
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "id":
+            return self.id
+        if key in ("stats", "types_en", "types_jp"):
+            value = getattr(self, key)
+        elif key in ("height", "weight"):
+            if self._has(key):
+                value = self._row[7 if key == "height" else 8] / 10
+            else:
+                value = self._extra().get(key)
+        elif key in STRING_FIELDS:
+            ref = self._row[12 + STRING_FIELDS.index(key)]
+            value = self._dex.string(ref) if ref != NO_ENTRY else self._extra().get(key)
+        else:
+            value = self._extra().get(key)
+        if value is None and key not in self:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def __contains__(self, key: str) -> bool:
+        if key == "id":
+            return True
+        if key in ("types_en", "types_jp"):
+            return self._has("types") or key in self._extra()
+        if key in FIXED_FIELDS:
+            return self._has(key) or key in self._extra()
+        return key in self._extra()
+
+    def keys(self) -> List[str]:
+        """Field names in the dataset's key order."""
+        present = [key for key in ("id", "types_en", "types_jp") + FIXED_FIELDS
+                   if key in self and key != "types"]
+        present += [key for key in self._extra() if key not in present]
+        order = {key: position for position, key in enumerate(self._dex.key_order)}
+        return sorted(present, key=lambda key: order.get(key, len(order)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode the whole record back to its pokedex_data.json form."""
+        return {key: self[key] for key in self.keys()}
+
+    def __repr__(self) -> str:
+        return f"<PokemonView {self.id} {self.get('name_en', '')}>"
+
+
+class PokedexFile:
+    """Read-only, memory-mapped binary dataset."""
+
+    def __init__(self, path: str = BINARY_OUTPUT):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        (magic, version, record_size, self.count, self.max_id, meta_offset, meta_length,
+         self._index_offset, self._records_offset, self._offsets_offset, self._pool_offset) = \
+            HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} binary dataset")
+        metadata = json.loads(bytes(self._buffer[meta_offset:meta_offset + meta_length]))
+        self.key_order: List[str] = metadata["key_order"]
+        self.types: List[List[str]] = metadata["types"]
+
+    def close(self) -> None:
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "PokedexFile":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def string(self, ref: int) -> str:
+        """Decode one pooled string."""
+        start, end = struct.unpack_from("<II", self._buffer,
+                                        self._offsets_offset + ref * UINT32.size)
+        return str(self._buffer[self._pool_offset + start:self._pool_offset + end], "utf-8")
+
+    def record_number(self, pokemon_id: int) -> Optional[int]:
+        """Row of a Pokémon ID, or None when the dataset does not contain it."""
+        if not 0 <= pokemon_id <= self.max_id:
+            return None
+        number = UINT32.unpack_from(self._buffer, self._index_offset + pokemon_id * UINT32.size)[0]
+        return None if number == NO_ENTRY else number
+
+    def row(self, number: int) -> PokemonView:
+        """The Pokémon stored in row `number` (dataset order)."""
+        row = RECORD.unpack_from(self._buffer, self._records_offset + number * RECORD.size)
+        return PokemonView(self, row)
+
+    def get(self, pokemon_id: int) -> Optional[PokemonView]:
+        number = self.record_number(pokemon_id)
+        return None if number is None else self.row(number)
+
+    def __getitem__(self, pokemon_id: int) -> PokemonView:
+        view = self.get(pokemon_id)
+        if view is None:
+            raise KeyError(pokemon_id)
+        return view
+
+    def __contains__(self, pokemon_id: int) -> bool:
+        return self.record_number(pokemon_id) is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[PokemonView]:
+        for number in range(self.count):
+            yield self.row(number)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write or query the memory-mapped binary dataset")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--output", default=BINARY_OUTPUT,
+                        help=f"Binary file (default: {BINARY_OUTPUT})")
+    parser.add_argument("--get", type=int, nargs="+", metavar="ID",
+                        help="Print these Pokémon from an existing binary file "
+                             "instead of writing it")
+    args = parser.parse_args()
+
+    if args.get:
+        with PokedexFile(args.output) as dex:
+            missing = [pokemon_id for pokemon_id in args.get if pokemon_id not in dex]
+            if missing:
+                logger.error(f"❌ Not in {args.output}: {', '.join(map(str, missing))}")
+                return 1
+            records = [dex[pokemon_id].to_dict() for pokemon_id in args.get]
+        print(json.dumps(records if len(records) > 1 else records[0], ensure_ascii=False, indent=2))
+        return 0
+
+    pokemon_data = load_pokedex_data(args.input)
+    size = write_binary_dataset(pokemon_data, args.output)
+
+    with PokedexFile(args.output) as dex:
+        if [view.to_dict() for view in dex] != pokemon_data:
+            logger.error(f"❌ {args.output} does not decode back to {args.input}")
+            return 1
+
+    json_size = Path(args.input).stat().st_size
+    logger.info(f"✅ Wrote {args.output}: {len(pokemon_data)} Pokémon, {size / 1024:.1f} KB "
+                f"({json_size / 1024:.1f} KB as JSON)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
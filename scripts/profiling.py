@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Opt-in CPU profiling and memory tracing for the pipeline scripts.
+
+Every script exposes the same flags through add_profiling_arguments():
+
+    --profile                 cProfile the run, one section per stage
+    --trace-memory            tracemalloc the run, one section per stage
+    --memory-budget-mb N      fail the run if traced peak memory exceeds N MB
+    --profile-dir DIR         where reports are written (default: profile_reports)
+
+Scripts wrap their run in `with RunProfiler.from_args(args, "<script>"):`
+and mark stages with `with stage("<name>"):`. Without the flags both are
+no-ops. Reports:
+
+    <script>.hotspots.txt     top functions per stage, sorted by cumulative time
+    <script>.prof             combined pstats dump (snakeviz, pstats)
+    <script>.memory.txt       peak/net memory and top allocation sites per stage
+
+Only the main thread is profiled; work on thread or process pools shows up
+as time spent waiting on the pool.
+"""
+
+import argparse
+import cProfile
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+TOP_FUNCTIONS: int = 25
+TOP_ALLOCATIONS: int = 15
+UNSTAGED: str = "(outside stages)"
+
+# Profiler of the current run, used by stage()
+_active: Optional["RunProfiler"] = None
+
+
+def add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --profile / --trace-memory options to a parser."""
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true",
+                       help="Profile the run with cProfile and write per-stage hotspot reports")
+    group.add_argument("--trace-memory", action="store_true",
+                       help="Trace allocations with tracemalloc and write per-stage memory reports")
+    group.add_argument("--memory-budget-mb", type=float, default=None,
+                       help="Fail the run if traced peak memory exceeds this many MB "
+                            "(implies --trace-memory)")
+    group.add_argument("--profile-dir", default="profile_reports",
+                       help="Directory for profiling reports (default: profile_reports)")
+
+
+class StageRecord:
+    """Timings, profile and memory figures for one stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.calls = 0
+        self.profile = cProfile.Profile()
+        self.peak_bytes = 0
+        self.net_bytes = 0
+        self.allocations: List[tracemalloc.StatisticDiff] = []
+        self._resumed = 0.0
+        self._memory_start = 0
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+
+class RunProfiler:
+    """Context manager that profiles one script run, stage by stage."""
+
+    def __init__(self, script: str, profile: bool = False, trace_memory: bool = False,
+                 memory_budget_mb: Optional[float] = None, report_dir: str = "profile_reports"):
+        self.script = script
+        self.profile = profile
+        self.memory_budget_mb = memory_budget_mb
+        self.trace_memory = trace_memory or memory_budget_mb is not None
+        self.report_dir = Path(report_dir)
+        self.stages: Dict[str, StageRecord] = {}
+        self._stack: List[StageRecord] = []
+        self.started = 0.0
+        self.elapsed = 0.0
+        self.peak_bytes = 0
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace, script: str) -> "RunProfiler":
+        """Build a profiler from options added by add_profiling_arguments()."""
+        return cls(script, profile=args.profile, trace_memory=args.trace_memory,
+                   memory_budget_mb=args.memory_budget_mb, report_dir=args.profile_dir)
+
+    @property
+    def enabled(self) -> bool:
+        return self.profile or self.trace_memory
+
+    def __enter__(self) -> "RunProfiler":
+        global _active
+        if not self.enabled:
+            return self
+        _active = self
+        if self.trace_memory:
+            tracemalloc.start()
+        self.started = time.perf_counter()
+        self._push(UNSTAGED)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        global _active
+        if not self.enabled:
+            return False
+        self._pop()
+        self.elapsed = time.perf_counter() - self.started
+        if self.trace_memory:
+            self.peak_bytes = max(record.peak_bytes for record in self.stages.values())
+            tracemalloc.stop()
+        _active = None
+        self.write_reports()
+
+        if exc_type is None and self.memory_budget_mb is not None:
+            peak_mb = self.peak_bytes / 1024 / 1024
+            if peak_mb > self.memory_budget_mb:
+                logger.error(f"❌ Peak traced memory {peak_mb:.1f} MB exceeds budget of "
+                             f"{self.memory_budget_mb:.1f} MB")
+                raise SystemExit(1)
+            logger.info(f"✅ Peak traced memory {peak_mb:.1f} MB within budget of "
+                        f"{self.memory_budget_mb:.1f} MB")
+        return False
+
+    def _push(self, name: str) -> None:
+        if self._stack:
+            self._suspend(self._stack[-1])
+        record = self.stages.setdefault(name, StageRecord(name))
+        record.calls += 1
+        self._stack.append(record)
+        self._resume(record)
+
+    def _pop(self) -> None:
+        record = self._stack.pop()
+        self._suspend(record)
+        if self._stack:
+            self._resume(self._stack[-1])
+
+    def _resume(self, record: StageRecord) -> None:
+        record._resumed = time.perf_counter()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            record._memory_start = tracemalloc.get_traced_memory()[0]
+            record._snapshot = tracemalloc.take_snapshot()
+        if self.profile:
+            record.profile.enable()
+
+    def _suspend(self, record: StageRecord) -> None:
+        if self.profile:
+            record.profile.disable()
+        record.seconds += time.perf_counter() - record._resumed
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            record.peak_bytes = max(record.peak_bytes, peak)
+            record.net_bytes += current - record._memory_start
+            diff = tracemalloc.take_snapshot().compare_to(record._snapshot, "lineno")
+            allocations = sorted(record.allocations + diff[:TOP_ALLOCATIONS],
+                                 key=lambda stat: stat.size_diff, reverse=True)
+            record.allocations = allocations[:TOP_ALLOCATIONS]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Attribute everything inside the block to stage `name`."""
+        self._push(name)
+        try:
+            yield
+        finally:
+            self._pop()
+
+    def write_reports(self) -> None:
+        """Write hotspot and allocation reports to report_dir."""
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        ordered = [record for record in self.stages.values() if record.name != UNSTAGED]
+        ordered.append(self.stages[UNSTAGED])
+
+        if self.profile:
+            lines = [f"{self.script}: {self.elapsed:.2f}s wall time", ""]
+            lines += [f"  {record.name:<30} {record.seconds:>9.3f}s" for record in ordered]
+            combined = None
+            for record in ordered:
+                stream = io.StringIO()
+                try:
+                    stats = pstats.Stats(record.profile, stream=stream)
+                except TypeError:  # no calls were recorded in this stage
+                    continue
+                stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+                lines += ["", "=" * 78, f"Stage: {record.name} ({record.seconds:.3f}s)", "=" * 78,
+                          stream.getvalue()]
+                if combined is None:
+                    combined = pstats.Stats(record.profile)
+                else:
+                    combined.add(record.profile)
+            hotspots_path = self.report_dir / f"{self.script}.hotspots.txt"
+            hotspots_path.write_text("\n".join(lines), encoding="utf-8")
+            if combined is not None:
+                combined.dump_stats(str(self.report_dir / f"{self.script}.prof"))
+            logger.info(f"Profile written to {hotspots_path}")
+
+        if self.trace_memory:
+            lines = [f"{self.script}: traced peak {self.peak_bytes / 1024 / 1024:.1f} MB"]
+            if resource is not None:
+                # ru_maxrss is KB on Linux
+                max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                lines.append(f"Max RSS: {max_rss / 1024:.1f} MB")
+            lines.append("")
+            lines += [f"  {record.name:<30} peak {record.peak_bytes / 1024 / 1024:>8.1f} MB  "
+                      f"net {record.net_bytes / 1024 / 1024:>+8.1f} MB" for record in ordered]
+            for record in ordered:
+                lines += ["", "=" * 78,
+                          f"Stage: {record.name} - top allocations (net growth)", "=" * 78]
+                lines += [f"  {stat.size_diff / 1024:>10.1f} KB  {stat.count_diff:>+8} blocks  "
+                          f"{stat.traceback.format()[0].strip()}"
+                          for stat in record.allocations if stat.size_diff > 0]
+            memory_path = self.report_dir / f"{self.script}.memory.txt"
+            memory_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            logger.info(f"Memory report written to {memory_path}")
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Mark a pipeline stage; a no-op unless a RunProfiler is active."""
+    if _active is None:
+        yield
+        return
+    with _active.stage(name):
+        yield
@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""
+Search for 6-member teams with the best type coverage.
+
+The team builder (assets/js/components/teamBuilder.js) only analyses a team
+the user already picked. This script searches the dataset for teams that
+maximise the same coverage, under optional constraints:
+
+    python scripts/team_optimizer.py --include 6 --ban-types Dragon \\
+        --min-stat speed=80 --min-total 480 --top-k 10
+
+A team's score is
+
+    offensive coverage   types hit super-effectively by a member's own type
+  + defensive coverage   attacking types at least one member resists or is immune to
+  - shared weaknesses    attacking types two or more members are weak to
+
+Every Pokémon is reduced to three 18-bit masks (offense, weak, resist), so
+scoring a team is a handful of ORs and ANDs.
+
+Pokémon with the same typing have identical masks, so candidates are
+grouped by typing and a team takes the strongest members of each group it
+uses; the suggestions are the top-k typing mixes. Mixes are enumerated as
+multisets of groups by a depth-first branch-and-bound: a branch is dropped
+when even the best coverage still available cannot beat the k-th best
+score. A beam search seeds that score, and the top-level branches are
+spread over a process pool that shares it, so every worker prunes against
+the best teams found anywhere. The scores are exact; among teams with
+equal scores, higher base-stat totals are explored first and ranked first.
+
+Results are written to assets/data/team_suggestions.json.
+"""
+
+import argparse
+import heapq
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from build_utils import load_pokedex_data, write_json
+from generate_type_effectiveness import (
+    TYPE_NAMES,
+    dual_type_defense,
+    dual_type_index,
+    effectiveness_matrix,
+)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+TEAM_SIZE: int = 6
+STAT_KEYS: List[str] = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+TYPE_IDS: Dict[str, int] = {name: index for index, name in enumerate(TYPE_NAMES)}
+MATRIX: List[List[float]] = effectiveness_matrix()
+DUAL_TYPE_DEFENSE: List[List[float]] = dual_type_defense()
+
+# Teams are ranked by one integer: score first, base-stat total second
+SCORE_OFFSET: int = len(TYPE_NAMES)
+TOTAL_SCALE: int = 100000
+
+# Partial teams kept per slot by the beam search that seeds the exact search
+BEAM_WIDTH: int = 64
+
+# A typing group: (offense mask, weak mask, resist mask, [(total, id), ...] strongest first)
+Group = Tuple[int, int, int, List[Tuple[int, int]]]
+
+
+def type_masks(types_en: List[str]) -> Optional[Tuple[int, int, int]]:
+    """Offense, weakness and resistance bitsets for a typing (bit i = TYPE_NAMES[i]).
+
+    Returns:
+        (offense, weak, resist), or None for a typing outside the chart
+    """
+    ids = [TYPE_IDS.get(t.lower(), -1) for t in types_en[:2]]
+    if not ids or min(ids) < 0:
+        return None
+    defense = DUAL_TYPE_DEFENSE[dual_type_index(ids[0], ids[-1])]
+
+    offense = weak = resist = 0
+    for type_id in range(len(TYPE_NAMES)):
+        bit = 1 << type_id
+        if any(MATRIX[attacker][type_id] > 1 for attacker in ids):
+            offense |= bit
+        if defense[type_id] > 1:
+            weak |= bit
+        elif defense[type_id] < 1:
+            resist |= bit
+    return offense, weak, resist
+
+
+def base_stat_total(pokemon: Dict[str, Any]) -> int:
+    return sum((pokemon.get("stats") or {}).get(stat, 0) for stat in STAT_KEYS)
+
+
+def score_masks(offense: int, resist: int, twice: int) -> int:
+    """Coverage score from the team's combined masks."""
+    return offense.bit_count() + resist.bit_count() - twice.bit_count()
+
+
+def team_masks(members: List[Tuple[int, int, int]]) -> Tuple[int, int, int]:
+    """Combined (offense, resist, weak-twice) masks of a list of member masks."""
+    offense = resist = once = twice = 0
+    for member_offense, weak, member_resist in members:
+        offense |= member_offense
+        resist |= member_resist
+        twice |= once & weak
+        once |= weak
+    return offense, resist, twice
+
+
+def select_candidates(pokemon_data: List[Dict[str, Any]], banned_types: List[str],
+                      stat_floors: Dict[str, int], min_total: int) -> List[Dict[str, Any]]:
+    """Pokémon allowed on a team: no banned type and every stat floor met."""
+    banned = {t.lower() for t in banned_types}
+    candidates = []
+    for pokemon in pokemon_data:
+        if not pokemon.get("types_en") or not pokemon.get("stats"):
+            continue
+        if banned & {t.lower() for t in pokemon["types_en"]}:
+            continue
+        if any(pokemon["stats"].get(stat, 0) < floor for stat, floor in stat_floors.items()):
+            continue
+        if base_stat_total(pokemon) < min_total:
+            continue
+        candidates.append(pokemon)
+    return candidates
+
+
+def group_by_typing(candidates: List[Dict[str, Any]], slots: int) -> List[Group]:
+    """Group candidates with identical masks, strongest groups first.
+
+    Only the `slots` strongest members of a group can appear in a best team,
+    so the rest are dropped.
+    """
+    groups: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = {}
+    if slots <= 0:
+        return []
+    for pokemon in candidates:
+        masks = type_masks(pokemon["types_en"])
+        if masks is not None:
+            groups.setdefault(masks, []).append((base_stat_total(pokemon), pokemon["id"]))
+    result = []
+    for (offense, weak, resist), members in groups.items():
+        members.sort(key=lambda member: (-member[0], member[1]))
+        result.append((offense, weak, resist, members[:slots]))
+    result.sort(key=lambda group: (-group[3][0][0], group[3][0][1]))
+    return result
+
+
+# Search state shared by the worker processes (set by _init_worker)
+_groups: List[Group] = []
+_base: Tuple[int, int, int, int, int] = (0, 0, 0, 0, 0)
+_slots: int = 0
+_top_k: int = 1
+_shared_floor: Any = None
+_suffix_offense: List[int] = []
+_suffix_resist: List[int] = []
+
+
+def _init_worker(groups: List[Group], base: Tuple[int, int, int, int, int], slots: int, top_k: int,
+                 shared_floor: Any) -> None:
+    """Store the search inputs and the coverage of every group suffix in the worker's globals."""
+    global _groups, _base, _slots, _top_k, _shared_floor, _suffix_offense, _suffix_resist
+    _groups, _base, _slots, _top_k, _shared_floor = groups, base, slots, top_k, shared_floor
+    _suffix_offense = [0] * (len(groups) + 1)
+    _suffix_resist = [0] * (len(groups) + 1)
+    for index in range(len(groups) - 1, -1, -1):
+        _suffix_offense[index] = _suffix_offense[index + 1] | groups[index][0]
+        _suffix_resist[index] = _suffix_resist[index + 1] | groups[index][2]
+
+
+def rank_key(offense: int, resist: int, twice: int, total: int) -> int:
+    """Single sortable key: coverage score, then base-stat total."""
+    return (score_masks(offense, resist, twice) + SCORE_OFFSET) * TOTAL_SCALE + total
+
+
+def beam_search(groups: List[Group], base: Tuple[int, int, int, int, int], slots: int,
+                width: int) -> List[Tuple[int, Tuple[int, ...]]]:
+    """Greedy breadth-limited search: keep the `width` best partial teams per slot.
+
+    The teams found are real, so the k-th best of them is a safe starting
+    floor for the exact search.
+
+    Returns:
+        (rank key, group indexes) for every complete team in the final beam
+    """
+    beam = [((), base)]
+    for _ in range(slots):
+        expanded = {}
+        for picks, (offense, resist, once, twice, total) in beam:
+            for index in range(picks[-1] if picks else 0, len(groups)):
+                group_offense, weak, group_resist, members = groups[index]
+                taken = picks.count(index)
+                if taken >= len(members):
+                    continue
+                state = (offense | group_offense, resist | group_resist, once | weak,
+                         twice | (once & weak), total + members[taken][0])
+                expanded[picks + (index,)] = state
+        beam = heapq.nlargest(
+            width, expanded.items(),
+            key=lambda item: rank_key(item[1][0], item[1][1], item[1][3], item[1][4]))
+    return [(rank_key(offense, resist, twice, total), picks)
+            for picks, (offense, resist, _, twice, total) in beam]
+
+
+def _child_bounds(start: int, used: int, offense: int, resist: int, once: int, twice: int,
+                  remaining: int, threshold: int) -> List[Tuple[int, int, int, int]]:
+    """Upper bound of the score reachable through each possible next pick.
+
+    Coverage is submodular, so no later pick adds more than it would add now:
+    a pick's bound is its own gain (minus the shared weaknesses it creates)
+    plus the largest gains among the groups after it, capped by everything
+    those groups could cover together. Picks whose bound is below
+    `threshold` are dropped before sorting; most are, deep in the search.
+
+    Returns:
+        (score bound, member total, group index, members of the group already taken), best first
+    """
+    score = score_masks(offense, resist, twice)
+    twice_count = twice.bit_count()
+    later_gains = [0] * (remaining - 1)  # min-heap of the largest gains seen so far
+    later_sum = 0
+    children = []
+    for index in range(len(_groups) - 1, start - 1, -1):
+        group_offense, weak, group_resist, members = _groups[index]
+        taken = used if index == start else 0
+        if taken >= len(members):
+            continue
+        gain = (group_offense & ~offense).bit_count() + (group_resist & ~resist).bit_count()
+        penalty = (weak & once & ~twice).bit_count()
+        bound = score + gain - penalty + later_sum
+        if bound >= threshold:
+            cap = ((offense | _suffix_offense[index]).bit_count()
+                   + (resist | _suffix_resist[index]).bit_count() - twice_count - penalty)
+            if cap < bound:
+                bound = cap
+            if bound >= threshold:
+                children.append((bound, members[taken][0], index, taken))
+        if later_gains and gain > later_gains[0]:
+            later_sum += gain - heapq.heapreplace(later_gains, gain)
+    children.sort(key=lambda child: (-child[0], -child[1], child[2]))
+    return children
+
+
+def _search_branch(first: int) -> Tuple[List[Tuple[int, Tuple[int, ...]]], int]:
+    """Teams whose lowest group is `first`, exploring only what could reach the top k.
+
+    Subtrees are cut when their score bound is below the shared floor or no
+    better than this branch's own k-th best score. Equal scores at the shared
+    floor are still explored, so the result does not depend on how fast
+    other workers raised it.
+
+    Returns:
+        (heap of (rank key, group indexes), nodes visited)
+    """
+    heap: List[Tuple[int, Tuple[int, ...]]] = []
+    picks: List[int] = []
+    visited = 0
+    floor = _shared_floor.value
+
+    def publish() -> None:
+        nonlocal floor
+        if len(heap) == _top_k:
+            kth_score = heap[0][0] // TOTAL_SCALE - SCORE_OFFSET
+            if kth_score > _shared_floor.value:
+                with _shared_floor.get_lock():
+                    _shared_floor.value = max(_shared_floor.value, kth_score)
+        floor = _shared_floor.value
+
+    def threshold() -> int:
+        """Lowest score bound still worth exploring."""
+        if len(heap) == _top_k:
+            return max(floor, heap[0][0] // TOTAL_SCALE - SCORE_OFFSET + 1)
+        return floor
+
+    def beaten(score_bound: int) -> bool:
+        return score_bound < threshold()
+
+    def visit_leaves(start: int, used: int, offense: int, resist: int, once: int, twice: int,
+                     total: int) -> None:
+        # The last pick's score is exact, so complete each team directly instead
+        # of bounding and sorting the children first
+        nonlocal visited
+        kth_key = heap[0][0] if len(heap) == _top_k else -1
+        for index in range(start, len(_groups)):
+            group_offense, weak, group_resist, members = _groups[index]
+            taken = used if index == start else 0
+            if taken >= len(members):
+                continue
+            score = ((offense | group_offense).bit_count() + (resist | group_resist).bit_count()
+                     - (twice | (once & weak)).bit_count())
+            if score < floor:
+                continue
+            visited += 1
+            key = (score + SCORE_OFFSET) * TOTAL_SCALE + total + members[taken][0]
+            if key <= kth_key:
+                continue
+            if len(heap) < _top_k:
+                heapq.heappush(heap, (key, tuple(picks) + (index,)))
+            else:
+                heapq.heapreplace(heap, (key, tuple(picks) + (index,)))
+            kth_key = heap[0][0] if len(heap) == _top_k else -1
+
+    def visit(start: int, used: int, offense: int, resist: int, once: int, twice: int,
+              total: int) -> None:
+        nonlocal visited
+        visited += 1
+        remaining = _slots - len(picks)
+        if remaining == 0:
+            key = rank_key(offense, resist, twice, total)
+            if len(heap) < _top_k:
+                heapq.heappush(heap, (key, tuple(picks)))
+            elif key > heap[0][0]:
+                heapq.heapreplace(heap, (key, tuple(picks)))
+            return
+        if len(picks) == 2:
+            publish()
+        if remaining == 1:
+            visit_leaves(start, used, offense, resist, once, twice, total)
+            return
+
+        children = _child_bounds(start, used, offense, resist, once, twice, remaining, threshold())
+        for score_bound, _, index, taken in children:
+            if beaten(score_bound):
+                break
+            group_offense, weak, group_resist, members = _groups[index]
+            picks.append(index)
+            visit(index, taken + 1, offense | group_offense, resist | group_resist,
+                  once | weak, twice | (once & weak), total + members[taken][0])
+            picks.pop()
+
+    offense, resist, once, twice, total = _base
+    children = _child_bounds(first, 0, offense, resist, once, twice, _slots, threshold())
+    for score_bound, _, index, _ in children:
+        if index == first and not beaten(score_bound):
+            group_offense, weak, group_resist, members = _groups[first]
+            picks.append(first)
+            visit(first, 1, offense | group_offense, resist | group_resist, once | weak,
+                  twice | (once & weak), total + members[0][0])
+            publish()
+    return heap, visited
+
+
+def optimize_teams(pokemon_data: List[Dict[str, Any]], include: List[int], banned_types: List[str],
+                   stat_floors: Dict[str, int], min_total: int = 0, top_k: int = 10,
+                   workers: int = 1) -> Dict[str, Any]:
+    """Find the top-k teams for the given constraints.
+
+    Args:
+        pokemon_data: List of Pokémon records
+        include: IDs every team must contain (exempt from the other filters)
+        banned_types: Types no other member may have
+        stat_floors: Minimum value per stat key for other members
+        min_total: Minimum base-stat total for other members
+        top_k: Number of teams to return (each with a different typing mix)
+        workers: Processes to search with
+
+    Returns:
+        Suggestions dictionary (constraints, search statistics, ranked teams)
+
+    Raises:
+        ValueError: If an included ID is unknown or there are too many
+    """
+    by_id = {p["id"]: p for p in pokemon_data}
+    unknown = [pokemon_id for pokemon_id in include if pokemon_id not in by_id]
+    if unknown:
+        raise ValueError(f"Unknown Pokémon ID(s): {', '.join(map(str, unknown))}")
+    if len(set(include)) > TEAM_SIZE:
+        raise ValueError(f"At most {TEAM_SIZE} Pokémon can be included")
+    include = list(dict.fromkeys(include))
+
+    fixed = [by_id[pokemon_id] for pokemon_id in include]
+    offense = resist = once = twice = 0
+    for pokemon in fixed:
+        masks = type_masks(pokemon.get("types_en") or [])
+        if masks is not None:
+            offense |= masks[0]
+            resist |= masks[2]
+            twice |= once & masks[1]
+            once |= masks[1]
+    base = (offense, resist, once, twice, sum(base_stat_total(pokemon) for pokemon in fixed))
+    slots = TEAM_SIZE - len(include)
+
+    candidates = [p for p in select_candidates(pokemon_data, banned_types, stat_floors, min_total)
+                  if p["id"] not in include]
+    groups = group_by_typing(candidates, slots)
+
+    started = time.perf_counter()
+    visited = 0
+    if slots == 0:
+        ranked = [(rank_key(offense, resist, twice, base[4]), ())]
+    elif not groups:
+        ranked = []
+    else:
+        seeds = heapq.nlargest(top_k, beam_search(groups, base, slots, max(BEAM_WIDTH, top_k)))
+        floor = seeds[-1][0] // TOTAL_SCALE - SCORE_OFFSET if len(seeds) == top_k else -SCORE_OFFSET
+        shared_floor = multiprocessing.Value("q", floor)
+        initargs = (groups, base, slots, top_k, shared_floor)
+        if workers <= 1:
+            _init_worker(*initargs)
+            branches = [_search_branch(first) for first in range(len(groups))]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=initargs) as pool:
+                branches = list(pool.map(_search_branch, range(len(groups))))
+        # Branches only keep teams above the floor, so the seed teams fill any ties at it
+        found = dict((picks, key) for key, picks in seeds)
+        for heap, branch_visited in branches:
+            found.update((picks, key) for key, picks in heap)
+            visited += branch_visited
+        ranked = heapq.nlargest(top_k, ((key, picks) for picks, key in found.items()))
+    elapsed = time.perf_counter() - started
+    if not ranked:
+        logger.warning(f"⚠️ Not enough candidates meet the constraints to fill {slots} slot(s); "
+                       f"no teams found")
+
+    teams = []
+    for _, picks in ranked:
+        members = list(fixed)
+        taken: Dict[int, int] = {}
+        for index in picks:
+            _, pokemon_id = groups[index][3][taken.get(index, 0)]
+            taken[index] = taken.get(index, 0) + 1
+            members.append(by_id[pokemon_id])
+        teams.append(describe_team(members))
+
+    return {
+        "constraints": {
+            "include": include,
+            "banned_types": sorted(t.lower() for t in banned_types),
+            "stat_floors": stat_floors,
+            "min_total": min_total
+        },
+        "search": {
+            "candidates": len(candidates),
+            "typing_groups": len(groups),
+            "nodes": visited,
+            "workers": workers,
+            "seconds": round(elapsed, 3)
+        },
+        "teams": teams
+    }
+
+
+def describe_team(members: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Score breakdown of a team, in the terms the team builder displays."""
+    masks = [m for m in (type_masks(p.get("types_en") or []) for p in members) if m is not None]
+    offense, resist, twice = team_masks(masks)
+    weakness_counts = {name: sum(1 for _, weak, _ in masks if weak >> type_id & 1)
+                       for type_id, name in enumerate(TYPE_NAMES)}
+    return {
+        "ids": [p["id"] for p in members],
+        "names": [p.get("name_en", "") for p in members],
+        "types": [[t.lower() for t in p.get("types_en", [])] for p in members],
+        "score": score_masks(offense, resist, twice),
+        "offensive_coverage": offense.bit_count(),
+        "defensive_coverage": resist.bit_count(),
+        "total_stats": sum(base_stat_total(p) for p in members),
+        "offensive_uncovered": [name for i, name in enumerate(TYPE_NAMES) if not offense >> i & 1],
+        "unresisted": [name for i, name in enumerate(TYPE_NAMES) if not resist >> i & 1],
+        "shared_weaknesses": [{"type": name, "count": count}
+                              for name, count in weakness_counts.items() if count >= 2]
+    }
+
+
+def parse_stat_floors(values: List[str]) -> Dict[str, int]:
+    """Parse STAT=VALUE arguments (e.g. speed=80)."""
+    floors = {}
+    for value in values:
+        stat, _, amount = value.partition("=")
+        if stat not in STAT_KEYS or not amount.isdigit():
+            raise ValueError(f"Invalid stat floor '{value}' "
+                             f"(expected one of {', '.join(STAT_KEYS)}=N)")
+        floors[stat] = int(amount)
+    return floors
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Search for 6-member teams with the best type coverage")
+    parser.add_argument("--input", default="pokedex_data.json", help="Input JSON file")
+    parser.add_argument("--output", default="assets/data/team_suggestions.json",
+                        help="Output artifact")
+    parser.add_argument("--include", type=int, nargs="+", default=[], metavar="ID",
+                        help="Pokémon every team must contain")
+    parser.add_argument("--ban-types", nargs="+", default=[], metavar="TYPE",
+                        help="Types to exclude")
+    parser.add_argument("--min-stat", nargs="+", default=[], metavar="STAT=VALUE",
+                        help="Stat floors, e.g. speed=80 attack=100")
+    parser.add_argument("--min-total", type=int, default=0, help="Minimum base-stat total")
+    parser.add_argument("--top-k", type=int, default=10,
+                        help="Number of teams to suggest (default: 10)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Search processes (default: CPU count)")
+    args = parser.parse_args()
+
+    unknown_types = [t for t in args.ban_types if t.lower() not in TYPE_IDS]
+    if unknown_types:
+        logger.error(f"❌ Unknown type(s): {', '.join(unknown_types)}")
+        return 1
+    try:
+        stat_floors = parse_stat_floors(args.min_stat)
+        pokemon_data = load_pokedex_data(args.input)
+        suggestions = optimize_teams(pokemon_data, args.include, args.ban_types, stat_floors,
+                                     args.min_total, max(1, args.top_k), args.workers)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    # Timings and node counts vary run to run, so they are logged but not written
+    search = suggestions.pop("search")
+    logger.info(f"Searched {search['candidates']} candidates in {search['typing_groups']} "
+                f"typing groups: {search['nodes']:,} nodes in {search['seconds']:.2f}s")
+    for rank, team in enumerate(suggestions["teams"], 1):
+        logger.info(f"   {rank}. score {team['score']} ({team['offensive_coverage']} offense, "
+                    f"{team['defensive_coverage']} defense, "
+                    f"{len(team['shared_weaknesses'])} shared weaknesses), "
+                    f"total {team['total_stats']}: {', '.join(team['names'])}")
+
+    write_json(args.output, suggestions, compact=True)
+    logger.info(f"✅ Wrote {len(suggestions['teams'])} team suggestion(s) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,37 @@
 #!/usr/bin/env python3
 """
-Transform Pokemon data from external source to our pokedex_data.json format.
-This script converts Pokemon data from Purukitto/pokemon-data.json format
-to the format used by this Pokédex application.
+Build pokedex_data.json by reconciling several Pokemon data sources.
+
+Every source is streamed one record at a time and hash-joined by Pokemon ID:
+
+- existing:  a previous pokedex_data.json (keeps enrichment such as romaji)
+- pokeapi:   payloads in the PokeAPI on-disk cache (pokeapi_fetch.py --cache-dir),
+             read without any network request
+- purukitto: the Purukitto/pokemon-data.json dump
+
+Each field of a merged record comes from the highest-ranked source with a
+real value for it (DEFAULT_SOURCE_ORDER, overridden per field by
+FIELD_PRECEDENCE or --prefer), and the winning source is recorded as
+provenance. Type matchups are recomputed from the merged types with the
+full chart. IDs no source has are reported instead of padded with
+placeholders; --fetch-missing requests only those from PokeAPI.
+
+    python scripts/transform_pokemon_data.py --raw /tmp/pokemon_raw.json
+    python scripts/transform_pokemon_data.py --prefer bio_en=purukitto,existing \
+        --provenance .build/provenance.json
 """
 
-import json
-import sys
-import os
+import argparse
 import logging
+import os
+import re
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import pokeapi_fetch
+from build_utils import iter_json_array, write_json, write_json_records
+from fetch_metrics import endpoint_kind
+from profiling import RunProfiler, add_profiling_arguments, stage
 
 # Configure logging
 logging.basicConfig(
@@ -18,188 +41,439 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def transform_pokemon(raw_pokemon):
-    """Transform a Pokemon entry from external format to our format"""
-    pokemon_id = raw_pokemon['id']
-    
-    # Extract names
-    name_en = raw_pokemon['name']['english']
-    name_jp = raw_pokemon['name']['japanese']
-    
-    # Extract types
-    types_en = raw_pokemon['type']
-    # Map English types to Japanese (common type names)
-    type_map_jp = {
-        'Normal': 'ノーマル', 'Fire': 'ほのお', 'Water': 'みず', 
-        'Electric': 'でんき', 'Grass': 'くさ', 'Ice': 'こおり',
-        'Fighting': 'かくとう', 'Poison': 'どく', 'Ground': 'じめん',
-        'Flying': 'ひこう', 'Psychic': 'エスパー', 'Bug': 'むし',
-        'Rock': 'いわ', 'Ghost': 'ゴースト', 'Dragon': 'ドラゴン',
-        'Dark': 'あく', 'Steel': 'はがね', 'Fairy': 'フェアリー'
-    }
-    types_jp = [type_map_jp.get(t, t) for t in types_en]
-    
-    # Extract stats
-    base_stats = raw_pokemon.get('base', {})
-    stats = {
-        'hp': base_stats.get('HP', 50),
-        'attack': base_stats.get('Attack', 50),
-        'defense': base_stats.get('Defense', 50),
-        'special-attack': base_stats.get('Sp. Attack', 50),
-        'special-defense': base_stats.get('Sp. Defense', 50),
-        'speed': base_stats.get('Speed', 50)
-    }
-    
-    # Bio
-    bio_en = raw_pokemon.get('description', f'{name_en}, the {raw_pokemon.get("species", "Pokemon")}.')
-    bio_jp = f'{name_jp}。{raw_pokemon.get("species", "ポケモン")}。'
-    
-    # Sprite URL
-    sprite = f'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/{pokemon_id}.png'
-    
-    # Evolution chain - simplified version
-    evolution_chain = [{'name': name_en, 'id': pokemon_id}]
-    if 'evolution' in raw_pokemon:
-        evo_data = raw_pokemon['evolution']
-        if 'next' in evo_data and evo_data['next']:
-            for next_evo in evo_data['next']:
-                if isinstance(next_evo, list) and len(next_evo) > 0:
-                    next_id = int(next_evo[0])
-                    # We'll just add the ID, name will be filled when processing that Pokemon
-                    evolution_chain.append({'name': f'Pokemon{next_id:04d}', 'id': next_id})
-    
-    # Calculate basic weaknesses (simplified - real calculation would use type effectiveness)
-    weaknesses = calculate_weaknesses(types_en)
-    
-    return {
-        'id': pokemon_id,
-        'name_en': name_en,
-        'name_jp': name_jp,
-        'sprite': sprite,
-        'types_en': types_en,
-        'types_jp': types_jp,
-        'stats': stats,
-        'bio_en': bio_en,
-        'bio_jp': bio_jp,
-        'moves': [],  # Will be empty for now, can be fetched from PokeAPI later
-        'evolution_chain': evolution_chain,
-        'weaknesses': weaknesses
-    }
+SOURCES: Tuple[str, ...] = ("existing", "pokeapi", "purukitto")
 
-def calculate_weaknesses(pokemon_types):
-    """Calculate type weaknesses (simplified version)"""
-    # This is a simplified weakness calculator
-    # For a complete implementation, use the TYPE_EFFECTIVENESS from pokeapi_fetch.py
-    weaknesses = {}
-    
-    # Basic type matchups (simplified)
-    type_weaknesses = {
-        'Normal': ['Fighting'],
-        'Fire': ['Water', 'Ground', 'Rock'],
-        'Water': ['Electric', 'Grass'],
-        'Electric': ['Ground'],
-        'Grass': ['Fire', 'Ice', 'Poison', 'Flying', 'Bug'],
-        'Ice': ['Fire', 'Fighting', 'Rock', 'Steel'],
-        'Fighting': ['Flying', 'Psychic', 'Fairy'],
-        'Poison': ['Ground', 'Psychic'],
-        'Ground': ['Water', 'Grass', 'Ice'],
-        'Flying': ['Electric', 'Ice', 'Rock'],
-        'Psychic': ['Bug', 'Ghost', 'Dark'],
-        'Bug': ['Fire', 'Flying', 'Rock'],
-        'Rock': ['Water', 'Grass', 'Fighting', 'Ground', 'Steel'],
-        'Ghost': ['Ghost', 'Dark'],
-        'Dragon': ['Ice', 'Dragon', 'Fairy'],
-        'Dark': ['Fighting', 'Bug', 'Fairy'],
-        'Steel': ['Fire', 'Fighting', 'Ground'],
-        'Fairy': ['Poison', 'Steel']
-    }
-    
-    # Collect all weaknesses
-    all_weaknesses = {}
-    for ptype in pokemon_types:
-        if ptype in type_weaknesses:
-            for weakness in type_weaknesses[ptype]:
-                all_weaknesses[weakness] = all_weaknesses.get(weakness, 0) + 2.0
-    
-    # If same weakness from both types, it's 4x
-    # This is simplified - real calculation is more complex
-    return {k: v for k, v in all_weaknesses.items() if v >= 2.0}
-
-def create_minimal_pokemon(pokemon_id):
-    """Create a minimal Pokemon entry for IDs not in external data"""
-    return {
-        'id': pokemon_id,
-        'name_en': f'Pokemon {pokemon_id}',
-        'name_jp': f'ポケモン{pokemon_id}',
-        'sprite': f'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/{pokemon_id}.png',
-        'types_en': ['Normal'],
-        'types_jp': ['ノーマル'],
-        'stats': {
-            'hp': 50,
-            'attack': 50,
-            'defense': 50,
-            'special-attack': 50,
-            'special-defense': 50,
-            'speed': 50
-        },
-        'bio_en': f'Pokemon #{pokemon_id}. Full data will be available when fetched from PokeAPI.',
-        'bio_jp': f'ポケモン #{pokemon_id}。完全なデータはPokeAPIから取得可能です。',
-        'moves': [],
-        'evolution_chain': [{'name': f'Pokemon {pokemon_id}', 'id': pokemon_id}],
-        'weaknesses': {'Fighting': 2.0}
-    }
+# The existing dataset has been through the whole pipeline; the others fill its gaps
+DEFAULT_SOURCE_ORDER: List[str] = ["existing", "pokeapi", "purukitto"]
+
+# Per-field overrides of DEFAULT_SOURCE_ORDER; a source left out never supplies the field
+FIELD_PRECEDENCE: Dict[str, List[str]] = {
+    # PokeAPI names are slugs ("Mr-mime", "Nidoran-f"); the dump has display names
+    "name_en": ["existing", "purukitto", "pokeapi"],
+}
+
+# Recomputed from the merged types_en instead of being taken from a source
+DERIVED_FIELDS: Tuple[str, ...] = ("weaknesses", "resistances", "immunities")
+
+# Provenance label of derived fields
+DERIVED_SOURCE: str = "derived"
+
+# Fields built from each kind of PokeAPI payload, dropped when that payload is not cached
+PAYLOAD_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "ability": ("abilities",),
+    "move": ("moves",),
+    "evolution-chain": ("evolution_chain",),
+    "type": ("types_jp", "moves"),
+}
+
+# Purukitto base stat names -> dataset stat keys
+PURUKITTO_STATS: Dict[str, str] = {
+    "HP": "hp",
+    "Attack": "attack",
+    "Defense": "defense",
+    "Sp. Attack": "special-attack",
+    "Sp. Defense": "special-defense",
+    "Speed": "speed",
+}
+
+TYPE_NAMES_JP: Dict[str, str] = {
+    'Normal': 'ノーマル', 'Fire': 'ほのお', 'Water': 'みず',
+    'Electric': 'でんき', 'Grass': 'くさ', 'Ice': 'こおり',
+    'Fighting': 'かくとう', 'Poison': 'どく', 'Ground': 'じめん',
+    'Flying': 'ひこう', 'Psychic': 'エスパー', 'Bug': 'むし',
+    'Rock': 'いわ', 'Ghost': 'ゴースト', 'Dragon': 'ドラゴン',
+    'Dark': 'あく', 'Steel': 'はがね', 'Fairy': 'フェアリー'
+}
+
+SPRITE_URL: str = ("https://raw.githubusercontent.com/PokeAPI/sprites/master/"
+                   "sprites/pokemon/{id}.png")
+PURUKITTO_URL: str = ("https://raw.githubusercontent.com/Purukitto/pokemon-data.json/master/"
+                      "pokedex.json")
 
-def main():
-    input_file = '/tmp/pokemon_raw.json'
-    output_file = 'pokedex_data.json'
-    
-    if not os.path.exists(input_file):
-        logger.error(f"Error: {input_file} not found.")
-        logger.info("Please download Pokemon data first using:")
-        logger.info('curl -L -o /tmp/pokemon_raw.json "https://raw.githubusercontent.com/Purukitto/pokemon-data.json/master/pokedex.json"')
-        sys.exit(1)
-    
-    logger.info("Loading external Pokemon data...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
-    
-    logger.info(f"Found {len(raw_data)} Pokemon in external data")
-    
-    # Transform all Pokemon from external source
-    transformed_data = []
-    for raw_pokemon in raw_data:
+# Field order of merged records; fields not listed follow in the order they were joined
+FIELD_ORDER: Tuple[str, ...] = (
+    "id", "name_en", "name_jp", "sprite", "sprites", "types_en", "types_jp", "stats",
+    "bio_en", "bio_jp", "abilities", "height", "weight", "genus_en", "genus_jp",
+    "moves", "evolution_chain", "weaknesses", "resistances", "immunities"
+)
+
+
+def is_placeholder(value: Any) -> bool:
+    """True for values a source emits when it has no data (None, "", "Unknown", empty list/dict)."""
+    if isinstance(value, (list, dict)):
+        return not value
+    return value is None or value in ("", "Unknown")
+
+
+def parse_measure(text: Any) -> Optional[float]:
+    """Parse a Purukitto measurement such as "0.7 m" or "6.9 kg"."""
+    try:
+        return float(str(text).split()[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def transform_pokemon(raw_pokemon: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a Purukitto entry to the dataset fields it actually has.
+
+    Nothing is made up: stats are set only when all six are present, and
+    fields the dump lacks (moves, Japanese bio, evolution methods) are left
+    to the other sources.
+
+    Args:
+        raw_pokemon: One entry of the Purukitto dump
+
+    Returns:
+        Partial Pokemon record with at least `id`
+    """
+    pokemon_id = int(raw_pokemon['id'])
+    record: Dict[str, Any] = {'id': pokemon_id}
+
+    names = raw_pokemon.get('name') or {}
+    if names.get('english'):
+        record['name_en'] = names['english']
+    if names.get('japanese'):
+        record['name_jp'] = names['japanese']
+    record['sprite'] = pokeapi_fetch.convert_sprite_url(SPRITE_URL.format(id=pokemon_id))
+
+    types_en = raw_pokemon.get('type') or []
+    if types_en:
+        record['types_en'] = list(types_en)
+        record['types_jp'] = [TYPE_NAMES_JP.get(type_name, type_name) for type_name in types_en]
+
+    base_stats = raw_pokemon.get('base') or {}
+    if all(name in base_stats for name in PURUKITTO_STATS):
+        record['stats'] = {key: base_stats[name] for name, key in PURUKITTO_STATS.items()}
+
+    if raw_pokemon.get('description'):
+        record['bio_en'] = raw_pokemon['description']
+    if raw_pokemon.get('species'):
+        record['genus_en'] = raw_pokemon['species']
+
+    profile = raw_pokemon.get('profile') or {}
+    for field in ('height', 'weight'):
+        measure = parse_measure(profile.get(field))
+        if measure is not None:
+            record[field] = measure
+    return record
+
+
+def iter_purukitto(path: str) -> Iterable[Dict[str, Any]]:
+    """Stream partial records from the Purukitto dump, skipping malformed entries."""
+    for raw_pokemon in iter_json_array(path):
         try:
-            pokemon = transform_pokemon(raw_pokemon)
-            transformed_data.append(pokemon)
-            if pokemon['id'] % 100 == 0:
-                logger.info(f"Processed Pokemon #{pokemon['id']}: {pokemon['name_en']}")
-        except Exception as e:
-            logger.error(f"Error processing Pokemon ID {raw_pokemon.get('id', '?')}: {e}")
-    
-    # Get the maximum ID we have
-    max_id = max(p['id'] for p in transformed_data)
-    logger.info(f"Maximum Pokemon ID from external data: {max_id}")
-    
-    # Add minimal entries for Pokemon beyond what we have (up to 1025)
-    if max_id < 1025:
-        logger.info(f"Adding minimal entries for Pokemon {max_id + 1} to 1025...")
-        for pokemon_id in range(max_id + 1, 1026):
-            minimal_pokemon = create_minimal_pokemon(pokemon_id)
-            transformed_data.append(minimal_pokemon)
-            if pokemon_id % 100 == 0:
-                logger.info(f"Added minimal entry for Pokemon #{pokemon_id}")
-    
-    # Sort by ID
-    transformed_data.sort(key=lambda p: p['id'])
-    
-    # Save to output file
-    logger.info(f"\nSaving {len(transformed_data)} Pokemon to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(transformed_data, f, ensure_ascii=False, indent=2)
-    
-    logger.info(f"✓ Successfully created {output_file} with {len(transformed_data)} Pokemon")
-    logger.info(f"  - Pokemon 1-{max_id}: Full data from external source")
-    logger.info(f"  - Pokemon {max_id+1}-1025: Minimal data (run pokeapi_fetch.py to complete)")
+            yield transform_pokemon(raw_pokemon)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping Purukitto entry {raw_pokemon.get('id', '?')}: {e!r}")
+
+
+def cached_payload(endpoint: str) -> Optional[Dict[str, Any]]:
+    """Payload from the on-disk PokeAPI cache, never from the network."""
+    if pokeapi_fetch.load_cached_payload(endpoint):
+        return pokeapi_fetch.payload_cache[endpoint]
+    return None
+
+
+def load_pokeapi_record(pokemon_id: int, load: Callable[[str], Optional[Dict[str, Any]]]
+                        ) -> Optional[Dict[str, Any]]:
+    """Assemble one Pokemon from the PokeAPI payloads that `load` returns.
+
+    Fields built from a payload `load` could not supply are dropped, so a
+    partly cached Pokemon only contributes what it has in full. Payloads
+    other than types are evicted afterwards to keep memory flat.
+
+    Args:
+        pokemon_id: National Dex ID
+        load: Endpoint -> payload (cached_payload, or pokeapi_fetch.get_data to fetch)
+
+    Returns:
+        Partial Pokemon record, or None without the pokemon/species payloads
+    """
+    payloads: Dict[str, Any] = {f"type/{type_name}": load(f"type/{type_name}")
+                                for type_name in pokeapi_fetch.TYPE_EFFECTIVENESS}
+    pokemon_main_data = load(f"pokemon/{pokemon_id}")
+    pokemon_species_data = load(f"pokemon-species/{pokemon_id}")
+    payloads[f"pokemon/{pokemon_id}"] = pokemon_main_data
+    payloads[f"pokemon-species/{pokemon_id}"] = pokemon_species_data
+    if pokemon_main_data:
+        for endpoint in pokeapi_fetch.pokemon_dependencies(pokemon_main_data):
+            payloads[endpoint] = load(endpoint)
+    if pokemon_species_data and pokemon_species_data.get("evolution_chain"):
+        endpoint = pokeapi_fetch.to_endpoint(pokemon_species_data["evolution_chain"]["url"])
+        payloads[endpoint] = load(endpoint)
+
+    record = pokeapi_fetch.assemble_pokemon(pokemon_id, payloads)
+    for endpoint, payload in payloads.items():
+        if record is not None and payload is None:
+            for field in PAYLOAD_FIELDS.get(endpoint_kind(endpoint), ()):
+                record.pop(field, None)
+        if not endpoint.startswith("type/"):
+            pokeapi_fetch.payload_cache.pop(endpoint, None)
+    return record
+
+
+def iter_pokeapi_cache(cache_dir: str, pokemon_count: int) -> Iterable[Dict[str, Any]]:
+    """Stream records assembled from every Pokemon in the PokeAPI cache."""
+    pokeapi_fetch.payload_cache_dir = cache_dir
+    pokemon_ids = []
+    for file_name in os.listdir(cache_dir):
+        match = re.fullmatch(r"pokemon_(\d+)\.json", file_name)
+        if match and 1 <= int(match.group(1)) <= pokemon_count:
+            pokemon_ids.append(int(match.group(1)))
+    for pokemon_id in sorted(pokemon_ids):
+        record = load_pokeapi_record(pokemon_id, cached_payload)
+        if record is not None:
+            yield record
+
+
+class Reconciler:
+    """Hash join of partial records by ID with per-field source precedence.
+
+    Records are merged as they arrive, so each source is read once and only
+    the merged records (not every source's copy) are held in memory.
+    """
+
+    def __init__(self, source_order: List[str], field_precedence: Dict[str, List[str]],
+                 pokemon_count: int):
+        self.default_ranks = {source: rank for rank, source in enumerate(source_order)}
+        self.field_ranks = {field: {source: rank for rank, source in enumerate(order)}
+                            for field, order in field_precedence.items()}
+        self.pokemon_count = pokemon_count
+        self.records: Dict[int, Dict[str, Any]] = {}
+        self.provenance: Dict[int, Dict[str, str]] = {}
+        self.source_counts: Dict[str, int] = {}
+
+    def add(self, source: str, partial: Dict[str, Any]) -> bool:
+        """Merge one partial record; returns False if its ID is out of range.
+
+        A real value beats a placeholder regardless of rank; otherwise the
+        better-ranked source wins.
+        """
+        pokemon_id = int(partial["id"])
+        if not 1 <= pokemon_id <= self.pokemon_count:
+            return False
+        record = self.records.setdefault(pokemon_id, {"id": pokemon_id})
+        origins = self.provenance.setdefault(pokemon_id, {})
+        for field, value in partial.items():
+            if field == "id" or field in DERIVED_FIELDS:
+                continue
+            ranks = self.field_ranks.get(field, self.default_ranks)
+            if source not in ranks:
+                continue
+            current = origins.get(field)
+            if current is None or ((is_placeholder(value), ranks[source])
+                                   < (is_placeholder(record[field]), ranks[current])):
+                record[field] = value
+                origins[field] = source
+        return True
+
+    def add_source(self, source: str, records: Iterable[Dict[str, Any]]) -> int:
+        """Merge every record of a source stream.
+
+        Returns:
+            Number of records joined
+        """
+        joined = 0
+        for partial in records:
+            if "id" not in partial:
+                logger.warning(f"Skipping {source} record without an id")
+                continue
+            joined += self.add(source, partial)
+        self.source_counts[source] = self.source_counts.get(source, 0) + joined
+        return joined
+
+    def missing_ids(self) -> List[int]:
+        """IDs in 1..pokemon_count that no source supplied."""
+        return [pokemon_id for pokemon_id in range(1, self.pokemon_count + 1)
+                if pokemon_id not in self.records]
+
+    def merged(self) -> Iterable[Dict[str, Any]]:
+        """Yield merged records in ID order, releasing each once yielded.
+
+        Weaknesses, resistances and immunities are recomputed from the
+        merged types_en with pokeapi_fetch's type chart.
+        """
+        for pokemon_id in sorted(self.records):
+            record = self.records.pop(pokemon_id)
+            if record.get("types_en"):
+                record["weaknesses"] = pokeapi_fetch.calculate_weaknesses(record["types_en"])
+                record["resistances"], record["immunities"] = (
+                    pokeapi_fetch.calculate_resistances(record["types_en"]))
+                for field in DERIVED_FIELDS:
+                    self.provenance[pokemon_id][field] = DERIVED_SOURCE
+            ordered = {field: record[field] for field in FIELD_ORDER if field in record}
+            ordered.update(record)
+            yield ordered
+
+    def provenance_report(self) -> Dict[str, Any]:
+        """Winning source of every field, grouped per Pokemon and summed per source."""
+        pokemon: Dict[str, Dict[str, List[str]]] = {}
+        fields_won: Dict[str, int] = {}
+        for pokemon_id in sorted(self.provenance):
+            by_source: Dict[str, List[str]] = {}
+            for field, source in self.provenance[pokemon_id].items():
+                by_source.setdefault(source, []).append(field)
+                fields_won[source] = fields_won.get(source, 0) + 1
+            pokemon[str(pokemon_id)] = by_source
+        return {
+            "precedence": {
+                "default": list(self.default_ranks),
+                "fields": {field: list(ranks) for field, ranks in self.field_ranks.items()}
+            },
+            "records": self.source_counts,
+            "fields_won": fields_won,
+            "pokemon": pokemon
+        }
+
+
+def parse_precedence(specs: List[str]) -> Dict[str, List[str]]:
+    """Parse FIELD=SOURCE[,SOURCE...] overrides on top of FIELD_PRECEDENCE.
+
+    Raises:
+        ValueError: On malformed specs or unknown source names
+    """
+    precedence = {field: list(order) for field, order in FIELD_PRECEDENCE.items()}
+    for spec in specs:
+        field, separator, sources = spec.partition("=")
+        order = [source.strip() for source in sources.split(",") if source.strip()]
+        if not separator or not field or not order:
+            raise ValueError(f"Expected FIELD=SOURCE[,SOURCE...], got {spec!r}")
+        unknown = sorted(set(order) - set(SOURCES))
+        if unknown:
+            raise ValueError(f"Unknown source(s) {', '.join(unknown)} in {spec!r}; "
+                             f"known: {', '.join(SOURCES)}")
+        precedence[field.strip()] = order
+    return precedence
+
+
+def reconcile(source_paths: Dict[str, str], source_order: List[str],
+              field_precedence: Dict[str, List[str]], output_file: str,
+              pokemon_count: int = pokeapi_fetch.POKEMON_COUNT, fetch_missing: bool = False,
+              provenance_file: Optional[str] = None) -> int:
+    """Join the available sources and write the merged dataset in one pass.
+
+    Args:
+        source_paths: Source name -> file (directory for pokeapi); missing paths are skipped
+        source_order: Default precedence, best first; sources not listed are not read
+        field_precedence: Per-field precedence overrides
+        output_file: Merged dataset path (may be the existing dataset)
+        pokemon_count: Join IDs 1..pokemon_count
+        fetch_missing: Fetch IDs no source has from PokeAPI (only those)
+        provenance_file: Optional provenance report path
+
+    Returns:
+        Exit status (0 on success)
+    """
+    readers = {
+        "existing": lambda path: iter_json_array(path),
+        "pokeapi": lambda path: iter_pokeapi_cache(path, pokemon_count),
+        "purukitto": iter_purukitto,
+    }
+    reconciler = Reconciler(source_order, field_precedence, pokemon_count)
+
+    for source in source_order:
+        path = source_paths.get(source)
+        if not path or not os.path.exists(path):
+            logger.info(f"Skipping {source}: {path or 'no path given'} not found")
+            if source == "purukitto":
+                logger.info(f'Download it with: curl -L -o /tmp/pokemon_raw.json "{PURUKITTO_URL}"')
+            continue
+        with stage(f"join {source}"):
+            joined = reconciler.add_source(source, readers[source](path))
+        logger.info(f"Joined {joined} {source} records from {path}")
+
+    missing = reconciler.missing_ids()
+    if missing and fetch_missing:
+        logger.info(f"Fetching {len(missing)} missing Pokemon from PokeAPI...")
+        if source_paths.get("pokeapi"):
+            os.makedirs(source_paths["pokeapi"], exist_ok=True)
+            pokeapi_fetch.payload_cache_dir = source_paths["pokeapi"]
+        with stage("fetch missing"):
+            for pokemon_id in missing:
+                record = load_pokeapi_record(pokemon_id, pokeapi_fetch.get_data)
+                if record is not None:
+                    reconciler.add("pokeapi", record)
+                    source_counts = reconciler.source_counts
+                    source_counts["pokeapi"] = source_counts.get("pokeapi", 0) + 1
+        missing = reconciler.missing_ids()
+
+    if not reconciler.records:
+        logger.error("❌ No source supplied any Pokemon")
+        return 1
+
+    incomplete: Dict[int, List[str]] = {}
+
+    def checked(records: Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+        for record in records:
+            is_valid, missing_fields = pokeapi_fetch.validate_pokemon_data(record)
+            if not is_valid:
+                incomplete[record["id"]] = missing_fields
+            yield record
+
+    # Write next to the target and swap, since the output may be the dataset being read
+    temporary = f"{output_file}.tmp"
+    with stage("write"):
+        written = write_json_records(temporary, checked(reconciler.merged()))
+        os.replace(temporary, output_file)
+    logger.info(f"✅ Wrote {written} Pokemon to {output_file}")
+
+    report = reconciler.provenance_report()
+    for source, count in sorted(report["fields_won"].items(), key=lambda item: -item[1]):
+        logger.info(f"   {source}: {count} fields")
+    if provenance_file:
+        write_json(provenance_file, report)
+        logger.info(f"   Provenance written to {provenance_file}")
+
+    if missing:
+        shown = ", ".join(str(pokemon_id) for pokemon_id in missing[:20])
+        more = f" (+{len(missing) - 20} more)" if len(missing) > 20 else ""
+        logger.warning(f"⚠️  {len(missing)} IDs missing from every source: {shown}{more}")
+        logger.warning("   Fill them with --fetch-missing (fetches only these IDs)")
+    if incomplete:
+        for pokemon_id, missing_fields in list(incomplete.items())[:10]:
+            logger.warning(f"⚠️  #{pokemon_id} is missing {', '.join(missing_fields)}")
+        if len(incomplete) > 10:
+            logger.warning(f"   ... {len(incomplete) - 10} more incomplete records")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Reconcile Pokemon data sources into pokedex_data.json')
+    parser.add_argument('--raw', default='/tmp/pokemon_raw.json',
+                        help='Purukitto pokedex.json dump')
+    parser.add_argument('--cache-dir', default='.pokeapi_cache',
+                        help='PokeAPI payload cache from pokeapi_fetch.py --cache-dir')
+    parser.add_argument('--existing', default='pokedex_data.json', help='Existing dataset to merge')
+    parser.add_argument('--output', default='pokedex_data.json', help='Output JSON file')
+    parser.add_argument('--source-order', default=','.join(DEFAULT_SOURCE_ORDER),
+                        help='Default source precedence, best first '
+                             f'(default: {",".join(DEFAULT_SOURCE_ORDER)})')
+    parser.add_argument('--prefer', action='append', default=[], metavar='FIELD=SOURCE[,SOURCE...]',
+                        help='Per-field precedence, e.g. bio_en=purukitto,existing (repeatable)')
+    parser.add_argument('--count', type=int, default=pokeapi_fetch.POKEMON_COUNT,
+                        help=f'Join IDs 1..COUNT (default: {pokeapi_fetch.POKEMON_COUNT})')
+    parser.add_argument('--fetch-missing', action='store_true',
+                        help='Fetch IDs that no source has from PokeAPI')
+    parser.add_argument('--provenance',
+                        help='Write the winning source of every field to this JSON file')
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
+    source_order = [source.strip() for source in args.source_order.split(',') if source.strip()]
+    unknown = sorted(set(source_order) - set(SOURCES))
+    if unknown:
+        parser.error(f"Unknown source(s) {', '.join(unknown)}; known: {', '.join(SOURCES)}")
+    try:
+        field_precedence = parse_precedence(args.prefer)
+    except ValueError as e:
+        parser.error(str(e))
+
+    source_paths = {"existing": args.existing, "pokeapi": args.cache_dir, "purukitto": args.raw}
+    with RunProfiler.from_args(args, 'transform_pokemon_data'):
+        return reconcile(source_paths, source_order, field_precedence, args.output, args.count,
+                         args.fetch_missing, args.provenance)
+
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
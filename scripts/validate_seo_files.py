@@ -9,12 +9,15 @@ Checks:
 - Required fields presence
 """
 
+import argparse
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from urllib.parse import urlparse
 import logging
 
+from profiling import RunProfiler, add_profiling_arguments, stage
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -232,12 +235,14 @@ def main():
     
     # Validate robots.txt
     logger.info("")
-    robots_valid = validate_robots_txt('robots.txt')
+    with stage("robots.txt"):
+        robots_valid = validate_robots_txt('robots.txt')
     results.append(('robots.txt', robots_valid))
     
     # Validate sitemap.xml
     logger.info("")
-    sitemap_valid = validate_sitemap_xml('sitemap.xml')
+    with stage("sitemap.xml"):
+        sitemap_valid = validate_sitemap_xml('sitemap.xml')
     results.append(('sitemap.xml', sitemap_valid))
     
     # Summary
@@ -264,4 +269,10 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    parser = argparse.ArgumentParser(description="Validate robots.txt and sitemap.xml")
+    add_profiling_arguments(parser)
+    args = parser.parse_args()
+
+    with RunProfiler.from_args(args, "validate_seo_files"):
+        exit_code = main()
+    sys.exit(exit_code)
@@ -5,6 +5,31 @@
 
 const CACHE_NAME = 'pokedex-v1.1.3';
 const DATA_CACHE_NAME = 'pokedex-data-v1.1.3';
+// Long-lived cache for content-revisioned assets (see precache-manifest.js)
+const PRECACHE_NAME = 'pokedex-precache';
+
+// Content-hashed precache manifest generated by scripts/generate_precache_manifest.py.
+// When it is missing (e.g. local development) the static lists below are used instead.
+try {
+    importScripts('/precache-manifest.js');
+} catch (_error) {
+    self.__PRECACHE_MANIFEST = null;
+}
+const PRECACHE_MANIFEST = self.__PRECACHE_MANIFEST || null;
+
+/**
+ * Maps each precached pathname to its revisioned cache key
+ * @type {Map<string, string>}
+ */
+const PRECACHE_KEYS = new Map(
+    (PRECACHE_MANIFEST ? PRECACHE_MANIFEST.entries : []).map((entry) => [
+        entry.url,
+        `${entry.url}?__rev=${entry.revision}`
+    ])
+);
+
+// Documents stay network-first and are cached alongside runtime assets
+const SHELL_ASSETS = ['/', '/index.html'];
 
 // Cache configuration
 const CACHE_CONFIG = {
@@ -54,6 +79,7 @@ const STATIC_ASSETS = [
     '/assets/js/utils/sorters.js',
     '/assets/js/utils/imageUtils.js',
     '/assets/js/utils/statComparison.js',
+    '/assets/js/utils/spriteAtlas.js',
     '/assets/Poke_Ball_icon.png'
 ];
 
@@ -138,18 +164,71 @@ async function cleanupOldCacheEntries(cacheName, maxAge) {
     }
 }
 
+/**
+ * Returns the path + query used as a precache key for a cached request
+ * @param {Request} request - Cached request
+ * @returns {string} Cache key
+ */
+function toPrecacheKey(request) {
+    const url = new URL(request.url);
+    return url.pathname + url.search;
+}
+
+/**
+ * Fetches only the manifest entries whose revision is not cached yet
+ */
+async function precacheChangedAssets() {
+    const cache = await caches.open(PRECACHE_NAME);
+    const cachedKeys = new Set((await cache.keys()).map(toPrecacheKey));
+
+    await Promise.all(
+        Array.from(PRECACHE_KEYS.entries())
+            .filter(([, cacheKey]) => !cachedKeys.has(cacheKey))
+            .map(async ([url, cacheKey]) => {
+                const response = await fetch(url, { cache: 'reload' });
+                if (!response.ok) {
+                    throw new Error(`Precache failed for ${url}: ${response.status}`);
+                }
+                await cache.put(cacheKey, response);
+            })
+    );
+}
+
+/**
+ * Removes cached revisions that are no longer in the manifest
+ */
+async function deleteStalePrecacheEntries() {
+    const cache = await caches.open(PRECACHE_NAME);
+    const currentKeys = new Set(PRECACHE_KEYS.values());
+    const keys = await cache.keys();
+
+    await Promise.all(
+        keys
+            .filter((request) => !currentKeys.has(toPrecacheKey(request)))
+            .map((request) => cache.delete(request))
+    );
+}
+
 /**
  * Install event - cache static assets
  */
 self.addEventListener('install', (event) => {
     event.waitUntil((async () => {
-        // Cache static assets
-        const staticCache = await caches.open(CACHE_NAME);
-        await staticCache.addAll(STATIC_ASSETS);
-        
-        // Cache data assets
-        const dataCache = await caches.open(DATA_CACHE_NAME);
-        await dataCache.addAll(DATA_ASSETS);
+        if (PRECACHE_MANIFEST) {
+            // Only changed files are downloaded; unchanged revisions stay cached
+            await precacheChangedAssets();
+
+            const shellCache = await caches.open(CACHE_NAME);
+            await shellCache.addAll(SHELL_ASSETS);
+        } else {
+            // Cache static assets
+            const staticCache = await caches.open(CACHE_NAME);
+            await staticCache.addAll(STATIC_ASSETS);
+
+            // Cache data assets
+            const dataCache = await caches.open(DATA_CACHE_NAME);
+            await dataCache.addAll(DATA_ASSETS);
+        }
         
         // Force the waiting service worker to become the active service worker
         await self.skipWaiting();
@@ -167,10 +246,16 @@ self.addEventListener('activate', (event) => {
         await Promise.all(
             cacheNames
                 .filter((cacheName) => {
-                    return cacheName !== CACHE_NAME && cacheName !== DATA_CACHE_NAME;
+                    return cacheName !== CACHE_NAME &&
+                        cacheName !== DATA_CACHE_NAME &&
+                        cacheName !== PRECACHE_NAME;
                 })
                 .map((cacheName) => caches.delete(cacheName))
         );
+
+        if (PRECACHE_MANIFEST) {
+            await deleteStalePrecacheEntries();
+        }
         
         // Clean up old cache entries based on age
         await cleanupOldCacheEntries(CACHE_NAME, CACHE_CONFIG.MAX_IMAGE_AGE);
@@ -195,6 +280,25 @@ self.addEventListener('fetch', (event) => {
         return;
     }
     
+    // Precached, content-revisioned assets (cache first by revision, fallback to network)
+    const precacheKey = PRECACHE_KEYS.get(url.pathname);
+    if (precacheKey && request.method === 'GET' && request.destination !== 'document') {
+        event.respondWith((async () => {
+            const cache = await caches.open(PRECACHE_NAME);
+            const cachedResponse = await cache.match(precacheKey);
+            if (cachedResponse) {
+                return cachedResponse;
+            }
+
+            const response = await fetch(request);
+            if (response.status === 200) {
+                await cache.put(precacheKey, response.clone());
+            }
+            return response;
+        })());
+        return;
+    }
+
     // Handle data requests differently (network first, fallback to cache)
     if (request.url.includes('/pokedex_data.json')) {
         event.respondWith((async () => {